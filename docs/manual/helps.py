@@ -70,6 +70,26 @@ def generate_help_files():
         )
         write_output(file, output.stdout)
 
+    with open(output_path / "serve.rst", "w") as file:
+        file.write(".. code-block:: console\n\n")
+        output = subprocess.run(
+            ["dycov", "serve", "--help"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        write_output(file, output.stdout)
+
+    with open(output_path / "submit.rst", "w") as file:
+        file.write(".. code-block:: console\n\n")
+        output = subprocess.run(
+            ["dycov", "submit", "--help"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        write_output(file, output.stdout)
+
 
 if __name__ == "__main__":
     sys.exit(generate_help_files())
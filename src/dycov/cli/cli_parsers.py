@@ -44,6 +44,7 @@ def setup_cli_parsers() -> argparse.ArgumentParser:
     )
     _add_debug_argument(main_parser)
     _add_diagnostic_argument(main_parser)
+    _add_profile_argument(main_parser)
     _add_user_config_argument(main_parser)
 
     # Set up subparsers for different commands
@@ -54,6 +55,8 @@ def setup_cli_parsers() -> argparse.ArgumentParser:
     _add_performance_subparser(subparsers)
     _add_generate_subparser(subparsers)
     _add_anonymize_subparser(subparsers)
+    _add_serve_subparser(subparsers)
+    _add_submit_subparser(subparsers)
 
     return main_parser
 
@@ -150,6 +153,27 @@ def _add_diagnostic_argument(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the '--profile' argument to the parser.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        The parser to which the argument will be added.
+    """
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="dycov_trace.json",
+        default=None,
+        metavar="TRACE_FILE",
+        help=(
+            "Time the main processing stages, writing a Chrome trace to TRACE_FILE "
+            "(dycov_trace.json by default) and logging a summary table."
+        ),
+    )
+
+
 def _add_debug_argument(parser: argparse.ArgumentParser) -> None:
     """Adds the '--debug' argument to the given parser.
 
@@ -579,6 +603,88 @@ def _add_compression_argument(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_sweep_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the '--sweep' argument to the given parser.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        The parser to which the argument will be added.
+    """
+    _add_argument(
+        parser,
+        "-sw",
+        "--sweep",
+        arg_type=Path,
+        help_msg="CSV file (';' or ',' separated) with D, H and/or Xeff columns, one parameter"
+        " set per row. Instead of the usual outputs, the envelopes of all the sets are written"
+        " to a single compressed NumPy file per operating condition. Missing columns take the"
+        " values of the producer INI file.",
+    )
+
+
+def _add_formats_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the '--formats' and '--no-plots' arguments to the given parser.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        The parser to which the arguments will be added.
+    """
+    _add_argument(
+        parser,
+        "-fmt",
+        "--formats",
+        choices=["csv", "png", "html"],
+        nargs="+",
+        help_msg="Output files to write for each operating condition (default: csv png html).",
+    )
+    _add_argument(
+        parser,
+        "-np",
+        "--no-plots",
+        action="store_true",
+        help_msg="Skip the rendering of the PNG and HTML figures, writing only the CSV files"
+        " (same as '--formats csv'). Useful for batch studies.",
+    )
+
+
+def _add_incremental_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the '--incremental' argument to the given parser.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        The parser to which the argument will be added.
+    """
+    _add_argument(
+        parser,
+        "-inc",
+        "--incremental",
+        action="store_true",
+        help_msg="Update the results of a previous run in the output directory, generating"
+        " again only the operating conditions whose parameters changed.",
+    )
+
+
+def _add_socket_argument(parser: argparse.ArgumentParser) -> None:
+    """Adds the '--socket' argument to the given parser.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        The parser to which the argument will be added.
+    """
+    _add_argument(
+        parser,
+        "-s",
+        "--socket",
+        arg_type=str,
+        help_msg="Unix socket of the daemon, or HOST:PORT to use TCP (default: dycov.sock"
+        " in the configuration directory).",
+    )
+
+
 def _add_generate_envelopes_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Adds the 'generateEnvelopes' subparser to the given subparsers action.
 
@@ -596,6 +702,9 @@ def _add_generate_envelopes_subparser(subparsers: argparse._SubParsersAction) ->
     _add_output_argument(envelops)
     _add_pcs_argument(envelops)
     _add_only_dtr_argument(envelops)
+    _add_sweep_argument(envelops)
+    _add_formats_argument(envelops)
+    _add_incremental_argument(envelops)
     dycov_logging.get_logger("CliParsers").debug("Added 'generateEnvelopes' subparser.")
 
 
@@ -705,3 +814,49 @@ def _add_anonymize_subparser(subparsers: argparse._SubParsersAction) -> None:
     _add_results_argument(anonymize)
     _add_compression_argument(anonymize)
     dycov_logging.get_logger("CliParsers").debug("Added 'anonymize' subparser.")
+
+
+def _add_serve_subparser(subparsers: argparse._SubParsersAction) -> None:
+    """Adds the 'serve' subparser to the given subparsers action.
+
+    Parameters
+    ----------
+    subparsers: argparse._SubParsersAction
+        The subparsers action to which the 'serve' subparser will be added.
+    """
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a daemon that keeps the tool loaded and runs the commands sent with"
+        " 'dycov submit'.",
+    )
+    _add_socket_argument(serve)
+    dycov_logging.get_logger("CliParsers").debug("Added 'serve' subparser.")
+
+
+def _add_submit_subparser(subparsers: argparse._SubParsersAction) -> None:
+    """Adds the 'submit' subparser to the given subparsers action.
+
+    Parameters
+    ----------
+    subparsers: argparse._SubParsersAction
+        The subparsers action to which the 'submit' subparser will be added.
+    """
+    submit = subparsers.add_parser(
+        "submit",
+        help="Run a command on the daemon started with 'dycov serve' and show its output.",
+    )
+    _add_socket_argument(submit)
+    _add_argument(
+        submit,
+        "--stop",
+        action="store_true",
+        help_msg="Stop the daemon instead of running a command.",
+    )
+    _add_argument(
+        submit,
+        "job",
+        nargs=argparse.REMAINDER,
+        help_msg="The dycov command to run, with its arguments"
+        " (e.g., 'validate -m Model Reference').",
+    )
+    dycov_logging.get_logger("CliParsers").debug("Added 'submit' subparser.")
@@ -15,14 +15,10 @@ from typing import Optional
 
 from dycov.configuration.cfg import config
 from dycov.core.global_variables import ELECTRIC_PERFORMANCE, MODEL_VALIDATION
-from dycov.core.input_template import InputTemplateGenerator
-from dycov.curves import anonymizer
-from dycov.curves.dynawo.tooling import prepare_tool
-from dycov.gfm.generator import GFMGeneration
-from dycov.gfm.parameters import GFMParameters
 from dycov.logging import dycov_logging
-from dycov.validate.parameters import ValidationParameters
-from dycov.validate.validation import Validation
+
+# The modules that implement each command (and their numerical and plotting
+# dependencies) are imported by the handlers, so that a command only loads what it uses.
 
 
 def handle_generate_envelopes_command(
@@ -61,6 +57,9 @@ def handle_generate_envelopes_command(
         emt=emt,
         user_pcs=args.pcs,
         only_dtr=args.only_dtr,
+        sweep=args.sweep,
+        output_formats=_get_output_formats(args),
+        incremental=args.incremental,
     )
 
     if result_code == -1:
@@ -211,6 +210,8 @@ def handle_generate_command(
     dwo_launcher: Path
         Path to the Dynawo launcher.
     """
+    from dycov.core.input_template import InputTemplateGenerator
+
     dycov_logging.get_logger("CommandHandlers").info("Handling 'generate' command.")
     try:
         # Generate input templates
@@ -248,6 +249,8 @@ def handle_compile_command(
     dwo_launcher: Path
         Path to the Dynawo launcher.
     """
+    from dycov.curves.dynawo.tooling import prepare_tool
+
     dycov_logging.get_logger("CommandHandlers").info("Handling 'compile' command.")
     model_name: Optional[str] = args.dynamic_model if args.dynamic_model else None
     force_recompile: bool = args.force
@@ -282,6 +285,8 @@ def handle_anonymize_command(parser: argparse.ArgumentParser, args: argparse.Nam
     args: argparse.Namespace
         Parsed command-line arguments.
     """
+    from dycov.curves import anonymizer
+
     dycov_logging.get_logger("CommandHandlers").info("Handling 'anonymize' command.")
     try:
         anonymizer.anonymize(
@@ -304,6 +309,24 @@ def handle_anonymize_command(parser: argparse.ArgumentParser, args: argparse.Nam
     return result_code
 
 
+def handle_serve_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Handles the 'serve' command.
+
+    Runs the daemon that executes the commands sent with 'dycov submit'.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        The argument parser instance.
+    args: argparse.Namespace
+        Parsed command-line arguments.
+    """
+    from dycov.cli import server
+
+    dycov_logging.get_logger("CommandHandlers").info("Handling 'serve' command.")
+    return server.serve(args.socket or server.default_address())
+
+
 def _run_verification(
     dwo_launcher: Path,
     output_dir: Path,
@@ -346,6 +369,9 @@ def _run_verification(
     int
         Result code of the verification (0 for success, non-zero for failure).
     """
+    from dycov.validate.parameters import ValidationParameters
+    from dycov.validate.validation import Validation
+
     dycov_logging.get_logger("CommandHandlers").info(
         f"Running verification of type: {verification_type}"
     )
@@ -423,13 +449,38 @@ def _run_verification(
     return 1
 
 
+def _get_output_formats(args: argparse.Namespace) -> Optional[tuple[str, ...]]:
+    """Returns the output formats requested by the '--formats' and '--no-plots' arguments.
+
+    Parameters
+    ----------
+    args: argparse.Namespace
+        Parsed command-line arguments.
+
+    Returns
+    -------
+    Optional[tuple[str, ...]]
+        The requested formats, or None to write all of them.
+    """
+    formats = args.formats
+    if args.no_plots:
+        formats = [name for name in (formats or ["csv"]) if name not in ("png", "html")]
+    return tuple(dict.fromkeys(formats)) if formats is not None else None
+
+
 def _generate_envelopes(
     output_dir: Path,
     producer_ini: Path,
     emt: bool,
     user_pcs: bool,
     only_dtr: bool,
+    sweep: Optional[Path] = None,
+    output_formats: Optional[tuple[str, ...]] = None,
+    incremental: bool = False,
 ):
+    from dycov.gfm.generator import GFMGeneration
+    from dycov.gfm.parameters import GFMParameters
+
     dycov_logging.get_logger("CommandHandlers").info("Running generation of envelopes")
     try:
         params = GFMParameters(
@@ -438,6 +489,8 @@ def _generate_envelopes(
             output_dir=output_dir,
             only_dtr=only_dtr,
             emt=emt,
+            sweep=sweep,
+            output_formats=output_formats,
         )
 
         # Determine if the parameters are valid.
@@ -447,7 +500,7 @@ def _generate_envelopes(
         use_parallel = config.get_boolean("Global", "parallel_pcs_validation", True)
         num_processes = config.get_int("Global", "parallel_num_processes", 4)
 
-        gfm = GFMGeneration(params)
+        gfm = GFMGeneration(params, incremental=incremental)
         start_time = time.time()
         gfm.generate(use_parallel=use_parallel, num_processes=num_processes)
         end_time = time.time()
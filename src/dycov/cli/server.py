@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Daemon that runs the dycov commands submitted by clients over a local socket.
+
+`serve()` (``dycov serve``) starts after the usual initialization of the tool and then
+runs, one at a time and in its own process, the jobs sent by `submit()`
+(``dycov submit``). The imports, the configuration, the Dynawo dictionaries, the
+parsed PCS alias files and the worker pool stay loaded between jobs, so a job only
+pays for its own work. Each job runs in the working directory of its client, with the
+configuration restored to its state when the daemon started, and everything it
+prints and logs to the console is streamed back to the client, followed by its exit
+code. The worker processes keep logging to the console of the daemon.
+
+Messages are JSON objects, one per line. The client sends a job,
+``{"argv": [...], "cwd": "..."}``, or ``{"stop": true}`` to stop the daemon; the
+daemon answers with ``{"out": "...", "stream": "stdout" | "stderr"}`` messages and a
+final ``{"exit": code}``.
+
+Only the user who started the daemon can use it. The Unix socket is created readable
+and writable by its owner only. A TCP port can be reached by any local user, so the
+daemon then writes a random token to a file of the configuration directory that only
+its owner can read, and the requests must carry it as ``"token"``.
+"""
+
+from __future__ import annotations
+
+import hmac
+import io
+import json
+import os
+import re
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Optional
+
+from dycov.configuration.cfg import config
+from dycov.core.initialization import DycovInitializer
+from dycov.logging import dycov_logging
+
+# Commands that can be submitted: the rest are interactive or manage the daemon
+JOB_COMMANDS = ("validate", "performance", "generateEnvelopes", "anonymize")
+
+_SOCKET_NAME = "dycov.sock"
+# Token required by a daemon listening on TCP
+_TOKEN_NAME = "dycov_serve.token"
+# Used where Unix sockets are not available
+_DEFAULT_TCP_ADDRESS = "127.0.0.1:8765"
+_TCP_ADDRESS = re.compile(r"^([\w.-]+):(\d+)$")
+
+
+def default_address() -> str:
+    """Returns the address of the daemon when none is given: a Unix socket in the
+    configuration directory, or a localhost TCP port where Unix sockets are not
+    available.
+
+    Returns
+    -------
+    str
+        Socket path, or HOST:PORT.
+    """
+    if hasattr(socket, "AF_UNIX"):
+        return str(config.get_config_dir() / _SOCKET_NAME)
+    return _DEFAULT_TCP_ADDRESS
+
+
+def _parse_address(address: str) -> tuple:
+    match = _TCP_ADDRESS.match(address)
+    if match:
+        return socket.AF_INET, (match.group(1), int(match.group(2)))
+    return socket.AF_UNIX, address
+
+
+def _token_path() -> Path:
+    return config.get_config_dir() / _TOKEN_NAME
+
+
+def _write_token() -> str:
+    """Writes a new random token to a file that only the current user can read.
+
+    Returns
+    -------
+    str
+        The token.
+    """
+    token = secrets.token_hex(32)
+    path = _token_path()
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="ascii") as file:
+        file.write(token)
+    return token
+
+
+class _Channel:
+    """Sends messages to the client of a job. Once the client is gone, or when used
+    from a forked worker process, the output goes to the console of the daemon."""
+
+    def __init__(self, wfile):
+        self._wfile = wfile
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def send(self, **message) -> bool:
+        if self.closed or os.getpid() != self._pid:
+            return False
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                self._wfile.write(data)
+                self._wfile.flush()
+            except OSError:
+                self.closed = True
+                return False
+        return True
+
+
+class _ChannelWriter(io.TextIOBase):
+    """Text stream that forwards what is written to one of the streams of the client."""
+
+    def __init__(self, channel: _Channel, stream: str, fallback):
+        self._channel = channel
+        self._stream = stream
+        self._fallback = fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text and not self._channel.send(out=text, stream=self._stream):
+            self._fallback.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        self._fallback.flush()
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        channel = _Channel(self.wfile)
+        line = self.rfile.readline()
+        if not line:
+            # A client checking whether the daemon is running
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            channel.send(out="dycov serve: malformed request\n", stream="stderr")
+            channel.send(exit=2)
+            return
+
+        token = self.server.token
+        if token is not None and not hmac.compare_digest(
+            str(request.get("token", "")).encode(), token.encode()
+        ):
+            channel.send(out="dycov serve: invalid token\n", stream="stderr")
+            channel.send(exit=2)
+            return
+
+        if request.get("stop"):
+            self.server.stop_requested = True
+            channel.send(exit=0)
+            return
+
+        code = self.server.jobs.run_job(request.get("argv", []), request.get("cwd"), channel)
+        channel.send(exit=code)
+        channel.closed = True
+
+
+class _JobInitializer(DycovInitializer):
+    """Initializes a job: the templates and the environment were already set up when
+    the daemon started, so only the logger and the user configuration are loaded."""
+
+    def init(self, user_config_path: Optional[Path], launcher_dwo: Path, debug: bool) -> None:
+        self._initialize_logger(debug)
+        if user_config_path:
+            config.load_user_config(user_config_path)
+
+
+class _Daemon:
+    """Runs the submitted jobs with the CLI of the daemon process."""
+
+    def __init__(self):
+        from dycov.launchers import DycovCLI
+
+        self._cli = DycovCLI()
+        self._cli.initializer = _JobInitializer()
+        self._config = config.snapshot()
+        self._logger = dycov_logging.get_logger("Server")
+
+    def run_job(self, argv: list, cwd: Optional[str], channel: _Channel) -> int:
+        """Runs a dycov command line as the CLI would, streaming its output.
+
+        Parameters
+        ----------
+        argv: list
+            Arguments of the command, without the program name.
+        cwd: str, optional
+            Working directory of the client.
+        channel: _Channel
+            Connection to the client.
+
+        Returns
+        -------
+        int
+            Exit code of the command.
+        """
+        from dycov.cli.cli_parsers import setup_cli_parsers
+        from dycov.logging import profiling
+
+        self._logger.info(f"Running job: dycov {' '.join(argv)}")
+        daemon_dir = os.getcwd()
+        stdout = _ChannelWriter(channel, "stdout", sys.__stdout__)
+        stderr = _ChannelWriter(channel, "stderr", sys.__stderr__)
+        try:
+            # The console handler created by the job initialization writes to stderr
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                parser = setup_cli_parsers()
+                args = parser.parse_args(argv)
+                if args.command not in JOB_COMMANDS:
+                    print(
+                        f"dycov serve: '{args.command}' cannot be submitted, use one of: "
+                        f"{', '.join(JOB_COMMANDS)}",
+                        file=sys.stderr,
+                    )
+                    return 2
+                if cwd:
+                    os.chdir(cwd)
+                code = self._cli._execute_command(parser, args)
+            return 0 if code is None else code
+        except SystemExit as e:
+            # argparse errors and --help
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            return 1
+        except Exception:
+            self._logger.exception("Job failed")
+            return 1
+        finally:
+            if profiling.is_enabled():
+                profiling.disable()
+            config.restore(self._config)
+            os.chdir(daemon_dir)
+            self._logger.info("Job finished")
+
+
+def _is_running(address: str) -> bool:
+    family, target = _parse_address(address)
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(target)
+        except OSError:
+            return False
+    return True
+
+
+def serve(address: str) -> int:
+    """Runs the daemon until it is interrupted or a client asks it to stop.
+
+    Parameters
+    ----------
+    address: str
+        Unix socket path, or HOST:PORT to listen on TCP.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    from dycov.core import worker_pool
+
+    logger = dycov_logging.get_logger("Server")
+    family, target = _parse_address(address)
+    if _is_running(address):
+        logger.error(f"A dycov daemon is already listening on {address}")
+        return 1
+    if family == socket.AF_INET:
+        server = socketserver.TCPServer(target, _JobHandler)
+    else:
+        # Remove the socket left by a daemon that did not stop cleanly
+        Path(target).unlink(missing_ok=True)
+        # Create the socket with owner-only permissions from the start, so that no
+        # other user can connect to it
+        umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(target, _JobHandler)
+        finally:
+            os.umask(umask)
+
+    with server:
+        server.token = _write_token() if family == socket.AF_INET else None
+        worker_pool.keep_alive()
+        server.jobs = _Daemon()
+        server.stop_requested = False
+        logger.info(f"Listening on {address}")
+        try:
+            while not server.stop_requested:
+                server.handle_request()
+        except KeyboardInterrupt:
+            logger.info("Interrupted by user")
+        finally:
+            worker_pool.keep_alive(False)
+            if family == socket.AF_INET:
+                _token_path().unlink(missing_ok=True)
+            else:
+                Path(target).unlink(missing_ok=True)
+    logger.info("Daemon stopped")
+    return 0
+
+
+def submit(address: str, argv: list, stop: bool = False) -> int:
+    """Sends a job to the daemon and prints its output as it arrives.
+
+    Parameters
+    ----------
+    address: str
+        Unix socket path, or HOST:PORT, of the daemon.
+    argv: list
+        Arguments of the dycov command to run, without the program name. Relative
+        paths are resolved from the current directory.
+    stop: bool, optional
+        Ask the daemon to stop instead of running a job.
+
+    Returns
+    -------
+    int
+        Exit code of the job.
+    """
+    family, target = _parse_address(address)
+    if argv and argv[0] == "--":
+        argv = argv[1:]
+    request = {"stop": True} if stop else {"argv": argv, "cwd": os.getcwd()}
+    if family == socket.AF_INET:
+        try:
+            request["token"] = _token_path().read_text(encoding="ascii")
+        except OSError as e:
+            print(f"dycov submit: cannot read the token of the daemon: {e}", file=sys.stderr)
+            return 1
+
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(target)
+        except OSError as e:
+            print(f"dycov submit: cannot connect to the daemon at {address}: {e}", file=sys.stderr)
+            return 1
+        with sock.makefile("rwb") as stream:
+            stream.write((json.dumps(request) + "\n").encode("utf-8"))
+            stream.flush()
+            for line in stream:
+                message = json.loads(line)
+                if "exit" in message:
+                    return message["exit"]
+                output = sys.stdout if message.get("stream") == "stdout" else sys.stderr
+                output.write(message.get("out", ""))
+                output.flush()
+
+    print("dycov submit: the daemon closed the connection", file=sys.stderr)
+    return 1
@@ -10,12 +10,72 @@
 
 import configparser
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from dycov.logging import dycov_logging
 
+_MISSING = object()
+
+# Directories and alias files found under each directory, and the parsed alias
+# configuration of each directory with the (path, mtime) signature it was read from.
+# Shared by the whole process, so that loading many PCS only parses the alias files once.
+_ALIAS_FILES_CACHE: dict = {}
+_ALIAS_CONFIG_CACHE: dict = {}
+
+
+def _mtime_ns(file: str) -> Optional[int]:
+    try:
+        return os.stat(file).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _alias_signature(aliases_root: Path) -> tuple:
+    """Returns the (path, mtime) signature of the alias files under aliases_root. The
+    directory is searched again when one of its subdirectories has been modified, since
+    adding, removing or renaming an entry changes the mtime of its parent directory."""
+    cached = _ALIAS_FILES_CACHE.get(aliases_root)
+    if cached is not None and all(_mtime_ns(path) == mtime for path, mtime in cached[0]):
+        return tuple((file, _mtime_ns(file)) for file in cached[1])
+
+    directories = [(str(aliases_root), _mtime_ns(str(aliases_root)))]
+    files = []
+    for path in aliases_root.rglob("*"):
+        if path.is_dir():
+            directories.append((str(path), _mtime_ns(str(path))))
+        elif "aliases" in path.name and path.is_file():
+            files.append(str(path))
+    _ALIAS_FILES_CACHE[aliases_root] = (tuple(directories), files)
+    return tuple((file, _mtime_ns(file)) for file in files)
+
+
+def _get_aliases_config(aliases_root: Path) -> configparser.ConfigParser:
+    """Returns the parser with every alias file under aliases_root. It is parsed again
+    only when one of the files has changed; the returned parser must not be modified.
+
+    Parameters
+    ----------
+    aliases_root: Path
+        Directory searched recursively for "*aliases*" files.
+
+    Returns
+    -------
+    configparser.ConfigParser
+        Parser with the content of all the alias files.
+    """
+    signature = _alias_signature(aliases_root)
+    cached = _ALIAS_CONFIG_CACHE.get(aliases_root)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    aliases_config = configparser.ConfigParser()
+    aliases_config.optionxform = str
+    aliases_config.read([file for file, _ in signature], encoding="utf-8")
+    _ALIAS_CONFIG_CACHE[aliases_root] = (signature, aliases_config)
+    return aliases_config
+
 
 @dataclass(frozen=True)
 class Config:
@@ -42,6 +102,14 @@ class Config:
     _default_config: configparser.ConfigParser
     _user_config: configparser.ConfigParser
     _pcs_config: configparser.ConfigParser
+    # Memoized lookups, cleared whenever a configuration source changes
+    _resolved: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _typed: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _invalidate(self) -> None:
+        """Internal helper to discard the memoized lookups after a source changes."""
+        self._resolved.clear()
+        self._typed.clear()
 
     def _is_valid_value(self, value: str) -> bool:
         """Internal helper to validate if a string value is not None or empty.
@@ -66,6 +134,28 @@ class Config:
           2. Performance Checking Sheet (PCS) config
           3. Default config
 
+        Parameters
+        ----------
+        section: str
+            Section header.
+        key: str
+            Key within the section.
+
+        Returns
+        -------
+        Optional[str]
+            The string value if it exists, None otherwise.
+        """
+        value = self._resolved.get((section, key), _MISSING)
+        if value is _MISSING:
+            value = self._resolve_config_value(section, key)
+            self._resolved[(section, key)] = value
+        return value
+
+    def _resolve_config_value(self, section: str, key: str) -> Optional[str]:
+        """Looks up a configuration value in the user, PCS and default sources, in
+        that order, without memoization.
+
         Parameters
         ----------
         section: str
@@ -114,6 +204,8 @@ class Config:
                 "Error loading user configuration from %s: %s", user_config_path, e
             )
             raise
+        finally:
+            self._invalidate()
 
     def load_pcs_config(self, pcs_path: str) -> None:
         """Load the Performance Checking Sheet (PCS) configuration file. It
@@ -137,11 +229,7 @@ class Config:
             single_pcs_config.read(pcs_path, encoding="utf-8")
 
             pcs_aliases_path = Path(pcs_path).resolve().parent.parent
-            aliases_files = [str(p) for p in pcs_aliases_path.rglob("*aliases*") if p.is_file()]
-
-            aliases_config = configparser.ConfigParser()
-            aliases_config.optionxform = str
-            aliases_config.read(aliases_files, encoding="utf-8")
+            aliases_config = _get_aliases_config(pcs_aliases_path)
 
             for section_to_modify in list(self._pcs_config.sections()):
                 if self._pcs_config.has_option(section_to_modify, "inherit"):
@@ -167,6 +255,8 @@ class Config:
                 "Error loading PCS configuration from %s: %s", pcs_path, e
             )
             raise
+        finally:
+            self._invalidate()
 
     def get_config_dir(self) -> Path:
         """Returns the configuration directory path.
@@ -178,6 +268,36 @@ class Config:
         """
         return self._config_dir
 
+    def snapshot(self) -> tuple:
+        """Returns a copy of the values of every configuration source, to be restored
+        later with restore().
+
+        Returns
+        -------
+        tuple
+            Raw values of the default, user and PCS configurations, by section.
+        """
+        return tuple(
+            {section: dict(parser.items(section, raw=True)) for section in parser.sections()}
+            for parser in (self._default_config, self._user_config, self._pcs_config)
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """Discards any change made to the configuration sources since snapshot() was
+        called, including loaded user and PCS files and values set at runtime.
+
+        Parameters
+        ----------
+        snapshot: tuple
+            Values returned by snapshot().
+        """
+        for parser, sections in zip(
+            (self._default_config, self._user_config, self._pcs_config), snapshot
+        ):
+            parser.clear()
+            parser.read_dict(sections)
+        self._invalidate()
+
     def has_option(self, section: str, key: str) -> bool:
         """Check if config contains the specified key within any configuration source.
 
@@ -261,6 +381,7 @@ class Config:
 
         # Log old -> new y escribir
         target_parser.set(section, key, value)
+        self._invalidate()
 
     def get_value(self, section: str, key: str, default: str = None) -> str:
         """Gets a configuration value for a given key and section.
@@ -301,11 +422,15 @@ class Config:
         int
             The integer value if it exists, otherwise the default value.
         """
+        cached = self._typed.get((section, key, int), _MISSING)
+        if cached is not _MISSING:
+            return cached
         value = self._get_config_value(section, key)
         if value is None:
             return default
         try:
-            return int(value)
+            self._typed[(section, key, int)] = int(value)
+            return self._typed[(section, key, int)]
         except (ValueError, TypeError):
             dycov_logging.get_logger("Cfg").error(
                 f"Could not convert value '{value}' to integer for "
@@ -330,11 +455,15 @@ class Config:
         float
             The float value if it exists, otherwise the default value.
         """
+        cached = self._typed.get((section, key, float), _MISSING)
+        if cached is not _MISSING:
+            return cached
         value = self._get_config_value(section, key)
         if value is None:
             return default
         try:
-            return float(value)
+            self._typed[(section, key, float)] = float(value)
+            return self._typed[(section, key, float)]
         except (ValueError, TypeError):
             dycov_logging.get_logger("Cfg").error(
                 f"Could not convert value '{value}' to float for "
@@ -359,10 +488,14 @@ class Config:
         bool
             The boolean value if it exists, otherwise the default value.
         """
+        cached = self._typed.get((section, key, bool), _MISSING)
+        if cached is not _MISSING:
+            return cached
         value = self._get_config_value(section, key)
         if value is None:
             return default
-        return value.lower() == "true"
+        self._typed[(section, key, bool)] = value.lower() == "true"
+        return self._typed[(section, key, bool)]
 
     def get_list(self, section: str, key: str) -> list:
         """Gets a list of string values for a given key and section.
@@ -112,6 +112,7 @@ def dump_effective_config(config) -> None:
     for sec, key in [
         ("Global", "parallel_num_processes"),
         ("Global", "parallel_pcs_validation"),
+        ("Global", "parallel_memory_budget_mb"),
         ("Debug", "max_simulation_retries"),
         ("Dynawo", "solver_lib"),
     ]:
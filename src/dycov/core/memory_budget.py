@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Memory-aware scheduling of tasks on a multiprocessing pool.
+
+Instead of keeping every worker of the pool busy, `map_with_budget` only starts a
+new task while the memory expected for the running tasks fits in a budget. The
+memory of a task is estimated as the largest peak RSS measured so far in the
+workers and the simulations they run (starting from a configured estimate), so a run
+that processes large plants lowers its concurrency as soon as the first of them
+finishes.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from multiprocessing.pool import Pool
+from typing import Callable, Optional
+
+from dycov.logging import dycov_logging, profiling
+
+# Seconds between checks of the running tasks
+_POLL_INTERVAL = 0.05
+
+
+def _run_measured(func_task: tuple) -> tuple:
+    """Runs func(task) in a worker and returns its result with the peak RSS (MB) of the
+    worker while running it, plus the peak RSS of the child processes it ran."""
+    func, task = func_task
+    children_before = profiling.children_usage()
+    profiling.reset_peak_rss()
+    result = func(task)
+    peak_mb = profiling.peak_rss_mb()
+    children_after = profiling.children_usage()
+    if (
+        peak_mb is not None
+        and children_after is not None
+        and children_after[1] > children_before[1]
+    ):
+        # Only the largest peak of all the children of the worker is known: it is the
+        # peak of the children of this task when they raised it, and a bound otherwise
+        peak_mb += children_after[0]
+    return result, peak_mb
+
+
+def max_concurrency(budget_mb: float, task_mb: float, num_processes: int) -> int:
+    """Returns the number of tasks that can run at the same time within the budget.
+
+    Parameters
+    ----------
+    budget_mb : float
+        Memory available for all the workers, in MB.
+    task_mb : float
+        Expected peak memory of a task, in MB.
+    num_processes : int
+        Number of workers of the pool.
+
+    Returns
+    -------
+    int
+        Between 1 (a task always runs, even if it does not fit) and num_processes.
+    """
+    if task_mb <= 0:
+        return num_processes
+    return max(1, min(num_processes, int(budget_mb // task_mb)))
+
+
+def map_with_budget(
+    pool: Pool,
+    func: Callable,
+    tasks: list,
+    num_processes: int,
+    budget_mb: float,
+    task_mb: float,
+    label: Optional[Callable] = None,
+) -> list:
+    """Applies func to every task on the pool, like `Pool.map`, capping the tasks
+    that run at the same time to those that fit in budget_mb.
+
+    Parameters
+    ----------
+    pool : Pool
+        Pool whose workers run the tasks.
+    func : Callable
+        Picklable function applied to each task.
+    tasks : list
+        Task arguments.
+    num_processes : int
+        Number of workers of the pool.
+    budget_mb : float
+        Memory available for all the workers, in MB.
+    task_mb : float
+        Initial estimate of the peak memory of a task, in MB; it is raised to the
+        largest peak measured.
+    label : Callable, optional
+        Returns the name of a task for the log.
+
+    Returns
+    -------
+    list
+        Results in the order of tasks.
+    """
+    logger = dycov_logging.get_logger("MemoryBudget")
+    results = [None] * len(tasks)
+    pending = deque(enumerate(tasks))
+    running = {}
+    concurrency = max_concurrency(budget_mb, task_mb, num_processes)
+    logger.info(
+        f"Memory budget {budget_mb:.0f} MB, {task_mb:.0f} MB per task: "
+        f"running up to {concurrency} tasks at a time."
+    )
+
+    while pending or running:
+        while pending and len(running) < concurrency:
+            index, task = pending.popleft()
+            running[index] = pool.apply_async(_run_measured, ((func, task),))
+
+        finished = [index for index, result in running.items() if result.ready()]
+        if not finished:
+            time.sleep(_POLL_INTERVAL)
+            continue
+
+        for index in finished:
+            results[index], peak_mb = running.pop(index).get()
+            if peak_mb is None:
+                continue
+            name = label(tasks[index]) if label else str(index)
+            logger.info(f"{name}: peak RSS {peak_mb:.0f} MB")
+            if peak_mb > task_mb:
+                task_mb = peak_mb
+                new_concurrency = max_concurrency(budget_mb, task_mb, num_processes)
+                if new_concurrency != concurrency:
+                    concurrency = new_concurrency
+                    logger.info(
+                        f"Measured {task_mb:.0f} MB per task: "
+                        f"running up to {concurrency} tasks at a time."
+                    )
+
+    return results
@@ -50,6 +50,38 @@ def _purge_stale_temp_dirs(
         pass
 
 
+def _select_base_dir() -> Path:
+    """Returns the directory where the temporary working directory is created.
+
+    When a scratch path is configured (for example a RAM-backed /dev/shm), it is used
+    as long as it exists and has at least `scratch_min_free_mb` of free space;
+    otherwise the current working directory is used, as when no scratch path is set.
+    """
+    scratch_path = config.get_value("Global", "scratch_path")
+    if not scratch_path:
+        return Path.cwd()
+
+    scratch_dir = Path(scratch_path).expanduser()
+    min_free_bytes = config.get_float("Global", "scratch_min_free_mb", 2048.0) * 1024**2
+    try:
+        free_bytes = shutil.disk_usage(scratch_dir).free
+    except OSError as e:
+        dycov_logging.get_logger("Parameters").warning(
+            f"Scratch path {scratch_dir} is not usable ({e}), falling back to {Path.cwd()}"
+        )
+        return Path.cwd()
+
+    if free_bytes < min_free_bytes:
+        dycov_logging.get_logger("Parameters").warning(
+            f"Scratch path {scratch_dir} has only {free_bytes / 1024**2:.0f} MB free, "
+            f"falling back to {Path.cwd()}"
+        )
+        return Path.cwd()
+
+    dycov_logging.get_logger("Parameters").debug(f"Using scratch path {scratch_dir}")
+    return scratch_dir
+
+
 # Global abort flag to coordinate graceful shutdown across threads
 ABORT_EVENT = threading.Event()
 
@@ -82,7 +114,7 @@ class Parameters:
 
         tmp_path = config.get_value("Global", "temporal_path")
         username = getpass.getuser()
-        base_dir = Path.cwd()
+        base_dir = _select_base_dir()
         prefix = f"{tmp_path}_{username}_"
         _purge_stale_temp_dirs(base_dir=base_dir, prefix=prefix, older_than=timedelta(minutes=30))
         self._working_dir = Path(tempfile.mkdtemp(prefix=prefix, dir=base_dir))
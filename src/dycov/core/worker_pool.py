@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Long-lived pool of worker processes for the PCS tasks.
+
+The shared read-only state is loaded once in the main process before the workers are
+forked, so they inherit it: the Dynawo dictionaries of the translator, the generator
+variables, the parsed PCS alias files and the DYD and PAR files of the producer model.
+The workers are stopped with `release()` at the end of each run, so that they do not
+hold the memory of the tasks they ran, and the next run forks new ones. A process that
+runs many jobs (``dycov serve``) keeps the pool instead with `keep_alive()`: each
+worker is then replaced by a new fork after every task. The pool is created again when
+the number of workers, the configuration or the profiling settings change, since the
+workers would not see them.
+
+The parameters of a run are published once with `shared_state()`: they are pickled
+to a file, with the working directory of the run, that each worker reads the first
+time it runs a task of the run, so the tasks only carry the file path and the PCS and
+producer names. A process running several jobs from different directories (e.g.
+``dycov serve``) thus keeps the same pool.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import pickle
+import signal
+import tempfile
+from contextlib import contextmanager
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Optional
+
+from dycov.configuration.cfg import config
+from dycov.logging import dycov_logging
+
+_pool: Optional[Pool] = None
+_pool_key: Optional[tuple] = None
+# Whether the pool is kept between runs
+_keep_alive = False
+
+# State of the current run in a worker: (state file, unpickled value)
+_state: tuple = (None, None)
+
+
+def preload(model_path: Optional[Path] = None) -> None:
+    """Loads the read-only state shared by all the PCS tasks: the Dynawo dictionaries,
+    the generator variables and the PCS alias files.
+
+    Parameters
+    ----------
+    model_path : Path, optional
+        Directory of the producer model, whose DYD and PAR files are parsed too.
+    """
+    from dycov.configuration.cfg import _get_aliases_config
+    from dycov.curves.dynawo.dictionary.translator import dynawo_translator  # noqa: F401
+    from dycov.electrical.generator_variables import generator_variables  # noqa: F401
+    from dycov.files import model_parameters
+
+    if model_path is not None and model_path.is_dir():
+        model_files = [
+            path
+            for path in sorted(model_path.rglob("*"))
+            if path.suffix.lower() in (".dyd", ".par") and path.is_file()
+        ]
+        # Parsing more files than the cache holds would only evict the first ones
+        for path in model_files[: model_parameters._DOCUMENT_CACHE_SIZE]:
+            model_parameters._read_model_document(path)
+
+    templates_path = config.get_value("Global", "templates_path")
+    for root in (Path(__file__).resolve().parent.parent, config.get_config_dir()):
+        pcs_templates = root / templates_path
+        if not pcs_templates.is_dir():
+            continue
+        # Alias files live next to the PCS directories of each workflow/technology
+        for aliases_root in {path.parent for path in pcs_templates.rglob("*aliases*")}:
+            _get_aliases_config(aliases_root)
+
+
+def _initialize_worker() -> None:
+    # Workers ignore SIGINT; the main process coordinates the shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    preload()
+
+
+def _config_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for parser in (config._default_config, config._user_config):
+        for section in parser.sections():
+            digest.update(section.encode())
+            for key, value in parser.items(section, raw=True):
+                digest.update(f"{key}={value}\n".encode())
+    return digest.hexdigest()
+
+
+def _current_key(num_processes: int) -> tuple:
+    from dycov.logging.profiling import _TRACE_DIR_ENV
+
+    return num_processes, _config_fingerprint(), os.environ.get(_TRACE_DIR_ENV)
+
+
+def get_pool(num_processes: int) -> Pool:
+    """Returns the worker pool, creating it if it does not exist or no longer matches
+    the number of workers, the configuration or the profiling settings.
+
+    Parameters
+    ----------
+    num_processes : int
+        Number of worker processes.
+
+    Returns
+    -------
+    Pool
+        Pool whose workers have the shared state loaded.
+    """
+    global _pool, _pool_key
+    key = _current_key(num_processes)
+    if _pool is not None and _pool_key == key:
+        return _pool
+
+    shutdown()
+    # Load the state in this process too, so forked workers inherit it
+    preload()
+    dycov_logging.get_logger("WorkerPool").debug(f"Starting {num_processes} worker processes")
+    _pool = Pool(
+        processes=num_processes,
+        initializer=_initialize_worker,
+        maxtasksperchild=1 if _keep_alive else None,
+    )
+    _pool_key = key
+    return _pool
+
+
+def keep_alive(enabled: bool = True) -> None:
+    """Keeps the worker pool between runs, for a process that runs many jobs. Each
+    worker is replaced after every task by a new fork of this process, so that an idle
+    worker does not hold the memory of its last task.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Keep the pool (True) or stop it at the end of each run (False).
+    """
+    global _keep_alive
+    if enabled != _keep_alive:
+        shutdown()
+    _keep_alive = enabled
+
+
+def release() -> None:
+    """Ends a run on the worker pool: the workers are stopped, unless the pool is kept
+    alive."""
+    if not _keep_alive:
+        shutdown()
+
+
+def shutdown(terminate: bool = False) -> None:
+    """Stops the worker pool, if any.
+
+    Parameters
+    ----------
+    terminate : bool, optional
+        Stop the workers immediately instead of waiting for their tasks.
+    """
+    global _pool, _pool_key
+    if _pool is None:
+        return
+    if terminate:
+        _pool.terminate()
+    else:
+        _pool.close()
+    _pool.join()
+    _pool = None
+    _pool_key = None
+
+
+atexit.register(shutdown)
+
+
+def _logging_levels() -> tuple:
+    return dycov_logging.level, tuple(handler.level for handler in dycov_logging.handlers)
+
+
+def _set_logging_levels(levels: tuple) -> None:
+    level, handler_levels = levels
+    dycov_logging.setLevel(level)
+    if len(handler_levels) == len(dycov_logging.handlers):
+        for handler, handler_level in zip(dycov_logging.handlers, handler_levels):
+            handler.setLevel(handler_level)
+
+
+@contextmanager
+def shared_state(value: Any):
+    """Publishes value to the workers for the duration of a run, with the working
+    directory, the configuration and the log levels of this process.
+
+    Parameters
+    ----------
+    value : Any
+        Picklable state of the run.
+
+    Yields
+    ------
+    str
+        Path of the state file, to be passed to `load_state()` in the tasks.
+    """
+    fd, state_file = tempfile.mkstemp(prefix="dycov_state_", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(
+                (os.getcwd(), config.snapshot(), _logging_levels(), value),
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        yield state_file
+    finally:
+        os.remove(state_file)
+
+
+def load_state(state_file: str) -> Any:
+    """Returns the state published in state_file, reading it only on the first task of
+    the run in this worker. The worker then moves to the working directory of the run
+    and takes its configuration and log levels, which replace those of any earlier run
+    of the worker (e.g. the PCS sections it loaded, or a --debug job of ``dycov serve``).
+
+    Parameters
+    ----------
+    state_file : str
+        Path yielded by `shared_state()`.
+
+    Returns
+    -------
+    Any
+        The published state.
+    """
+    global _state
+    if _state[0] != state_file:
+        with open(state_file, "rb") as file:
+            working_dir, config_snapshot, logging_levels, value = pickle.load(file)
+        os.chdir(working_dir)
+        config.restore(config_snapshot)
+        _set_logging_levels(logging_levels)
+        _state = (state_file, value)
+    return _state[1]
@@ -18,11 +18,17 @@ import pandas as pd
 
 from dycov.configuration.cfg import config
 from dycov.curves.dynawo.dictionary.translator import dynawo_translator
+from dycov.curves.dynawo.orchestrator.warm_start import (
+    BisectionHistory,
+    WarmStart,
+    model_fingerprint,
+)
 from dycov.curves.dynawo.runtime.dynawo_simulator import DynawoSimulator
 from dycov.curves.voltage_dip import (
     VoltDipResult,
     classify_residual_voltage,
     classify_voltage_dip,
+    measure_voltage_dip,
 )
 from dycov.files import manage_files, replace_placeholders
 from dycov.logging import dycov_logging
@@ -35,6 +41,10 @@ CCT_REL_TOL = 0.0001
 
 _TSO_PAR = "TSOModel.par"
 _CURVES_CSV = "curves/curves.csv"
+# Files rewritten in place during a bisection iteration (fault parameters and
+# solver retries). They get a private copy in each workspace; the rest is hardlinked.
+_TSO_JOBS = "TSOModel.jobs"
+_MUTABLE_FILES = (_TSO_PAR, "solvers.par", _TSO_JOBS)
 
 
 class BisectionEngine:
@@ -87,6 +97,7 @@ class BisectionEngine:
         self.sim_time = sim_time
         self._thr_ss_tol = thr_ss_tol
         self._curves_dict = curves_dict
+        self._history = BisectionHistory.from_config()
 
     # ------------------------------------------------------------------
     # Internal utilities
@@ -95,17 +106,60 @@ class BisectionEngine:
     @contextmanager
     def _isolated_copy(self, src_dir: Path):
         """
-        Yields a temporary directory pre-populated with a copy of src_dir.
-        The directory is cleaned up automatically on exit.
+        Yields a temporary directory pre-populated with a view of src_dir, where the
+        files modified by an iteration are private copies and the rest are hardlinks.
+        The directory is created next to src_dir, so that the hardlinks stay on the
+        same filesystem, and it is cleaned up automatically on exit.
         """
-        with TemporaryDirectory(prefix="dynawo_") as temp_dir:
+        with TemporaryDirectory(prefix="dynawo_", dir=src_dir.parent) as temp_dir:
             work = (
                 Path(temp_dir)
                 / f"fault_time_execution_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
             )
-            manage_files.copy_directory(src_dir, work)
+            manage_files.link_directory(src_dir, work, materialize=_MUTABLE_FILES)
             yield work
 
+    def _history_key(self, bm_name: str, oc_name: str, kind: str) -> tuple:
+        """Returns the bisection history key of a search. The producer is identified by
+        the resolved path of its DYD file, since the models of different producers
+        usually share the same file name."""
+        return (
+            str(self._producer.get_producer_dyd().resolve()),
+            self._pcs_name,
+            bm_name,
+            oc_name,
+            kind,
+        )
+
+    def _warm_start(
+        self, key: tuple, fingerprint: str | None, same_model_width: float
+    ) -> tuple[WarmStart | None, float]:
+        """
+        Returns the stored result of a previous search and the relative half-width of
+        the bracket to check around it: same_model_width when the model is unchanged,
+        `bisection_warm_start_rel_width` otherwise.
+        """
+        if self._history is None:
+            return None, 0.0
+        warm = self._history.lookup(key, fingerprint)
+        if warm is None:
+            return None, 0.0
+        width = (
+            same_model_width
+            if warm.same_model
+            else config.get_float("Global", "bisection_warm_start_rel_width", 0.05)
+        )
+        dycov_logging.get_logger("Bisection").debug(
+            f"Warm start from {warm.value} (same model: {warm.same_model}, width: {width})"
+        )
+        return warm, width
+
+    def _fingerprint(self, working_oc_dir: Path, *extra) -> str | None:
+        """Returns the model fingerprint, or None when there is no bisection history."""
+        if self._history is None:
+            return None
+        return model_fingerprint(working_oc_dir, *extra)
+
     @staticmethod
     def _fault_rpu_from_xpu(xpu: float, r_factor: float) -> float:
         """rpu = xpu / r_factor (with zero-division guard)."""
@@ -146,6 +200,131 @@ class BisectionEngine:
             fault_rpu,
         )
 
+    def _limit_horizon(
+        self, working_oc_dir: Path, fault_start: float, fault_duration: float
+    ) -> None:
+        """
+        Stops the simulation shortly after the fault is cleared when
+        Global.bisection_early_stop is enabled. The voltage dip is measured before
+        and during the fault, so the truncated simulation is enough to classify it;
+        whether the simulation succeeds over the full horizon is confirmed by
+        `_confirm_full_horizon` before an impedance is accepted.
+
+        Parameters
+        ----------
+        working_oc_dir : Path
+            Working directory containing TSOModel.jobs.
+        fault_start : float
+            Fault start time.
+        fault_duration : float
+            Fault duration.
+        """
+        if not config.get_boolean("Global", "bisection_early_stop", False):
+            return
+        margin = config.get_float("Global", "bisection_early_stop_margin", 1.0)
+        replace_placeholders.limit_simulation_stop(
+            working_oc_dir, _TSO_JOBS, fault_start + fault_duration + margin
+        )
+
+    def _confirm_full_horizon(
+        self,
+        output_dir: Path,
+        working_oc_dir: Path,
+        jobs_output_dir: Path,
+        fault_start: float,
+        fault_duration: float,
+        fault_xpu: float,
+        fault_rpu: float,
+        bm_name: str,
+        oc_name: str,
+        simulate_fn: callable,
+        reset_solver_fn: callable,
+    ):
+        """
+        Simulates a fault over the full horizon, to confirm that a simulation stopped
+        early by `_limit_horizon` does not diverge later.
+
+        Parameters
+        ----------
+        output_dir : Path
+            Output directory for simulation results.
+        working_oc_dir : Path
+            Working directory for the simulation.
+        jobs_output_dir : Path
+            Output directory specified in the job file.
+        fault_start : float
+            Fault start time.
+        fault_duration : float
+            Fault duration.
+        fault_xpu : float
+            Fault reactance in per unit.
+        fault_rpu : float
+            Fault resistance in per unit.
+        bm_name : str
+            Benchmark name.
+        oc_name : str
+            Operating Condition name.
+        simulate_fn : callable
+            Simulation callable, as in find_hiz_fault.
+        reset_solver_fn : callable
+            Solver reset callable, as in find_hiz_fault.
+
+        Returns
+        -------
+        SimulateOutcome
+            Outcome of the full horizon simulation.
+        """
+        dycov_logging.get_logger("Bisection").debug(
+            f"Confirming fault XPU {fault_xpu} over the full horizon"
+        )
+        with self._isolated_copy(working_oc_dir) as working_oc_dir_full:
+            self._modify_fault(
+                working_oc_dir_full, fault_start, fault_duration, fault_xpu, fault_rpu
+            )
+            outcome = simulate_fn(
+                output_dir,
+                working_oc_dir_full,
+                jobs_output_dir,
+                bm_name,
+                oc_name,
+                disable_retry_logs=True,
+            )
+            reset_solver_fn()
+        return outcome
+
+    @staticmethod
+    def _dip_residual(measured_dip: float | None, target_dip: float) -> float | None:
+        """
+        Residual used by the regula falsi search: 1/target - 1/measured. For a fault
+        behind a Thevenin source, 1/dip grows linearly with the fault reactance, so
+        this residual is close to linear in it. It is positive when the dip is too
+        large. Returns None when it cannot be computed.
+        """
+        if measured_dip is None or measured_dip <= 0.0 or target_dip <= 0.0:
+            return None
+        return 1.0 / target_dip - 1.0 / measured_dip
+
+    @staticmethod
+    def _regula_falsi_candidate(
+        min_val: float,
+        max_val: float,
+        min_residual: float | None,
+        max_residual: float | None,
+    ) -> float:
+        """
+        Returns the next fault reactance by linear interpolation of the residuals at
+        both ends of the bracket, or the midpoint when any of them is unknown or the
+        interpolated value does not fall strictly inside the bracket.
+        """
+        midpoint = round(((max_val + min_val) / 2), BISECTION_ROUND)
+        if min_residual is None or max_residual is None or min_residual <= max_residual:
+            return midpoint
+        candidate = round(
+            min_val + (max_val - min_val) * min_residual / (min_residual - max_residual),
+            BISECTION_ROUND,
+        )
+        return candidate if min_val < candidate < max_val else midpoint
+
     def _is_bisection_complete(
         self,
         max_val: float,
@@ -237,8 +416,34 @@ class BisectionEngine:
         hiz_rel_tol = config.get_float("Global", "hiz_fault_rel_tol", 1e-5)
         voltage_dip_classification = None
 
+        # A previous result is probed first, then the bracket end on the side its
+        # classification points to. Both probes narrow [min_val, max_val] like any
+        # other iteration, so a failed check simply continues the regular search.
+        history_key = self._history_key(bm_name, oc_name, "hiz_fault")
+        fingerprint = self._fingerprint(working_oc_dir, dip, fault_duration)
+        warm, warm_width = self._warm_start(history_key, fingerprint, hiz_rel_tol)
+        probes = [warm.value] if warm and min_val < warm.value < max_val else []
+        is_first_probe = bool(probes)
+
+        # Regula falsi (Illinois variant) keeps the residual at each end of the
+        # bracket. The lower end starts from the bolted-fault approximation (a dip
+        # of 1 pu); ends moved by a failed simulation have no residual, and then
+        # the midpoint is used.
+        use_regula_falsi = config.get_value("Global", "hiz_fault_search_method") == "regula_falsi"
+        early_stop = config.get_boolean("Global", "bisection_early_stop", False)
+        min_residual = self._dip_residual(1.0, abs(dip)) if abs(dip) < 1.0 else None
+        max_residual = None
+        last_moved_end = None
+
         while True:
-            fault_xpu = round(((max_val + min_val) / 2), BISECTION_ROUND)
+            if probes:
+                fault_xpu = round(probes.pop(), BISECTION_ROUND)
+            elif use_regula_falsi:
+                fault_xpu = self._regula_falsi_candidate(
+                    min_val, max_val, min_residual, max_residual
+                )
+            else:
+                fault_xpu = round(((max_val + min_val) / 2), BISECTION_ROUND)
             with self._isolated_copy(working_oc_dir) as working_oc_dir_fault:
                 fault_rpu = self._fault_rpu_from_xpu(fault_xpu, fault_r_factor)
                 dycov_logging.get_logger("Bisection").debug(
@@ -252,6 +457,7 @@ class BisectionEngine:
                     fault_xpu,
                     fault_rpu,
                 )
+                self._limit_horizon(working_oc_dir_fault, fault_start, fault_duration)
                 fault_outcome = simulate_fn(
                     output_dir,
                     working_oc_dir_fault,
@@ -262,9 +468,7 @@ class BisectionEngine:
                 )
                 reset_solver_fn()
                 if fault_outcome.succeeded:
-                    bisection_success = True
-                    last_fault_xpu = fault_xpu
-                    voltage_dip_classification = classify_voltage_dip(
+                    iteration_classification = classify_voltage_dip(
                         self._pcs_name,
                         bm_name,
                         oc_name,
@@ -273,6 +477,28 @@ class BisectionEngine:
                         fault_duration,
                         abs(dip),
                     )
+                    if early_stop and iteration_classification == VoltDipResult.DIP_CORRECT:
+                        # The truncated simulation only classifies the dip: the impedance
+                        # is accepted if the simulation also succeeds after it
+                        full_outcome = self._confirm_full_horizon(
+                            output_dir,
+                            working_oc_dir,
+                            jobs_output_dir,
+                            fault_start,
+                            fault_duration,
+                            fault_xpu,
+                            fault_rpu,
+                            bm_name,
+                            oc_name,
+                            simulate_fn,
+                            reset_solver_fn,
+                        )
+                        if not full_outcome.succeeded:
+                            fault_outcome = full_outcome
+                if fault_outcome.succeeded:
+                    bisection_success = True
+                    last_fault_xpu = fault_xpu
+                    voltage_dip_classification = iteration_classification
                 if dycov_logging.get_logger("Bisection").getEffectiveLevel() == logging.DEBUG:
                     target_dir_name = (
                         "bisection_last_success"
@@ -283,21 +509,46 @@ class BisectionEngine:
                         working_oc_dir_fault, working_oc_dir / target_dir_name
                     )
                 if fault_outcome.succeeded:
+                    residual = None
+                    if use_regula_falsi:
+                        residual = self._dip_residual(
+                            measure_voltage_dip(
+                                self._pcs_name,
+                                bm_name,
+                                oc_name,
+                                fault_outcome.curves,
+                                fault_start,
+                                fault_duration,
+                            ),
+                            abs(dip),
+                        )
                     if voltage_dip_classification == VoltDipResult.DIP_TOO_LARGE:
                         min_val = fault_xpu
+                        if last_moved_end == "min" and max_residual is not None:
+                            max_residual /= 2
+                        min_residual, last_moved_end = residual, "min"
+                        if is_first_probe:
+                            probes.append(min(fault_xpu * (1 + warm_width), max_val))
                     elif voltage_dip_classification == VoltDipResult.DIP_TOO_SMALL:
                         max_val = fault_xpu
+                        if last_moved_end == "max" and min_residual is not None:
+                            min_residual /= 2
+                        max_residual, last_moved_end = residual, "max"
+                        if is_first_probe:
+                            probes.append(max(fault_xpu * (1 - warm_width), min_val))
                     else:
                         break
                 else:
                     dycov_logging.get_logger("Bisection").debug("Simulation fails")
                     if voltage_dip_classification is not None:
                         if voltage_dip_classification == VoltDipResult.DIP_TOO_LARGE:
-                            max_val = fault_xpu
+                            max_val, max_residual = fault_xpu, None
                         elif voltage_dip_classification == VoltDipResult.DIP_TOO_SMALL:
-                            min_val = fault_xpu
+                            min_val, min_residual = fault_xpu, None
                     else:
-                        max_val = fault_xpu
+                        max_val, max_residual = fault_xpu, None
+                    last_moved_end = None
+                is_first_probe = False
                 if self._is_bisection_complete(max_val, min_val, hiz_rel_tol, bm_name, oc_name):
                     break
 
@@ -315,6 +566,8 @@ class BisectionEngine:
             dycov_logging.get_logger("Bisection").error("The required dip was not achieved")
             raise ValueError("Fault dip unachievable")
 
+        if self._history is not None:
+            self._history.store(history_key, fingerprint, last_fault_xpu)
         last_fault_rpu = self._fault_rpu_from_xpu(last_fault_xpu, fault_r_factor)
         self._modify_fault(
             working_oc_dir,
@@ -645,17 +898,28 @@ class BisectionEngine:
         float
             The critical clearing time (CCT) for the fault.
         """
-        working_oc_dir_fault_max = manage_files.clone_as_subdirectory(
-            working_oc_dir, "fault_time_execution_max"
-        )
-        min_val, max_val = self._find_max_duration(
-            working_oc_dir_fault_max,
-            jobs_output_dir,
-            fault_duration,
-            bm_name,
-            oc_name,
-        )
-        manage_files.remove_dir(working_oc_dir_fault_max)
+        history_key = self._history_key(bm_name, oc_name, "cct")
+        fingerprint = self._fingerprint(working_oc_dir, fault_duration)
+        warm, warm_width = self._warm_start(history_key, fingerprint, CCT_REL_TOL / 2)
+        bracket = None
+        if warm:
+            bracket = self._check_cct_bracket(
+                working_oc_dir, jobs_output_dir, warm.value, warm_width, bm_name, oc_name
+            )
+        if bracket is not None:
+            min_val, max_val = bracket
+        else:
+            working_oc_dir_fault_max = manage_files.clone_as_subdirectory(
+                working_oc_dir, "fault_time_execution_max", materialize=_MUTABLE_FILES
+            )
+            min_val, max_val = self._find_max_duration(
+                working_oc_dir_fault_max,
+                jobs_output_dir,
+                fault_duration,
+                bm_name,
+                oc_name,
+            )
+            manage_files.remove_dir(working_oc_dir_fault_max)
         dycov_logging.get_logger("Bisection").debug(
             "Upper time to find clear time: " + str(max_val)
         )
@@ -664,6 +928,11 @@ class BisectionEngine:
         )
 
         time = round(((max_val + min_val) / 2), BISECTION_ROUND)
+        if bracket is not None and self._is_bisection_complete(
+            max_val, min_val, CCT_REL_TOL, bm_name, oc_name
+        ):
+            self._history.store(history_key, fingerprint, time)
+            return time
         counter = 0
         while True:
             dycov_logging.get_logger("Bisection").debug(
@@ -693,4 +962,53 @@ class BisectionEngine:
             if self._is_bisection_complete(max_val, min_val, CCT_REL_TOL, bm_name, oc_name):
                 break
             counter += 1
+        if self._history is not None:
+            self._history.store(history_key, fingerprint, time)
         return time
+
+    def _check_cct_bracket(
+        self,
+        working_oc_dir: Path,
+        jobs_output_dir: Path,
+        cct: float,
+        width: float,
+        bm_name: str,
+        oc_name: str,
+    ) -> tuple[float, float] | None:
+        """
+        Checks with two simulations that a previous CCT still brackets the current one.
+
+        Parameters
+        ----------
+        working_oc_dir : Path
+            Temporal working path (must already contain completed model files).
+        jobs_output_dir : Path
+            Simulation output directory.
+        cct : float
+            CCT found by a previous run.
+        width : float
+            Relative half-width of the bracket around cct.
+        bm_name : str
+            Benchmark name.
+        oc_name : str
+            Operating Condition name.
+
+        Returns
+        -------
+        tuple[float, float] | None
+            (min_val, max_val) if the lower end is stable and the upper end is not,
+            None otherwise.
+        """
+        min_val = round(cct * (1 - width), BISECTION_ROUND)
+        max_val = round(cct * (1 + width), BISECTION_ROUND)
+        for fault_time, expected_stable in ((min_val, True), (max_val, False)):
+            with self._isolated_copy(working_oc_dir) as working_oc_dir_fault:
+                stable = self._run_time_cct(
+                    working_oc_dir_fault, jobs_output_dir, fault_time, bm_name, oc_name
+                )
+            if stable != expected_stable:
+                dycov_logging.get_logger("Bisection").debug(
+                    f"Warm start bracket [{min_val}, {max_val}] rejected, full CCT search"
+                )
+                return None
+        return min_val, max_val
@@ -24,7 +24,7 @@ from dycov.electrical.generator_variables import generator_variables
 from dycov.electrical.initialization_calcs import init_calcs
 from dycov.electrical.pimodel_parameters import line_pimodel
 from dycov.files import model_parameters, omega_file, tso_file
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
 from dycov.model.parameters import GenParams, LoadInit, LoadParams, PdrParams, PimodelParams
 
 _TSO_PAR = "TSOModel.par"
@@ -610,6 +610,7 @@ class ModelSetup:
             for gen in producer.generators
         ]
 
+    @profiling.span("model_setup")
     def complete_model(
         self,
         working_oc_dir: Path,
@@ -680,18 +681,19 @@ class ModelSetup:
         sorted_stepup_xfmrs = self._sort_stepup_xfmrs_to_generators(producer)
 
         pdr_load, grid_load = self._get_tso_loads(pcs_name, bm_name, oc_name, u_dim)
-        tso_gen = init_calcs(
-            tuple(producer.generators),
-            tuple(sorted_stepup_xfmrs),
-            producer.aux_load,
-            producer.auxload_xfmr,
-            producer.ppm_xfmr,
-            producer.intline,
-            pdr,
-            conn_line,
-            grid_load,
-            pdr_load,
-        )
+        with profiling.span("init_calcs"):
+            tso_gen = init_calcs(
+                tuple(producer.generators),
+                tuple(sorted_stepup_xfmrs),
+                producer.aux_load,
+                producer.auxload_xfmr,
+                producer.ppm_xfmr,
+                producer.intline,
+                pdr,
+                conn_line,
+                grid_load,
+                pdr_load,
+            )
 
         dycov_logging.get_logger("ModelSetup").debug(
             f"Event definition for '{get_cfg_oc_name(pcs_name, bm_name, oc_name)}':",
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+# marinjl@aia.es
+# omsg@aia.es
+# demiguelm@aia.es
+#
+import hashlib
+import json
+import os
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+from typing import Optional
+
+from dycov.configuration.cfg import config
+from dycov.logging import dycov_logging
+
+_HISTORY_DIR = "cache/bisection"
+
+WarmStart = namedtuple("WarmStart", "value same_model")
+
+
+def model_fingerprint(working_oc_dir: Path, *extra) -> str:
+    """
+    Returns a hash of the simulation inputs of an operating condition.
+
+    Only the files directly under working_oc_dir are hashed (the Dynawo inputs);
+    subdirectories hold simulation outputs and bisection artifacts.
+
+    Parameters
+    ----------
+    working_oc_dir : Path
+        Working directory containing the completed model files.
+    extra : Any
+        Additional values that condition the search (e.g. the target voltage dip).
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256(repr(extra).encode())
+    for file in sorted(working_oc_dir.iterdir()):
+        if file.is_file():
+            digest.update(file.name.encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+class BisectionHistory:
+    """
+    Persists the converged value of each bisection search (HIZ fault reactance, CCT),
+    keyed by (producer, PCS, benchmark, OC, search kind), together with the
+    fingerprint of the model it was found for.
+
+    Each key is stored in its own JSON file and written atomically, so that PCS
+    validated in parallel processes never share a file.
+    """
+
+    def __init__(self, history_dir: Path):
+        """
+        Parameters
+        ----------
+        history_dir : Path
+            Directory where the history files are stored.
+        """
+        self._history_dir = history_dir
+
+    @staticmethod
+    def from_config() -> Optional["BisectionHistory"]:
+        """Returns the history in the user configuration directory, or None if disabled."""
+        if not config.get_boolean("Global", "bisection_warm_start", False):
+            return None
+        return BisectionHistory(config.get_config_dir() / _HISTORY_DIR)
+
+    def _path(self, key: tuple) -> Path:
+        name = hashlib.sha1("|".join(str(part) for part in key).encode()).hexdigest()
+        return self._history_dir / f"{name}.json"
+
+    def lookup(self, key: tuple, fingerprint: str) -> Optional[WarmStart]:
+        """
+        Returns the value stored for key, or None if there is no usable entry.
+
+        Parameters
+        ----------
+        key : tuple
+            (producer, PCS, benchmark, OC, search kind).
+        fingerprint : str
+            Fingerprint of the current model.
+
+        Returns
+        -------
+        WarmStart | None
+            Stored value, and whether it was found for the same model.
+        """
+        try:
+            entry = json.loads(self._path(key).read_text())
+            value = float(entry["value"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not value > 0.0:
+            return None
+        return WarmStart(value=value, same_model=entry.get("fingerprint") == fingerprint)
+
+    def store(self, key: tuple, fingerprint: str, value: float) -> None:
+        """
+        Saves the converged value for key. Failures are logged and otherwise ignored,
+        since the history only speeds up later runs.
+
+        Parameters
+        ----------
+        key : tuple
+            (producer, PCS, benchmark, OC, search kind).
+        fingerprint : str
+            Fingerprint of the model the value was found for.
+        value : float
+            Converged value.
+        """
+        path = self._path(key)
+        entry = {"key": [str(part) for part in key], "fingerprint": fingerprint, "value": value}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_file.name, path)
+        except OSError as e:
+            dycov_logging.get_logger("Bisection").warning(
+                f"Unable to save the bisection history in {path}: {e}"
+            )
@@ -17,6 +17,7 @@ import numpy as np
 import pandas as pd
 
 from dycov.core.global_variables import ABS_TOLERANCE_FACTOR, VOLTAGE_DIP_THRESHOLD
+from dycov.logging import profiling
 
 _FREQUENCY_PATTERNS = [
     r".*NetworkFrequencyPu$",
@@ -511,6 +512,7 @@ def build_output_curves(
     return pd.DataFrame(curves_dict)
 
 
+@profiling.span("curve_loading")
 def create_curves(
     variable_translations: dict,
     input_file: Path,
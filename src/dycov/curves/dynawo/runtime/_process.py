@@ -17,7 +17,7 @@ import time
 from collections import namedtuple
 from pathlib import Path
 
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
 
 ProcessOutcome = namedtuple("ProcessOutcome", "completed_successfully stderr elapsed_seconds")
 
@@ -64,6 +64,7 @@ def kill_process(proc: subprocess.Popen) -> None:
         os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
 
 
+@profiling.span("dynawo_run")
 def run_dynawo_process(
     launcher_dwo: Path,
     jobs_filename: str,
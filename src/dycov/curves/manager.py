@@ -16,7 +16,7 @@ import pandas as pd
 from dycov.configuration.cfg import config
 from dycov.core.parameters import Parameters
 from dycov.curves import curves_factory, naming
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
 from dycov.model.parameters import (
     CurvesAvailability,
     CurvesCheckResult,
@@ -291,6 +291,7 @@ class CurvesManager:
             availability=availability,
         )
 
+    @profiling.span("signal_processing")
     def apply_signal_processing(
         self,
         working_path: Path,
@@ -9,9 +9,10 @@
 #
 
 import cmath
-from itertools import zip_longest
 from math import sqrt
 
+import numpy as np
+
 from dycov.electrical.pimodel_parameters import line_pimodel, xfmr_pimodel
 from dycov.model import parameters as mp
 
@@ -208,63 +209,110 @@ def _solve_gen_circuits(
     v_int: complex,
     s_int: complex,
 ) -> None:
+    """Solves the circuits of all the generators, behind their step-up transformers.
+
+    The internal node flow is shared among the generators according to their P and Q
+    shares, and the pi models of all the generator branches are solved at once, as
+    NumPy complex arrays. Identical branches (same shares, same step-up transformer
+    parameters and orientation) are solved only once, which is the usual case for
+    plants made of many identical strings.
+    """
+    if not gens:
+        return
+    gen_xfmrs = tuple(gen_xfmrs) + (None,) * (len(gens) - len(gen_xfmrs))
     tot_P = 0
     tot_Q = 0
     for gen in gens:
         tot_P += gen.p
         tot_Q += gen.q
-
-    for gen, gen_xfmr in zip_longest(gens, gen_xfmrs):
-        s_int_share = complex(s_int.real * gen.p / tot_P, s_int.imag * gen.q / tot_Q)
+    if tot_P == 0 or tot_Q == 0:
+        # Do not write NaN shares into the terminals and the PAR files
+        raise ZeroDivisionError("The P or Q shares of the generators add up to zero")
+
+    branches = {}
+    branch_index = []
+    for gen, gen_xfmr in zip(gens, gen_xfmrs):
+        key = _get_branch_params(gen, gen_xfmr)
+        if key not in branches:
+            branches[key] = (len(branches), gen, gen_xfmr)
+        branch_index.append(branches[key][0])
+    v_gen, s_gen, s_int_share = _solve_gen_branches(
+        [branch[1:] for branch in branches.values()], v_int, s_int, tot_P, tot_Q
+    )
+
+    for gen, gen_xfmr, branch in zip(gens, gen_xfmrs, branch_index):
+        _set_terminal(gen.terminals[0], v_gen[branch], s_gen[branch])
+        if gen_xfmr is None:
+            continue
+        if gen_xfmr.terminals[0].connected_equipment == gen.id:
+            _set_terminal(gen_xfmr.terminals[1], v_int, s_int_share[branch])
+            _set_terminal(gen_xfmr.terminals[0], v_gen[branch], -s_gen[branch])
+        else:
+            _set_terminal(gen_xfmr.terminals[0], v_int, s_int_share[branch])
+            _set_terminal(gen_xfmr.terminals[1], v_gen[branch], -s_gen[branch])
+
+
+def _get_branch_params(gen: mp.GenParams, gen_xfmr: mp.XfmrParams) -> tuple:
+    # Parameters that define the solution of a generator branch
+    if gen_xfmr is None:
+        return (gen.p, gen.q, None)
+    gen_on_terminal1 = gen_xfmr.terminals[0].connected_equipment == gen.id
+    return (
+        gen.p,
+        gen.q,
+        gen_on_terminal1,
+        gen_xfmr.r,
+        gen_xfmr.x,
+        gen_xfmr.g,
+        gen_xfmr.b,
+        gen_xfmr.r_tfo,
+    )
+
+
+def _solve_gen_branches(
+    branches: list, v_int: complex, s_int: complex, tot_P: float, tot_Q: float
+) -> tuple[list, list, list]:
+    # Solves one (generator, step-up transformer) pair of each distinct branch
+    p = np.array([gen.p for gen, _ in branches], dtype=float)
+    q = np.array([gen.q for gen, _ in branches], dtype=float)
+    s_int_share = _to_complex(s_int.real * p / tot_P, s_int.imag * q / tot_Q)
+
+    # A generator without an external step-up transformer is referenced directly at
+    # the internal node; its placeholder pi model is not used
+    has_xfmr = np.array([gen_xfmr is not None for _, gen_xfmr in branches])
+    y_tr = np.ones(len(branches), dtype=complex)
+    y_sh_known = np.zeros(len(branches), dtype=complex)
+    y_sh_other = np.zeros(len(branches), dtype=complex)
+    for i, (gen, gen_xfmr) in enumerate(branches):
         if gen_xfmr is None:
-            _init_gen_at_node(gen, v_int, s_int_share)
             continue
         xfmr = xfmr_pimodel(gen_xfmr)
-        gen_on_terminal1 = gen_xfmr.terminals[0].connected_equipment == gen.id
-        if gen_on_terminal1:
+        y_tr[i] = xfmr.y_tr
+        if gen_xfmr.terminals[0].connected_equipment == gen.id:
             # the generator is on the declared terminal 1: the known bus faces
             # terminal 2, so solve the pi seen from side 2 (shunts swapped)
-            v_gen, _, s_gen = _calc_pimodel(
-                xfmr.y_tr, xfmr.y_sh2, xfmr.y_sh1, v_int, None, s_int_share
-            )
-        else:
-            v_gen, _, s_gen = _calc_pimodel(
-                xfmr.y_tr, xfmr.y_sh1, xfmr.y_sh2, v_int, None, s_int_share
-            )
-        gen.terminals[0].u0 = abs(v_gen)
-        gen.terminals[0].u_phase0 = cmath.phase(v_gen)
-        gen.terminals[0].p0 = s_gen.real
-        gen.terminals[0].q0 = s_gen.imag
-        if gen_on_terminal1:
-            gen_xfmr.terminals[1].u0 = abs(v_int)
-            gen_xfmr.terminals[1].u_phase0 = cmath.phase(v_int)
-            gen_xfmr.terminals[1].p0 = s_int_share.real
-            gen_xfmr.terminals[1].q0 = s_int_share.imag
-            gen_xfmr.terminals[0].u0 = abs(v_gen)
-            gen_xfmr.terminals[0].u_phase0 = cmath.phase(v_gen)
-            gen_xfmr.terminals[0].p0 = -s_gen.real
-            gen_xfmr.terminals[0].q0 = -s_gen.imag
+            y_sh_known[i], y_sh_other[i] = xfmr.y_sh2, xfmr.y_sh1
         else:
-            gen_xfmr.terminals[0].u0 = abs(v_int)
-            gen_xfmr.terminals[0].u_phase0 = cmath.phase(v_int)
-            gen_xfmr.terminals[0].p0 = s_int_share.real
-            gen_xfmr.terminals[0].q0 = s_int_share.imag
-            gen_xfmr.terminals[1].u0 = abs(v_gen)
-            gen_xfmr.terminals[1].u_phase0 = cmath.phase(v_gen)
-            gen_xfmr.terminals[1].p0 = -s_gen.real
-            gen_xfmr.terminals[1].q0 = -s_gen.imag
+            y_sh_known[i], y_sh_other[i] = xfmr.y_sh1, xfmr.y_sh2
 
+    v_gen, _, s_gen = _calc_pimodel(y_tr, y_sh_known, y_sh_other, v_int, None, s_int_share)
+    v_gen = np.where(has_xfmr, v_gen, v_int)
+    s_gen = np.where(has_xfmr, s_gen, s_int_share)
+    return v_gen.tolist(), s_gen.tolist(), s_int_share.tolist()
 
-def _init_gen_at_node(gen: mp.GenParams, v_int: complex, s_int_share: complex) -> None:
-    """Initialize a generator referenced directly at the internal node.
 
-    Used when the generator has no external step-up transformer: node 1 coincides
-    with the generator terminal, so its voltage and power are those of the node.
-    """
-    gen.terminals[0].u0 = abs(v_int)
-    gen.terminals[0].u_phase0 = cmath.phase(v_int)
-    gen.terminals[0].p0 = s_int_share.real
-    gen.terminals[0].q0 = s_int_share.imag
+def _to_complex(real: np.ndarray, imag: np.ndarray) -> np.ndarray:
+    values = np.empty(np.shape(real), dtype=complex)
+    values.real = real
+    values.imag = imag
+    return values
+
+
+def _set_terminal(terminal: mp.Terminal, v: complex, s: complex) -> None:
+    terminal.u0 = abs(v)
+    terminal.u_phase0 = cmath.phase(v)
+    terminal.p0 = s.real
+    terminal.q0 = s.imag
 
 
 def _calc_pimodel(
@@ -286,6 +334,8 @@ def _calc_pimodel(
 
     (If both i1 and s1 are specified, i1 is used and s1 is ignored.)
 
+    The parameters may also be NumPy complex arrays, to solve several circuits at once.
+
     On output:
       v2: complex voltage at terminal 2
       i2: complex current leaving terminal 2
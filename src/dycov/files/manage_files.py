@@ -8,20 +8,24 @@
 #     demiguelm@aia.es
 #
 
+from __future__ import annotations
+
 import configparser
+import os
 import re
 import shutil
 import subprocess
 from collections import namedtuple
 from pathlib import Path
-from typing import Iterable, Set
-
-import pandas as pd
+from typing import TYPE_CHECKING, Iterable, Set
 
 import dycov
 from dycov.core.global_variables import CASE_SEPARATOR
 from dycov.logging import dycov_logging
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 ModelFiles = namedtuple("ModelFiles", ["model_path", "omega_path", "pcs_path", "benchmark"])
 ProducerFiles = namedtuple("ProducerFiles", ["producer_dyd", "producer_par"])
 _PKG_ROOT = Path(dycov.__file__).resolve().parent
@@ -159,6 +163,33 @@ def copy_file(source: Path, target: Path) -> None:
     shutil.copy(source, target)
 
 
+def link_file(source: Path, target: Path) -> None:
+    """Hardlink source at target, falling back to a copy when linking is not possible.
+
+    The fallback covers filesystems without hardlink support and sources living on a
+    different device than the target.
+
+    Parameters
+    ----------
+    source : Path
+        Path to the file to link
+    target : Path
+        Path where the link (or copy) of the file is created
+    """
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _link_or_copy(source: Path, target: Path, materialize: Set[str]) -> None:
+    """Copy the files listed in materialize (lowercase names), hardlink everything else."""
+    if Path(source).name.lower() in materialize:
+        shutil.copy2(source, target)
+    else:
+        link_file(source, target)
+
+
 def rename_path(source: Path, target: Path) -> None:
     """Rename a file or directory from source to target.
 
@@ -305,7 +336,33 @@ def copy_directory(
             shutil.rmtree(cache_dir)
 
 
-def clone_as_subdirectory(source_path: Path, name: str) -> Path:
+def link_directory(source: Path, target: Path, materialize: Iterable[str] = ()) -> None:
+    """Build target as a lightweight workspace of the source directory tree.
+
+    Every file is hardlinked to its source, except the ones named in materialize,
+    which get a private copy. Callers must list in materialize every file they are
+    going to modify, since in-place writes on a hardlink reach the source file too.
+
+    Parameters
+    ----------
+    source : Path
+        Source directory.
+    target : Path
+        Destination directory.
+    materialize : Iterable[str], optional
+        Names of the files that are copied instead of linked (case insensitive).
+    """
+    materialized = {name.lower() for name in materialize}
+    shutil.copytree(
+        source,
+        target,
+        copy_function=lambda src, dst: _link_or_copy(src, dst, materialized),
+    )
+
+
+def clone_as_subdirectory(
+    source_path: Path, name: str, materialize: Iterable[str] | None = None
+) -> Path:
     """Clone a directory as a subdirectory, excluding CSV files.
 
     Parameters
@@ -314,6 +371,10 @@ def clone_as_subdirectory(source_path: Path, name: str) -> Path:
         Source directory.
     name : str
         Name of the new subdirectory.
+    materialize : Iterable[str] | None, optional
+        If given, files are hardlinked instead of copied, except the ones named
+        here, which get a private copy (see `link_directory`). Default is None
+        (copy every file).
 
     Returns
     -------
@@ -323,7 +384,14 @@ def clone_as_subdirectory(source_path: Path, name: str) -> Path:
     created_path = source_path / name
     create_dir(created_path)
     exclude_csv = [re.compile(r".*\.[cC][sS][vV]$")]
-    copy_from_path(source_path, created_path, extra_excludes=exclude_csv)
+    if materialize is None:
+        copy_from_path(source_path, created_path, extra_excludes=exclude_csv)
+        return created_path
+
+    materialized = {file_name.lower() for file_name in materialize}
+    for file in source_path.iterdir():
+        if should_copy(file, exclude_csv):
+            _link_or_copy(file, created_path / (file.stem + file.suffix.lower()), materialized)
     return created_path
 
 
@@ -535,4 +603,6 @@ def read_curves(file: Path) -> pd.DataFrame:
     pd.DataFrame
         DataFrame containing curve data.
     """
+    import pandas as pd  # deferred: only curve reading needs it
+
     return pd.read_csv(file, sep=";", skipinitialspace=True)
@@ -11,8 +11,10 @@
 from __future__ import annotations
 
 import configparser
+import copy
 import math
 import re
+from functools import lru_cache
 from itertools import zip_longest
 from pathlib import Path
 from typing import Optional
@@ -43,6 +45,84 @@ MULTIPLIER_PATTERN = re.compile(
     r"^(?:(?P<mul>[+-]?(?:\d+(?:\.\d+)?|\.\d+))\s*\*\s*)?(?P<name>[A-Za-z_]\w*)$"
 )
 
+# Maximum number of parsed DYD/PAR files kept in memory
+_DOCUMENT_CACHE_SIZE = 16
+
+
+class _ModelDocument:
+    """Parsed DYD or PAR file, indexed by the ids of its elements.
+
+    The parameter sets are indexed by their id, and the blackbox models and the
+    connections by the id of their blackbox models, so that the equipment parameters are
+    looked up without scanning the whole document for each equipment. The documents
+    read by `_read_model_document` are shared, and must not be modified.
+
+    Args
+    ----
+    tree: ElementTree
+        Parsed file
+    """
+
+    def __init__(self, tree: etree._ElementTree):
+        self.tree = tree
+        self.root = tree.getroot()
+        namespace = etree.QName(self.root).namespace
+        self.nsmap = {"ns": namespace}
+        self.connects = []
+        self._parsets = {}
+        self._bbmodels_by_lib = {}
+        self._connections = {}
+
+        prefix = f"{{{namespace}}}" if namespace else ""
+        for element in self.root.iter(
+            f"{prefix}set", f"{prefix}blackBoxModel", f"{prefix}connect"
+        ):
+            tag = etree.QName(element).localname
+            if tag == "set":
+                self._parsets.setdefault(element.get("id"), []).append(element)
+            elif tag == "blackBoxModel":
+                self._bbmodels_by_lib.setdefault(element.get("lib"), []).append(element)
+            else:
+                self.connects.append(element)
+                for equipment_id in {element.get("id1"), element.get("id2")}:
+                    self._connections.setdefault(equipment_id, []).append(element)
+
+    def get_parset(self, par_id: str) -> list:
+        """Gets the parameter sets with the given id (as the //set[@id] XPath query)."""
+        return list(self._parsets.get(par_id, ()))
+
+    def get_bbmodels(self, lib: str) -> list:
+        """Gets the blackbox models of the given library, in document order."""
+        return list(self._bbmodels_by_lib.get(lib, ()))
+
+    def get_connections(self, equipment_id: str) -> list:
+        """Gets the connections of a blackbox model, in document order."""
+        return self._connections.get(equipment_id, [])
+
+
+@lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+def _parse_model_document(path: Path, mtime_ns: int, size: int) -> _ModelDocument:
+    # The modification time and the size are only used as part of the cache key
+    return _ModelDocument(etree.parse(path, etree.XMLParser(remove_blank_text=True)))
+
+
+def _read_model_document(path: Path) -> _ModelDocument:
+    """Gets a parsed DYD or PAR file, which is parsed again only when the file changes.
+
+    Parameters
+    ----------
+    path: Path
+        Path to the file
+
+    Returns
+    -------
+    _ModelDocument
+        The shared parsed file, which must not be modified
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _parse_model_document(path, stat.st_mtime_ns, stat.st_size)
+
 
 def write_pdr_comment(path: Path, par_file: str, pdr: PdrParams) -> None:
     """
@@ -127,12 +207,8 @@ def get_connected_to_pdr(producer_dyd: Path) -> list:
     list
         List of Pdr_equipments objects representing equipment connected to the PDR bus
     """
-    producer_dyd_tree = etree.parse(producer_dyd, etree.XMLParser(remove_blank_text=True))
-    producer_dyd_root = producer_dyd_tree.getroot()
-
     connected_to_pdr = []
-    nsmap = {"ns": etree.QName(producer_dyd_root).namespace}
-    for connect in producer_dyd_root.xpath("//ns:connect", namespaces=nsmap):
+    for connect in _read_model_document(producer_dyd).connects:
         if "BusPDR" in connect.get("id1") and "terminal" in connect.get("var2"):
             connected_to_pdr.append(PdrEquipments(connect.get("id2"), connect.get("var2")))
         if "BusPDR" in connect.get("id2") and "terminal" in connect.get("var1"):
@@ -176,17 +252,14 @@ def get_producer_values(
         Internal line parameters of the producer model
     """
 
-    producer_dyd_tree = etree.parse(producer_dyd, etree.XMLParser(remove_blank_text=True))
-    producer_dyd_root = producer_dyd_tree.getroot()
+    dyd = _read_model_document(producer_dyd)
+    par = _read_model_document(producer_par)
 
-    producer_par_tree = etree.parse(producer_par, etree.XMLParser(remove_blank_text=True))
-    producer_par_root = producer_par_tree.getroot()
+    generators = _get_generator_values(dyd, par, producer_ini)
+    transformers = _get_transformer_values(dyd, par, s_nref)
 
-    generators = _get_generator_values(producer_dyd_root, producer_par_root, producer_ini)
-    transformers = _get_transformer_values(producer_dyd_root, producer_par_root, s_nref)
-
-    loads = _get_load_values(producer_dyd_root, producer_par_root)
-    lines = _get_line_values(producer_dyd_root, producer_par_root, None, None)
+    loads = _get_load_values(dyd, par)
+    lines = _get_line_values(dyd, par, None, None)
 
     stepup_xfmrs = []
     auxload_xfmr = None
@@ -232,11 +305,8 @@ def get_pcs_generators_params(pcs_dyd: Path, pcs_par: Path) -> list:
     list
         Generators parameters of the pcs model
     """
-    pcs_dyd_tree = etree.parse(pcs_dyd, etree.XMLParser(remove_blank_text=True))
-    pcs_dyd_root = pcs_dyd_tree.getroot()
-
-    pcs_par_tree = etree.parse(pcs_par, etree.XMLParser(remove_blank_text=True))
-    pcs_par_root = pcs_par_tree.getroot()
+    dyd = _read_model_document(pcs_dyd)
+    par = _read_model_document(pcs_par)
 
     generators = []
     allowed_sync_models = dynawo_translator.get_synchronous_machine_models()
@@ -245,8 +315,8 @@ def get_pcs_generators_params(pcs_dyd: Path, pcs_par: Path) -> list:
 
     all_allowed_models = allowed_sync_models + allowed_park_models + allowed_storage_models
 
-    for model_parameter in _get_allowed_models(pcs_dyd_root, all_allowed_models):
-        _append_generator(pcs_dyd_root, pcs_par_root, model_parameter, generators, None)
+    for model_parameter in _get_allowed_models(dyd, all_allowed_models):
+        _append_generator(dyd, par, model_parameter, generators, None)
     return generators
 
 
@@ -265,13 +335,7 @@ def get_pcs_load_params(pcs_dyd: Path, pcs_par: Path) -> list:
     list
         Load parameters of the pcs model
     """
-    pcs_dyd_tree = etree.parse(pcs_dyd, etree.XMLParser(remove_blank_text=True))
-    pcs_dyd_root = pcs_dyd_tree.getroot()
-
-    pcs_par_tree = etree.parse(pcs_par, etree.XMLParser(remove_blank_text=True))
-    pcs_par_root = pcs_par_tree.getroot()
-
-    loads = _get_load_values(pcs_dyd_root, pcs_par_root)
+    loads = _get_load_values(_read_model_document(pcs_dyd), _read_model_document(pcs_par))
     return loads
 
 
@@ -330,13 +394,9 @@ def get_pcs_lines_params(pcs_dyd: Path, pcs_par: Path, line_rpu: float, line_xpu
     list
         Line parameters of the pcs model
     """
-    pcs_dyd_tree = etree.parse(pcs_dyd, etree.XMLParser(remove_blank_text=True))
-    pcs_dyd_root = pcs_dyd_tree.getroot()
-
-    pcs_par_tree = etree.parse(pcs_par, etree.XMLParser(remove_blank_text=True))
-    pcs_par_root = pcs_par_tree.getroot()
-
-    lines = _get_line_values(pcs_dyd_root, pcs_par_root, line_rpu, line_xpu)
+    lines = _get_line_values(
+        _read_model_document(pcs_dyd), _read_model_document(pcs_par), line_rpu, line_xpu
+    )
 
     return lines
 
@@ -540,14 +600,14 @@ def adjust_producer_init(
         True if the control mode is valid for all generators, False otherwise
     """
 
-    producer_par_tree = etree.parse(producer_par, etree.XMLParser(remove_blank_text=True))
-    producer_par_root = producer_par_tree.getroot()
+    # Work on a copy of the shared parsed file
+    par = _ModelDocument(copy.deepcopy(_read_model_document(producer_par).tree))
 
     is_test_applicable = True
     for generator, xfmr in zip_longest(generators, xfmrs):
         if xfmr is not None:
             _adjust_transformer(
-                producer_par_root,
+                par,
                 xfmr,
                 xfmr.terminals[0].p0,
                 xfmr.terminals[0].q0,
@@ -556,7 +616,7 @@ def adjust_producer_init(
                 xfmr.terminals[1].u0,
             )
         is_control_mode_valid = _adjust_generator(
-            producer_par_root,
+            par,
             generator,
             generator.terminals[0].p0,
             generator.terminals[0].q0,
@@ -571,7 +631,7 @@ def adjust_producer_init(
 
     if aux_load:
         _adjust_load(
-            producer_par_root,
+            par,
             aux_load.id,
             aux_load.lib,
             aux_load.terminals[0].p0,
@@ -580,25 +640,25 @@ def adjust_producer_init(
             aux_load.terminals[0].u_phase0,
         )
 
-    producer_par_tree.write(path / producer_par.name, pretty_print=True)
+    par.tree.write(path / producer_par.name, pretty_print=True)
     return is_test_applicable
 
 
-def _get_allowed_models(dyd_root: etree.Element, model_list: list) -> list[etree.Element]:
+def _get_allowed_models(dyd: _ModelDocument, model_list: list) -> list[etree.Element]:
     matched_models = []
     for model_type in model_list:
-        matched_models.extend(find_bbmodel_by_type(dyd_root, model_type))
+        matched_models.extend(dyd.get_bbmodels(model_type))
     return matched_models
 
 
 def _get_generator_values(
-    dyd_root: etree.Element, par_root: etree.Element, producer_ini: configparser.ConfigParser
+    dyd: _ModelDocument, par: _ModelDocument, producer_ini: configparser.ConfigParser
 ) -> list:
     generators = []
     all_allowed_models = _collect_allowed_generator_models()
 
-    for model_parameter in _get_allowed_models(dyd_root, all_allowed_models):
-        _append_generator(dyd_root, par_root, model_parameter, generators, producer_ini)
+    for model_parameter in _get_allowed_models(dyd, all_allowed_models):
+        _append_generator(dyd, par, model_parameter, generators, producer_ini)
 
     _validate_generator_flows(generators)
     return generators
@@ -628,8 +688,8 @@ def _validate_generator_flows(generators: list) -> None:
 
 
 def _append_generator(
-    dyd_root: etree.Element,
-    par_root: etree.Element,
+    dyd: _ModelDocument,
+    par: _ModelDocument,
     model_parameter: etree.Element,
     generators: list,
     producer_ini: configparser.ConfigParser = None,
@@ -637,10 +697,10 @@ def _append_generator(
     gen_id = model_parameter.get("id")
     par_id = model_parameter.get("parId")
     lib = model_parameter.get("lib")
-    nsmap = {"ns": etree.QName(par_root).namespace}
+    nsmap = par.nsmap
 
-    connected_equipment = _get_connected_equipment(dyd_root, gen_id)
-    parset = _get_parset(par_root, par_id, nsmap)
+    connected_equipment = _get_connected_equipment(dyd, gen_id)
+    parset = _get_parset(par, par_id)
 
     imax = _get_maximum_current(parset, nsmap, lib)
     P, Q = _get_generator_power_values(parset, nsmap, lib, gen_id, producer_ini)
@@ -674,9 +734,8 @@ def _append_generator(
     )
 
 
-def _get_connected_equipment(dyd_root, gen_id):
-    nsmap = {"dyn": etree.QName(dyd_root).namespace}
-    for connect in dyd_root.xpath("//dyn:connect", namespaces=nsmap):
+def _get_connected_equipment(dyd, gen_id):
+    for connect in dyd.get_connections(gen_id):
         if connect.get("id1") == gen_id:
             return connect.get("id2")
         elif connect.get("id2") == gen_id:
@@ -684,9 +743,8 @@ def _get_connected_equipment(dyd_root, gen_id):
     return None
 
 
-def _get_connected_equipment_by_terminal(dyd_root, gen_id, terminal):
-    nsmap = {"dyn": etree.QName(dyd_root).namespace}
-    for connect in dyd_root.xpath("//dyn:connect", namespaces=nsmap):
+def _get_connected_equipment_by_terminal(dyd, gen_id, terminal):
+    for connect in dyd.get_connections(gen_id):
         if connect.get("id1") == gen_id and terminal in connect.get("var1"):
             return connect.get("id2")
         elif connect.get("id2") == gen_id and terminal in connect.get("var2"):
@@ -694,8 +752,8 @@ def _get_connected_equipment_by_terminal(dyd_root, gen_id, terminal):
     return None
 
 
-def _get_parset(par_root, par_id, nsmap):
-    parset = par_root.xpath(f"//ns:set[@id='{par_id}']", namespaces=nsmap)
+def _get_parset(par, par_id):
+    parset = par.get_parset(par_id)
     if parset is None:
         raise ValueError(f"The parameter set with id='{par_id}' was not found")
     return parset
@@ -784,20 +842,20 @@ def _get_generator_converter_lv_control(parset, nsmap, lib):
 
 
 def _get_line_values(
-    dyd_root: etree.Element,
-    par_root: etree.Element,
+    dyd: _ModelDocument,
+    par: _ModelDocument,
     applied_line_rpu: float,
     applied_line_xpu: float,
 ) -> list:
     lines = []
-    nsmap = {"ns": etree.QName(par_root).namespace}
+    nsmap = par.nsmap
     allowed_line_models = dynawo_translator.get_line_models()
 
-    for model_parameter in _get_allowed_models(dyd_root, allowed_line_models):
+    for model_parameter in _get_allowed_models(dyd, allowed_line_models):
         line_id = model_parameter.get("id")
         lib = model_parameter.get("lib")
         par_id = model_parameter.get("parId")
-        parset = par_root.xpath(f"//ns:set[@id='{par_id}']", namespaces=nsmap)
+        parset = par.get_parset(par_id)
 
         _, r_str = _get_parameter(parset, nsmap, lib, "ResistancePu")
         _, x_str = _get_parameter(parset, nsmap, lib, "ReactancePu")
@@ -809,8 +867,8 @@ def _get_line_values(
         line_gpu = float(g_str) if g_str is not None else 0.0
         line_bpu = float(b_str) if b_str is not None else 0.0
 
-        connected_equipment1 = _get_connected_equipment_by_terminal(dyd_root, line_id, "terminal1")
-        connected_equipment2 = _get_connected_equipment_by_terminal(dyd_root, line_id, "terminal2")
+        connected_equipment1 = _get_connected_equipment_by_terminal(dyd, line_id, "terminal1")
+        connected_equipment2 = _get_connected_equipment_by_terminal(dyd, line_id, "terminal2")
 
         lines.append(
             LineParams(
@@ -839,25 +897,23 @@ def _calculate_line_xpu(x_str: Optional[str], applied_line_xpu: float) -> float:
     return float(x_str) if x_str else 0.0
 
 
-def _get_transformer_values(
-    dyd_root: etree.Element, par_root: etree.Element, s_nref: float
-) -> list:
+def _get_transformer_values(dyd: _ModelDocument, par: _ModelDocument, s_nref: float) -> list:
     transformers = []
-    nsmap = {"ns": etree.QName(par_root).namespace}
+    nsmap = par.nsmap
     allowed_transformer_models = dynawo_translator.get_transformer_models()
 
-    for bbmodel in _get_allowed_models(dyd_root, allowed_transformer_models):
-        transformer_id, lib, par_id, parset = _parse_transformer_metadata(bbmodel, par_root, nsmap)
+    for bbmodel in _get_allowed_models(dyd, allowed_transformer_models):
+        transformer_id, lib, par_id, parset = _parse_transformer_metadata(bbmodel, par)
         xfmr_rpu, xfmr_xpu, xfmr_gpu, xfmr_bpu = _convert_transformer_units(
             parset, nsmap, lib, s_nref
         )
         xfmr_tapr = _get_tap_rho(parset, nsmap, lib)
         xfmr_tapa = _get_tap_alpha(parset, nsmap, lib)
         connected_equipment1 = _get_connected_equipment_by_terminal(
-            dyd_root, transformer_id, "terminal1"
+            dyd, transformer_id, "terminal1"
         )
         connected_equipment2 = _get_connected_equipment_by_terminal(
-            dyd_root, transformer_id, "terminal2"
+            dyd, transformer_id, "terminal2"
         )
 
         transformers.append(
@@ -881,11 +937,11 @@ def _get_transformer_values(
     return transformers
 
 
-def _parse_transformer_metadata(bbmodel, par_root, nsmap):
+def _parse_transformer_metadata(bbmodel, par):
     transformer_id = bbmodel.get("id")
     lib = bbmodel.get("lib")
     par_id = bbmodel.get("parId")
-    parset = par_root.xpath(f"//ns:set[@id='{par_id}']", namespaces=nsmap)
+    parset = par.get_parset(par_id)
     return transformer_id, lib, par_id, parset
 
 
@@ -926,19 +982,17 @@ def _get_tap_alpha(parset, nsmap, lib):
     return float(alpha_str)
 
 
-def _get_load_values(dyd_root: etree.Element, par_root: etree.Element) -> list:
+def _get_load_values(dyd: _ModelDocument, par: _ModelDocument) -> list:
     loads = []
-    nsmap = {"ns": etree.QName(par_root).namespace}
+    nsmap = par.nsmap
     allowed_load_models = dynawo_translator.get_load_models()
 
-    for bbmodel in _get_allowed_models(dyd_root, allowed_load_models):
-        load_id, lib, par_id, connected_equipment, parset = _parse_load_metadata(
-            bbmodel, dyd_root, par_root, nsmap
-        )
+    for bbmodel in _get_allowed_models(dyd, allowed_load_models):
+        load_id, lib, par_id, connected_equipment, parset = _parse_load_metadata(bbmodel, dyd, par)
         aux_ppu, aux_qpu, aux_upu, aux_phpu, alpha, beta = _extract_load_parameters(
             parset, nsmap, lib
         )
-        connected_equipment = _get_connected_equipment(dyd_root, load_id)
+        connected_equipment = _get_connected_equipment(dyd, load_id)
 
         loads.append(
             LoadParams(
@@ -958,12 +1012,12 @@ def _get_load_values(dyd_root: etree.Element, par_root: etree.Element) -> list:
     return loads
 
 
-def _parse_load_metadata(bbmodel, dyd_root, par_root, nsmap):
+def _parse_load_metadata(bbmodel, dyd, par):
     load_id = bbmodel.get("id")
     lib = bbmodel.get("lib")
     par_id = bbmodel.get("parId")
-    connected_equipment = _get_connected_equipment(dyd_root, load_id)
-    parset = par_root.xpath(f"//ns:set[@id='{par_id}']", namespaces=nsmap)
+    connected_equipment = _get_connected_equipment(dyd, load_id)
+    parset = par.get_parset(par_id)
     return load_id, lib, par_id, connected_equipment, parset
 
 
@@ -1004,7 +1058,7 @@ def _resolve_value(raw, sign):
 
 
 def _adjust_transformer(
-    producer_par_root,
+    producer_par,
     transformer,
     transformer_p10pu,
     transformer_q10pu,
@@ -1012,8 +1066,8 @@ def _adjust_transformer(
     transformer_uphase10,
     transformer_u20pu,
 ):
-    nsmap = {"ns": etree.QName(producer_par_root).namespace}
-    parset = _get_parset(producer_par_root, transformer.par_id, nsmap)
+    nsmap = producer_par.nsmap
+    parset = _get_parset(producer_par, transformer.par_id)
     if parset is None:
         return
 
@@ -1046,7 +1100,7 @@ def _set_transformer_voltage(parset, nsmap, lib, u0pu):
 
 
 def _adjust_generator(
-    producer_par_root: etree.Element,
+    producer_par: _ModelDocument,
     generator: GenParams,
     generator_p0pu: float,
     generator_q0pu: float,
@@ -1057,8 +1111,8 @@ def _adjust_generator(
     force_voltage_droop: bool,
     zone: int,
 ) -> int:
-    nsmap = {"ns": etree.QName(producer_par_root).namespace}
-    parset = _get_parset(producer_par_root, generator.par_id, nsmap)
+    nsmap = producer_par.nsmap
+    parset = _get_parset(producer_par, generator.par_id)
     if parset is None:
         return False
 
@@ -1276,7 +1330,7 @@ def _set_parameters(generator, parset, nsmap, parameters: dict):
 
 
 def _adjust_load(
-    producer_par_root: etree.Element,
+    producer_par: _ModelDocument,
     load_id: str,
     load_lib: str,
     load_p0pu: float,
@@ -1284,8 +1338,8 @@ def _adjust_load(
     load_u0pu: float,
     load_uphase0: float,
 ) -> None:
-    nsmap = {"ns": etree.QName(producer_par_root).namespace}
-    parset = producer_par_root.xpath(f"//ns:set[@id='{load_id}']", namespaces=nsmap)
+    nsmap = producer_par.nsmap
+    parset = producer_par.get_parset(load_id)
     if parset is None:
         return
 
@@ -106,6 +106,38 @@ def modify_jobs_file(
     )
 
 
+def limit_simulation_stop(
+    path: Path,
+    filename: str,
+    stop_time: float,
+) -> None:
+    """Shorten the simulated horizon of a JOBS XML file, if it ends after stop_time.
+
+    Parameters
+    ----------
+    path: Path
+        Path where the JOBS file is stored
+    filename: str
+        JOBS filename
+    stop_time: float
+        Latest simulation stop time
+    """
+    jobs_tree = etree.parse(path / filename, etree.XMLParser(remove_blank_text=True))
+    jobs_root = jobs_tree.getroot()
+    ns = etree.QName(jobs_root).namespace
+    simulation = jobs_root.find(f".//{{{ns}}}simulation")
+    if simulation is None or float(simulation.get("stopTime", "inf")) <= stop_time:
+        return
+    simulation.set("stopTime", str(stop_time))
+
+    jobs_tree.write(
+        path / filename,
+        pretty_print=True,
+        xml_declaration='<?xml version="1.0" encoding="UTF-8"?>',
+        encoding="UTF-8",
+    )
+
+
 def modify_par_file(
     path: Path,
     filename: str,
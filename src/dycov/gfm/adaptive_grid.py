@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Adaptive, non-uniform time grids for the GFM envelope outputs.
+
+The envelopes are evaluated on a fine uniform grid, but most of its points lie on the
+slow tail of the response, where a few points describe the curves just as well. The
+grid is coarsened by keeping a subset of its points: starting from every
+`ADAPTIVE_GRID_INITIAL_STEP`-th point, each interval where the linear interpolation
+between the kept points departs from any of the signals by more than the tolerance is
+bisected, until every signal is reproduced within the tolerance. The points thus
+concentrate where the envelopes bend or jump, right after the event and the delays, and
+the kept values are exact.
+"""
+
+import numpy as np
+
+from dycov.gfm import constants
+
+
+def _interpolation_error(
+    time_array: np.ndarray, values: np.ndarray, indices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # Interval of the kept points holding each point of the grid
+    segment = np.searchsorted(indices, np.arange(len(time_array)), side="right") - 1
+    segment = np.clip(segment, 0, len(indices) - 2)
+    left = indices[segment]
+    right = indices[segment + 1]
+
+    slope = (values[:, right] - values[:, left]) / (time_array[right] - time_array[left])
+    approximation = slope * (time_array - time_array[left]) + values[:, left]
+    error = np.abs(approximation - values)
+    # Signals that are undefined (NaN) on a whole interval are not refined
+    error = np.where(np.isnan(values) & np.isnan(approximation), 0, error)
+    return np.max(error, axis=0), segment
+
+
+def select_time_points(
+    time_array: np.ndarray,
+    signals: list[np.ndarray],
+    tolerance: float = constants.ADAPTIVE_GRID_TOLERANCE,
+    initial_step: int = constants.ADAPTIVE_GRID_INITIAL_STEP,
+    keep_times: tuple = (),
+) -> np.ndarray:
+    """
+    Selects the points of a time grid needed to reproduce the signals, by linear
+    interpolation, within the tolerance.
+
+    Parameters
+    ----------
+    time_array : np.ndarray
+        The increasing time grid on which the signals are evaluated.
+    signals : list[np.ndarray]
+        The signals, each with the length of the time grid.
+    tolerance : float, optional
+        The maximum absolute interpolation error allowed on any signal.
+    initial_step : int, optional
+        The spacing, in points of the grid, of the initial coarse selection.
+    keep_times : tuple, optional
+        Times whose first grid point at or after them is always kept (e.g. the event time).
+
+    Returns
+    -------
+    np.ndarray
+        The increasing indices of the selected points, including the first and last ones.
+    """
+    nb_points = len(time_array)
+    if nb_points <= 2:
+        return np.arange(nb_points)
+
+    values = np.vstack([np.reshape(signal, (-1, nb_points)) for signal in signals])
+    kept = np.searchsorted(time_array, keep_times, side="left")
+    indices = np.union1d(
+        np.r_[np.arange(0, nb_points, initial_step), nb_points - 1],
+        kept[kept < nb_points],
+    )
+
+    while True:
+        error, segment = _interpolation_error(time_array, values, indices)
+        to_split = np.unique(segment[~(error <= tolerance)])
+        # Intervals between adjacent points cannot be refined any further
+        to_split = to_split[indices[to_split + 1] - indices[to_split] > 1]
+        if len(to_split) == 0:
+            return indices
+        midpoints = (indices[to_split] + indices[to_split + 1]) // 2
+        indices = np.union1d(indices, midpoints)
@@ -131,9 +131,9 @@ class AmplitudeStep(GFMCalculator):
         if self._is_emt_flag:
             # Robust extraction of initial steady-state values handling both vector arrays and
             # scalar formats safely
-            initial_upper_val = q_up[0] if not np.isscalar(q_up) else q_up
-            initial_lower_val = q_down[0] if not np.isscalar(q_down) else q_down
-            initial_pcc_val = q_pcc[0] if not np.isscalar(q_pcc) else q_pcc
+            initial_upper_val = q_up[..., 0] if not np.isscalar(q_up) else q_up
+            initial_lower_val = q_down[..., 0] if not np.isscalar(q_down) else q_down
+            initial_pcc_val = q_pcc[..., 0] if not np.isscalar(q_pcc) else q_pcc
 
             iq_up_final = self._apply_delay(
                 self._emt_initial_delay, initial_upper_val, time_array, q_up
@@ -434,7 +434,7 @@ class AmplitudeStep(GFMCalculator):
         voltage_step = self._voltage_step / 100.0
         delta_iq = np.abs(voltage_step / (Xeff + self._Xgrid))
 
-        return max(
+        return np.maximum(
             self._final_allowed_tunnel_pn,
             self._final_allowed_tunnel_variation * delta_iq,
         )
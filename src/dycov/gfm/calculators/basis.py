@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Memoized time grids and basis functions of the GFM envelope calculators.
+
+All the operating conditions of a PCS are evaluated on the same few time grids, and the
+exponential and sinusoidal terms of the responses are evaluated again and again for the
+same rates: by the nominal, minimum and maximum variants of a calculation, by both step
+responses of a RoCoF event, and by the operating conditions sharing D, H and Xeff.
+
+`time_grid()` creates each grid once and shares it read-only. The other functions cache
+their results for each time array, by identity, and parameter values. Only read-only
+arrays, such as the grids and the arrays derived from them here, are cached, since a
+writable array may change under the same identity; for writable arrays, and for the
+parameter columns of a sweep, the functions are evaluated directly.
+"""
+
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+
+# Upper bound on the number of cached arrays (each one is a time series)
+_MAX_ENTRIES = 512
+
+_cache: OrderedDict = OrderedDict()
+
+
+def _read_only(value):
+    if isinstance(value, tuple):
+        return tuple(_read_only(item) for item in value)
+    value.setflags(write=False)
+    return value
+
+
+def _memoize(time_array: np.ndarray, key: tuple, compute: Callable):
+    if time_array.flags.writeable or any(np.ndim(value) for value in key[1:]):
+        return compute()
+
+    cache_key = (id(time_array),) + tuple(
+        value if isinstance(value, str) else float(value) for value in key
+    )
+    entry = _cache.get(cache_key)
+    # The identity check discards entries of arrays that no longer exist
+    if entry is not None and entry[0]() is time_array:
+        _cache.move_to_end(cache_key)
+        return entry[1]
+
+    value = _read_only(compute())
+    _cache[cache_key] = (weakref.ref(time_array), value)
+    if len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return value
+
+
+def clear_cache() -> None:
+    """Discards the cached time grids and basis functions."""
+    _cache.clear()
+    time_grid.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def time_grid(start: float, end: float, points: int) -> np.ndarray:
+    """Returns the evenly spaced time grid from start to end, shared read-only.
+
+    Parameters
+    ----------
+    start : float
+        The first time point.
+    end : float
+        The last time point.
+    points : int
+        The number of time points.
+
+    Returns
+    -------
+    np.ndarray
+        The read-only time grid.
+    """
+    return _read_only(np.linspace(start, end, points))
+
+
+def shifted(time_array: np.ndarray, origin: float) -> np.ndarray:
+    """Returns the time array measured from origin.
+
+    Parameters
+    ----------
+    time_array : np.ndarray
+        The time points.
+    origin : float
+        The new time origin.
+
+    Returns
+    -------
+    np.ndarray
+        time_array - origin.
+    """
+    return _memoize(time_array, ("shifted", origin), lambda: time_array - origin)
+
+
+def elapsed(time_array: np.ndarray, origin: float) -> np.ndarray:
+    """Returns the time elapsed since origin, zero before it.
+
+    Parameters
+    ----------
+    time_array : np.ndarray
+        The time points.
+    origin : float
+        The time from which the elapsed time is measured.
+
+    Returns
+    -------
+    np.ndarray
+        max(0, time_array - origin).
+    """
+    return _memoize(time_array, ("elapsed", origin), lambda: np.maximum(0, time_array - origin))
+
+
+def non_negative(time_array: np.ndarray) -> np.ndarray:
+    """Returns the non-negative time points.
+
+    Parameters
+    ----------
+    time_array : np.ndarray
+        The time points.
+
+    Returns
+    -------
+    np.ndarray
+        The time points greater than or equal to zero.
+    """
+    return _memoize(time_array, ("non_negative",), lambda: time_array[time_array >= 0])
+
+
+def exp_decay(rate: float, time_array: np.ndarray) -> np.ndarray:
+    """Returns the exponential decay exp(-rate * t).
+
+    Parameters
+    ----------
+    rate : float
+        The decay rate (e.g. epsilon * wn).
+    time_array : np.ndarray
+        The time points.
+
+    Returns
+    -------
+    np.ndarray
+        The decay evaluated on the time points.
+    """
+    return _memoize(time_array, ("exp_decay", rate), lambda: np.exp(-rate * time_array))
+
+
+def oscillation(frequency: float, time_array: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the cosine and sine terms of an oscillation of angular frequency wd.
+
+    Parameters
+    ----------
+    frequency : float
+        The angular frequency (e.g. the damped frequency wd).
+    time_array : np.ndarray
+        The time points.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        cos(frequency * t) and sin(frequency * t).
+    """
+    return _memoize(
+        time_array,
+        ("oscillation", frequency),
+        lambda: (np.cos(frequency * time_array), np.sin(frequency * time_array)),
+    )
+
+
+def time_function(time_array: np.ndarray, name: str, compute: Callable) -> np.ndarray:
+    """Returns a function of the time points that depends on nothing else.
+
+    Parameters
+    ----------
+    time_array : np.ndarray
+        The time points.
+    name : str
+        The unique name of the function.
+    compute : Callable
+        Evaluates the function on the time points, without arguments.
+
+    Returns
+    -------
+    np.ndarray
+        The function evaluated on the time points.
+    """
+    return _memoize(time_array, (name,), compute)
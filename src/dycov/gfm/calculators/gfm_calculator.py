@@ -8,9 +8,12 @@
 #     demiguelm@aia.es
 #
 
+from typing import Callable
+
 import numpy as np
 
 from dycov.gfm import constants
+from dycov.gfm.calculators import basis
 from dycov.gfm.parameters import GFMParameters
 
 
@@ -22,6 +25,11 @@ class GFMCalculator:
     for calculating response envelopes across various GFM events. It defines critical
     constants for parameter array indexing and establishes the mathematical threshold
     used for damping profile classification.
+
+    The calculations are written for a single (D, H, Xeff) set, but they also accept
+    these parameters as columns of shape (n, 1): every signal then broadcasts to an
+    (n, len(time_array)) array with one row per parameter set, which is how
+    `calculate_envelopes_sweep` evaluates a whole sweep at once.
     """
 
     # Constants representing the indices for parameter variation arrays
@@ -34,6 +42,10 @@ class GFMCalculator:
     # logic.
     _EPSILON_THRESHOLD = 1.0
 
+    # Number of parameter sets evaluated together by calculate_envelopes_sweep: larger blocks
+    # spill the intermediate (sets, time) arrays out of the CPU cache.
+    _SWEEP_BLOCK_SIZE = 16
+
     def __init__(self, gfm_params: GFMParameters) -> None:
         """
         Initializes the foundational GFMCalculator state using provided system parameters.
@@ -111,6 +123,116 @@ class GFMCalculator:
         """
         raise NotImplementedError
 
+    def calculate_envelopes_sweep(
+        self,
+        D: np.ndarray,
+        H: np.ndarray,
+        Xeff: np.ndarray,
+        time_array: np.ndarray,
+        event_time: float,
+    ) -> tuple[str, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculates the response envelopes of a whole sweep of parameter sets at once.
+
+        The D, H and Xeff values are broadcast against each other and passed to
+        `calculate_envelopes` as columns, so each step of the calculation runs on 2-D
+        arrays holding a block of parameter sets instead of once per parameter set.
+
+        Parameters
+        ----------
+        D : np.ndarray
+            The system damping factors, or a single value shared by all the sets.
+        H : np.ndarray
+            The system inertia constants, or a single value shared by all the sets.
+        Xeff : np.ndarray
+            The effective reactances, or a single value shared by all the sets.
+        time_array : np.ndarray
+            The continuous array of time points mapping the simulation window.
+        event_time : float
+            The absolute time (in seconds) at which the grid event triggers.
+
+        Returns
+        -------
+        tuple[str, np.ndarray, np.ndarray, np.ndarray]
+            A tuple containing the magnitude identifier and the PCC signal, upper and
+            lower envelopes, each of shape (number of sets, len(time_array)).
+        """
+        D, H, Xeff = (
+            np.reshape(values, (-1, 1)).astype(float)
+            for values in np.broadcast_arrays(
+                np.atleast_1d(D), np.atleast_1d(H), np.atleast_1d(Xeff)
+            )
+        )
+        if D.size == 0:
+            raise ValueError("The parameter sweep is empty")
+
+        signals = [np.empty((D.shape[0], len(time_array))) for _ in range(3)]
+        for start in range(0, D.shape[0], self._SWEEP_BLOCK_SIZE):
+            rows = slice(start, start + self._SWEEP_BLOCK_SIZE)
+            magnitude_name, *block_signals = self.calculate_envelopes(
+                D=D[rows], H=H[rows], Xeff=Xeff[rows], time_array=time_array, event_time=event_time
+            )
+            for signal, block_signal in zip(signals, block_signals):
+                signal[rows] = block_signal
+
+        pcc_signal, upper_envelope, lower_envelope = signals
+        return magnitude_name, pcc_signal, upper_envelope, lower_envelope
+
+    def _evaluate_by_damping(
+        self,
+        overdamped: np.ndarray,
+        overdamped_func: Callable,
+        underdamped_func: Callable,
+        *params: np.ndarray,
+    ) -> tuple:
+        """
+        Evaluates the overdamped formulas on the parameter sets classified as overdamped
+        and the underdamped formulas on the rest, each formula receiving only the sets
+        it is valid for.
+
+        Parameters
+        ----------
+        overdamped : np.ndarray
+            The damping classification: a boolean for a single parameter set, or a
+            column of shape (n, 1) for a sweep.
+        overdamped_func : Callable
+            The function of params implementing the overdamped response.
+        underdamped_func : Callable
+            The function of params implementing the underdamped response.
+        *params : np.ndarray
+            The parameters of both functions, scalars or columns shaped as overdamped.
+
+        Returns
+        -------
+        tuple
+            The results of the functions. For a sweep, each result holds one row per
+            parameter set; the rows of a result that one of the functions returns as
+            None are filled with NaN, and it stays None if both do.
+        """
+        if np.ndim(overdamped) == 0:
+            func = overdamped_func if overdamped else underdamped_func
+            return func(*params)
+
+        mask = np.ravel(overdamped)
+        merged = None
+        for rows, func in ((mask, overdamped_func), (~mask, underdamped_func)):
+            if not rows.any():
+                continue
+            results = func(*(param[rows] for param in params))
+            if merged is None:
+                merged = [None] * len(results)
+            for i, value in enumerate(results):
+                if value is None:
+                    continue
+                value = np.asarray(value)
+                value = np.broadcast_to(
+                    value, np.broadcast_shapes(value.shape, (np.count_nonzero(rows), 1))
+                )
+                if merged[i] is None:
+                    merged[i] = np.full((mask.size,) + value.shape[1:], np.nan)
+                merged[i][rows] = value
+        return tuple(merged)
+
     def _apply_delay(
         self,
         delay_time: float,
@@ -126,16 +248,22 @@ class GFMCalculator:
         reaching t = start_time, it forcibly inserts the `delayed_value` for the exact duration
         of the specified delay, pushing all subsequent original signal values forward in time.
 
+        On a uniform time array the signal is shifted by whole samples, rounding the delay up
+        to the next sample. On a non-uniform time array, the shifted signal is interpolated
+        linearly between the samples at t - delay_time.
+
         Parameters
         ----------
         delay_time : float
             The required temporal shift duration (in seconds) to delay the signal.
         delayed_value : float
             The static placeholder value to maintain throughout the duration of the delay.
+            For a 2-D signal, either one value per row or a value shared by all rows.
         time_array : np.ndarray
             The foundational time array defining the simulation steps.
         signal : np.ndarray
-            The source signal array targeted for the temporal shift.
+            The source signal array targeted for the temporal shift, shifted along its
+            last axis.
         start_time : float, optional
             The absolute time coordinate where the delay insertion should begin. Defaults to 0.0.
 
@@ -144,27 +272,119 @@ class GFMCalculator:
         np.ndarray
             The processed signal array, strictly truncated to match the original array length.
         """
-        # Step 1: Derive the simulation sample step (dt) assuming a uniformly spaced time array
-        dt = time_array[1] - time_array[0]
-
-        delay_samples = int(delay_time / dt) + 1
-
         # Safety Check: If the requested start time exceeds the simulation horizon, abort
         # modification
         if start_time > time_array[-1]:
             return signal
 
-        # Step 3: Isolate the precise index corresponding to the delay initiation threshold
+        # Step 1: Isolate the precise index corresponding to the delay initiation threshold
         start_idx = np.argmax(time_array >= start_time)
 
-        pre_delay_signal = signal[:start_idx]
-        delay_block = np.full(delay_samples, delayed_value)
-        post_delay_signal = signal[start_idx:]
+        # Step 2: Derive the simulation sample step (dt) of a uniformly spaced time array
+        steps = np.diff(time_array)
+        dt = steps[0]
+        if not np.allclose(steps, dt, rtol=1e-6, atol=0):
+            return self._apply_delay_non_uniform(
+                delay_time, delayed_value, time_array, signal, time_array[start_idx]
+            )
+
+        delay_samples = int(delay_time / dt) + 1
+
+        pre_delay_signal = signal[..., :start_idx]
+        delay_block = np.broadcast_to(
+            np.expand_dims(delayed_value, -1), signal.shape[:-1] + (delay_samples,)
+        )
+        post_delay_signal = signal[..., start_idx:]
 
         # blocks
-        combined_signal = np.concatenate((pre_delay_signal, delay_block, post_delay_signal))
+        combined_signal = np.concatenate(
+            (pre_delay_signal, delay_block, post_delay_signal), axis=-1
+        )
 
-        return combined_signal[: len(time_array)]
+        return combined_signal[..., : len(time_array)]
+
+    def _apply_delay_non_uniform(
+        self,
+        delay_time: float,
+        delayed_value: float,
+        time_array: np.ndarray,
+        signal: np.ndarray,
+        delay_start: float,
+    ) -> np.ndarray:
+        """
+        Applies the delay of `_apply_delay` on a non-uniform time array.
+
+        Parameters
+        ----------
+        delay_time : float
+            The temporal shift duration (in seconds).
+        delayed_value : float
+            The value held from delay_start during the delay, one per row for a 2-D signal.
+        time_array : np.ndarray
+            The increasing, non-uniform time array.
+        signal : np.ndarray
+            The source signal, shifted along its last axis.
+        delay_start : float
+            The time of the first sample where the delay starts.
+
+        Returns
+        -------
+        np.ndarray
+            The delayed signal, with the length of the time array.
+        """
+        # Signal at t - delay_time, evaluated with the same formula as np.interp
+        source_time = time_array - delay_time
+        idx = np.searchsorted(time_array, source_time, side="right") - 1
+        idx = np.clip(idx, 0, len(time_array) - 2)
+        t0 = time_array[idx]
+        y0 = signal[..., idx]
+        slope = (signal[..., idx + 1] - y0) / (time_array[idx + 1] - t0)
+        shifted_signal = slope * (source_time - t0) + y0
+
+        delayed_signal = np.where(
+            time_array < delay_start + delay_time,
+            np.expand_dims(delayed_value, -1),
+            shifted_signal,
+        )
+        return np.where(time_array < delay_start, signal, delayed_signal)
+
+    def _interpolate(
+        self, time_value: np.ndarray, time_array: np.ndarray, signal: np.ndarray
+    ) -> np.ndarray:
+        """
+        Linearly interpolates a signal at a given time, as np.interp, for a single signal
+        or for each row of a 2-D signal at its own time.
+
+        Parameters
+        ----------
+        time_value : np.ndarray
+            The time at which the signal is evaluated: a scalar, or a column of shape
+            (n, 1) with one time per row of the signal.
+        time_array : np.ndarray
+            The increasing time array of the signal.
+        signal : np.ndarray
+            The signal values, with time along the last axis.
+
+        Returns
+        -------
+        np.ndarray
+            The interpolated value, or a column with one value per row.
+        """
+        if np.ndim(time_value) == 0 and np.ndim(signal) == 1:
+            return np.interp(time_value, time_array, signal)
+
+        # Segment holding each time, evaluated with the same formula as np.interp
+        idx = np.searchsorted(time_array, time_value, side="right") - 1
+        idx = np.clip(idx, 0, len(time_array) - 2)
+        t0 = time_array[idx]
+        y0 = np.take_along_axis(signal, idx, axis=-1)
+        y1 = np.take_along_axis(signal, idx + 1, axis=-1)
+        slope = (y1 - y0) / (time_array[idx + 1] - t0)
+        value = slope * (time_value - t0) + y0
+
+        # Outside the time array, the signal is held at its end values
+        value = np.where(time_value <= time_array[0], signal[..., :1], value)
+        return np.where(time_value >= time_array[-1], signal[..., -1:], value)
 
     def _cut_signal(self, value_min: float, signal: np.ndarray, value_max: float) -> np.ndarray:
         """
@@ -251,12 +471,20 @@ class GFMCalculator:
         np.ndarray
             The synthesized, time-dependent tolerance boundary array.
         """
-        t_val = max(
+        t_val = np.maximum(
             self._final_allowed_tunnel_pn,
             self._final_allowed_tunnel_variation * p_peak,
         )
-        tunnel_exp = 1 - np.exp(
-            (-time_array + constants.TIME_TUNNEL_START_OFFSET) / constants.TIME_TUNNEL_EXP_TAU
+        tunnel_exp = basis.time_function(
+            time_array,
+            "time_tunnel",
+            lambda: (
+                1
+                - np.exp(
+                    (-time_array + constants.TIME_TUNNEL_START_OFFSET)
+                    / constants.TIME_TUNNEL_EXP_TAU
+                )
+            ),
         )
         tunnel = t_val * tunnel_exp
         return np.where(time_array < event_time, 0, tunnel)
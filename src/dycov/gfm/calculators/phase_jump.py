@@ -8,9 +8,12 @@
 #     demiguelm@aia.es
 #
 
+from functools import partial
+
 import numpy as np
 
 from dycov.gfm import constants
+from dycov.gfm.calculators import basis
 from dycov.gfm.calculators.gfm_calculator import GFMCalculator
 from dycov.gfm.parameters import GFMParameters
 from dycov.logging import dycov_logging
@@ -131,11 +134,15 @@ class PhaseJump(GFMCalculator):
         # Apply a uniform delay translation if utilizing the Electro-Magnetic Transients (EMT)
         # engine
         if self._is_emt_flag:
-            upper_envelope = self._apply_delay(self._emt_initial_delay, p_up[0], time_array, p_up)
+            upper_envelope = self._apply_delay(
+                self._emt_initial_delay, p_up[..., 0], time_array, p_up
+            )
             lower_envelope = self._apply_delay(
-                self._emt_initial_delay, p_down[0], time_array, p_down
+                self._emt_initial_delay, p_down[..., 0], time_array, p_down
+            )
+            pcc_signal = self._apply_delay(
+                self._emt_initial_delay, p_pcc[..., 0], time_array, p_pcc
             )
-            pcc_signal = self._apply_delay(self._emt_initial_delay, p_pcc[0], time_array, p_pcc)
         else:
             upper_envelope = p_up
             lower_envelope = p_down
@@ -201,12 +208,20 @@ class PhaseJump(GFMCalculator):
 
         # Dispatch bounding envelope generation based strictly on the nominal damping
         # classification
-        if epsilon_initial_check[self._ORIGINAL_PARAMS_IDX] > self._EPSILON_THRESHOLD:
-            delta_p_min = self._get_overdamped_delta_p_min(D, H, Xeff, time_array, event_time)
-            delta_p_max = self._get_overdamped_delta_p_max(D, H, Xeff, time_array, event_time)
-        else:
-            delta_p_min = self._get_underdamped_delta_p_min(D, H, Xeff, time_array, event_time)
-            delta_p_max = self._get_underdamped_delta_p_max(D, H, Xeff, time_array, event_time)
+        delta_p_min, delta_p_max = self._evaluate_by_damping(
+            epsilon_initial_check[self._ORIGINAL_PARAMS_IDX] > self._EPSILON_THRESHOLD,
+            lambda D, H, Xeff: (
+                self._get_overdamped_delta_p_min(D, H, Xeff, time_array, event_time),
+                self._get_overdamped_delta_p_max(D, H, Xeff, time_array, event_time),
+            ),
+            lambda D, H, Xeff: (
+                self._get_underdamped_delta_p_min(D, H, Xeff, time_array, event_time),
+                self._get_underdamped_delta_p_max(D, H, Xeff, time_array, event_time),
+            ),
+            D,
+            H,
+            Xeff,
+        )
 
         # Register configurations internally for state evaluation tracking
         self._d_vals = d_array
@@ -364,10 +379,14 @@ class PhaseJump(GFMCalculator):
             A tuple resolving the required delta_p array, the peak response magnitude,
             and the associated epsilon value.
         """
-        if epsilon_initial_check > self._EPSILON_THRESHOLD:
-            return self._get_overdamped_delta_p(D, H, Xeff, time_array, event_time)
-        else:
-            return self._get_underdamped_delta_p(D, H, Xeff, time_array, event_time)
+        return self._evaluate_by_damping(
+            epsilon_initial_check > self._EPSILON_THRESHOLD,
+            partial(self._get_overdamped_delta_p, time_array=time_array, event_time=event_time),
+            partial(self._get_underdamped_delta_p, time_array=time_array, event_time=event_time),
+            D,
+            H,
+            Xeff,
+        )
 
     def _get_overdamped_delta_p_base(
         self, D: float, H: float, Xeff: float, time_array: np.ndarray
@@ -406,10 +425,12 @@ class PhaseJump(GFMCalculator):
         B = -A
 
         # Deconstruct the solution into its elemental exponential decay responses
-        term1 = 2 * H * A * (1 - alpha * np.exp(-alpha * time_array))
-        term2 = 2 * H * B * (1 - beta * np.exp(-beta * time_array))
-        term3 = D * A * np.exp(-alpha * time_array)
-        term4 = D * B * np.exp(-beta * time_array)
+        exp_alpha = basis.exp_decay(alpha, time_array)
+        exp_beta = basis.exp_decay(beta, time_array)
+        term1 = 2 * H * A * (1 - alpha * exp_alpha)
+        term2 = 2 * H * B * (1 - beta * exp_beta)
+        term3 = D * A * exp_alpha
+        term4 = D * B * exp_beta
 
         # Synthesize the final aggregated power deviation solution
         delta_p1 = (p_peak / (2 * H)) * (term1 + term2 + term3 + term4)
@@ -543,9 +564,8 @@ class PhaseJump(GFMCalculator):
         wd = wn * np.sqrt(1 - epsilon**2)
 
         # Synthesize components: An exponential decay boundary bounding sinusoidal oscillation
-        term1 = np.exp(-epsilon * wn * time_array)
-        term2 = np.cos(wd * time_array)
-        term3 = np.sin(wd * time_array)
+        term1 = basis.exp_decay(epsilon * wn, time_array)
+        term2, term3 = basis.oscillation(wd, time_array)
 
         # Aggregate the complete dynamic response
         delta_p1 = term1 * (term2 - (epsilon * wn - 1) / wd * term3) * p_peak
@@ -610,7 +630,7 @@ class PhaseJump(GFMCalculator):
 
         # Formulate pure decay coefficient mapping bounding limits explicitly
         sigma = D / (4 * H)
-        delta_p_margined = p_peak * (1 - self._margin_low) * np.exp(-sigma * time_array)
+        delta_p_margined = p_peak * (1 - self._margin_low) * basis.exp_decay(sigma, time_array)
 
         delta_p_delayed = self._apply_delay(
             constants.UNDERDAMPED_MIN_DELAY_S, 0, time_array, delta_p_margined
@@ -647,10 +667,13 @@ class PhaseJump(GFMCalculator):
 
         # Formulate pure decay coefficient tracking extreme upper bounds
         sigma = D / (4 * H)
-        delta_p_margined = p_peak * (1 + self._margin_high) * np.exp(-sigma * time_array)
+        delta_p_margined = p_peak * (1 + self._margin_high) * basis.exp_decay(sigma, time_array)
 
         delta_p_delayed = self._apply_delay(
-            constants.UNDERDAMPED_MAX_DELAY_S, delta_p_margined[0], time_array, delta_p_margined
+            constants.UNDERDAMPED_MAX_DELAY_S,
+            delta_p_margined[..., 0],
+            time_array,
+            delta_p_margined,
         )
         delta_p = np.where(time_array < event_time, 0, delta_p_delayed)
         return delta_p
@@ -672,7 +695,7 @@ class PhaseJump(GFMCalculator):
             The statically extracted boundary limit required for evaluation constraints.
         """
         p_peak = p_peak_array[self._ORIGINAL_PARAMS_IDX]
-        return max(
+        return np.maximum(
             self._final_allowed_tunnel_pn,
             self._final_allowed_tunnel_variation * p_peak,
         )
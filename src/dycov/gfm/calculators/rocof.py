@@ -8,8 +8,12 @@
 #     demiguelm@aia.es
 #
 
+from functools import partial
+from typing import Callable
+
 import numpy as np
 
+from dycov.gfm.calculators import basis
 from dycov.gfm.calculators.gfm_calculator import GFMCalculator
 from dycov.gfm.parameters import GFMParameters
 from dycov.logging import dycov_logging
@@ -111,11 +115,15 @@ class RoCoF(GFMCalculator):
 
         # Apply a final uniform delay if the simulation utilizes the EMT engine
         if self._is_emt_flag:
-            upper_envelope = self._apply_delay(self._emt_initial_delay, p_up[0], time_array, p_up)
+            upper_envelope = self._apply_delay(
+                self._emt_initial_delay, p_up[..., 0], time_array, p_up
+            )
             lower_envelope = self._apply_delay(
-                self._emt_initial_delay, p_down[0], time_array, p_down
+                self._emt_initial_delay, p_down[..., 0], time_array, p_down
+            )
+            pcc_signal = self._apply_delay(
+                self._emt_initial_delay, p_pcc[..., 0], time_array, p_pcc
             )
-            pcc_signal = self._apply_delay(self._emt_initial_delay, p_pcc[0], time_array, p_pcc)
         else:
             upper_envelope = p_up
             lower_envelope = p_down
@@ -213,20 +221,67 @@ class RoCoF(GFMCalculator):
         wn = np.sqrt(self._base_angular_frequency * u_prod / (2 * H * x_total))
         epsilon = D / (4 * H * wn)
 
-        calc_func = (
-            self._get_overdamped_delta_p_base
-            if epsilon >= self._EPSILON_THRESHOLD
-            else self._get_underdamped_delta_p_base
+        return self._evaluate_by_damping(
+            epsilon >= self._EPSILON_THRESHOLD,
+            partial(
+                self._superpose_step_responses,
+                self._get_overdamped_delta_p_base,
+                time_array=time_array,
+                event_time=event_time,
+            ),
+            partial(
+                self._superpose_step_responses,
+                self._get_underdamped_delta_p_base,
+                time_array=time_array,
+                event_time=event_time,
+            ),
+            D,
+            H,
+            x_total,
         )
 
+    def _superpose_step_responses(
+        self,
+        calc_func: Callable,
+        D: float,
+        H: float,
+        x_total: float,
+        time_array: np.ndarray,
+        event_time: float,
+    ) -> tuple[np.ndarray, float, float]:
+        """
+        Models the finite duration of the event as the difference of two step responses,
+        triggered at the start and at the end of the event.
+
+        Parameters
+        ----------
+        calc_func : Callable
+            The step response of the damping profile (overdamped or underdamped).
+        D : float
+            The specific damping factor variation being processed.
+        H : float
+            The specific inertia constant variation being processed.
+        x_total : float
+            The total aggregated reactance of the system.
+        time_array : np.ndarray
+            The array of time points corresponding to the simulation.
+        event_time : float
+            The time at which the event initiates.
+
+        Returns
+        -------
+        tuple[np.ndarray, float, float]
+            A tuple containing the resultant delta_p waveform, its absolute peak
+            value, and the derived system response time.
+        """
         # A finite duration RoCoF event is modeled by superimposing two independent step responses
         rocof_stop_time = event_time + self._rocof_duration
 
-        time_event_start = time_array - event_time
+        time_event_start = basis.shifted(time_array, event_time)
         p1, p_peak, t_response = calc_func(D, H, x_total, time_event_start)
         p1 = np.where(time_array < event_time, 0, p1)
 
-        time_event_stop = time_array - rocof_stop_time
+        time_event_stop = basis.shifted(time_array, rocof_stop_time)
         p2, _, _ = calc_func(D, H, x_total, time_event_stop)
         p2 = np.where(time_array < rocof_stop_time, 0, p2)
 
@@ -289,22 +344,22 @@ class RoCoF(GFMCalculator):
         alpha1 = wn * (epsilon + np.sqrt(epsilon**2 - 1))
         alpha2 = wn * (epsilon - np.sqrt(epsilon**2 - 1))
 
-        t_rel = time_array[time_array >= 0]
+        t_rel = basis.non_negative(time_array)
 
-        term1 = (B_coeff * alpha1 - C_coeff) * np.exp(-alpha1 * t_rel) / (alpha1 - alpha2)
-        term2 = (B_coeff * alpha2 - C_coeff) * np.exp(-alpha2 * t_rel) / (alpha1 - alpha2)
+        term1 = (B_coeff * alpha1 - C_coeff) * basis.exp_decay(alpha1, t_rel) / (alpha1 - alpha2)
+        term2 = (B_coeff * alpha2 - C_coeff) * basis.exp_decay(alpha2, t_rel) / (alpha1 - alpha2)
         term3 = (D_coeff / self._t_pll) * np.exp(-t_rel / self._t_pll)
 
         delta_p_rel = A_coeff + term1 - term2 + term3
 
-        delta_p = np.zeros_like(time_array)
-        delta_p[time_array >= 0] = delta_p_rel
+        delta_p = np.zeros(np.shape(delta_p_rel)[:-1] + time_array.shape)
+        delta_p[..., time_array >= 0] = delta_p_rel
 
         p_peak = abs(-self._rocof_value * (2 * H + D * self._t_pll))
 
         # The theoretical response time is approximated as 4x the slowest time constant of the
         # system
-        t_response = 4 * max(1 / alpha1, 1 / alpha2, self._t_pll)
+        t_response = 4 * np.maximum(np.maximum(1 / alpha1, 1 / alpha2), self._t_pll)
 
         return -delta_p, p_peak, t_response
 
@@ -357,11 +412,13 @@ class RoCoF(GFMCalculator):
             )
         ) / common_denom
 
-        t_rel = time_array[time_array >= 0]
+        t_rel = basis.non_negative(time_array)
 
         term_pll = (B_coeff / self._t_pll) * np.exp(-t_rel / self._t_pll)
-        term_cos = np.exp(-epsilon * wn * t_rel) * np.cos(wd * t_rel)
-        term_sin = np.exp(-epsilon * wn * t_rel) * np.sin(wd * t_rel)
+        exp_term = basis.exp_decay(epsilon * wn, t_rel)
+        cos_term, sin_term = basis.oscillation(wd, t_rel)
+        term_cos = exp_term * cos_term
+        term_sin = exp_term * sin_term
 
         delta_p_rel = (
             A_coeff
@@ -370,8 +427,8 @@ class RoCoF(GFMCalculator):
             + ((D_coeff - C_coeff * epsilon * wn) / wd) * term_sin
         )
 
-        delta_p = np.zeros_like(time_array)
-        delta_p[time_array >= 0] = delta_p_rel
+        delta_p = np.zeros(np.shape(delta_p_rel)[:-1] + time_array.shape)
+        delta_p[..., time_array >= 0] = delta_p_rel
 
         R_coeff = np.sqrt(C_coeff**2 + ((D_coeff - C_coeff * epsilon * wn) / wd) ** 2)
         p_peak = abs(A_coeff + B_coeff / self._t_pll + R_coeff)
@@ -443,9 +500,10 @@ class RoCoF(GFMCalculator):
         clamp_start_time = event_time + t_response
         rocof_stop_time = event_time + self._rocof_duration
 
-        if clamp_start_time < rocof_stop_time:
-            mask = (time_array >= clamp_start_time) & (time_array < rocof_stop_time)
-            pcc_steady_value = np.interp(clamp_start_time, time_array, p_pcc)
+        clamped = clamp_start_time < rocof_stop_time
+        if np.any(clamped):
+            mask = (time_array >= clamp_start_time) & (time_array < rocof_stop_time) & clamped
+            pcc_steady_value = self._interpolate(clamp_start_time, time_array, p_pcc)
             p_up_unlimited = np.where(mask, pcc_steady_value + tunnel_val, p_up_unlimited)
             p_down_unlimited = np.where(mask, pcc_steady_value - tunnel_val, p_down_unlimited)
 
@@ -458,12 +516,12 @@ class RoCoF(GFMCalculator):
             if (
                 sign > 0
             ):  # With power dropping, ensure the lower envelope recovers strictly upwards.
-                clamp_val = p_down_unlimited[idx_before_recovery]
+                clamp_val = p_down_unlimited[..., idx_before_recovery, None]
                 p_down_unlimited = np.where(
                     mask_post_recovery, np.maximum(p_down_unlimited, clamp_val), p_down_unlimited
                 )
             else:  # With power rising, ensure the upper envelope recovers strictly downwards.
-                clamp_val = p_up_unlimited[idx_before_recovery]
+                clamp_val = p_up_unlimited[..., idx_before_recovery, None]
                 p_up_unlimited = np.where(
                     mask_post_recovery, np.minimum(p_up_unlimited, clamp_val), p_up_unlimited
                 )
@@ -500,7 +558,7 @@ class RoCoF(GFMCalculator):
             The mathematically derived static tunnel value.
         """
         p_peak = p_peak_array[self._ORIGINAL_PARAMS_IDX]
-        return max(
+        return np.maximum(
             self._final_allowed_tunnel_pn,
             self._final_allowed_tunnel_variation * p_peak,
         )
@@ -13,6 +13,7 @@ from typing import Optional
 import numpy as np
 
 from dycov.gfm import constants
+from dycov.gfm.calculators import basis
 from dycov.gfm.calculators.gfm_calculator import GFMCalculator
 from dycov.gfm.parameters import GFMParameters
 from dycov.logging import dycov_logging
@@ -170,14 +171,16 @@ class SCRJump(GFMCalculator):
         inertia_variations = np.array([H, H * self._min_ratio, H * self._max_ratio])
 
         num_variations = len(damping_variations)
-        num_time_points = len(time_array)
+        # Scalar parameters, or a column of parameter sets (one row each) for a sweep
+        params_shape = np.broadcast_shapes(np.shape(D), np.shape(H), np.shape(Xeff))
+        signal_shape = np.broadcast_shapes(params_shape, time_array.shape)
 
         # Pre-allocate output arrays for processing efficiency.
-        delta_p_results = np.zeros((num_variations, num_time_points))
-        min_envelope_results = np.full((num_variations, num_time_points), np.nan)
-        max_envelope_results = np.full((num_variations, num_time_points), np.nan)
-        peak_power_results = np.zeros(num_variations)
-        epsilon_results = np.zeros(num_variations)
+        delta_p_results = np.zeros((num_variations,) + signal_shape)
+        min_envelope_results = np.full((num_variations,) + signal_shape, np.nan)
+        max_envelope_results = np.full((num_variations,) + signal_shape, np.nan)
+        peak_power_results = np.zeros((num_variations,) + params_shape)
+        epsilon_results = np.zeros((num_variations,) + params_shape)
 
         for i in range(num_variations):
             delta_p, delta_p_min, delta_p_max, p_peak, epsilon = (
@@ -185,15 +188,15 @@ class SCRJump(GFMCalculator):
                     damping_variations[i], inertia_variations[i], Xeff, time_array, event_time
                 )
             )
-            delta_p_results[i, :] = delta_p
+            delta_p_results[i] = delta_p
             peak_power_results[i] = p_peak
             epsilon_results[i] = epsilon
 
             # Isolate and store Min/Max envelopes strictly for underdamped evaluations.
             if delta_p_min is not None:
-                min_envelope_results[i, :] = delta_p_min
+                min_envelope_results[i] = delta_p_min
             if delta_p_max is not None:
-                max_envelope_results[i, :] = delta_p_max
+                max_envelope_results[i] = delta_p_max
 
         self._d_vals = damping_variations
         self._h_vals = inertia_variations
@@ -202,17 +205,25 @@ class SCRJump(GFMCalculator):
         # Evaluate internal consistency: Ensure all evaluated scenarios share the same damping
         # archetype.
         is_overdamped = epsilon_results >= 1
-        if not np.all(is_overdamped == is_overdamped[0]):
+        is_inconsistent = np.any(is_overdamped != is_overdamped[0], axis=0)
+        if np.any(is_inconsistent):
             # If behavior diverges (e.g., nominal is overdamped but max variation drops to
             # underdamped), flag it.
-            eps_str = np.array2string(epsilon_results, precision=2)
-            d_str = np.array2string(damping_variations, precision=2)
-            h_str = np.array2string(inertia_variations, precision=2)
+            reported = (epsilon_results, damping_variations, inertia_variations, is_overdamped)
+            if np.ndim(is_inconsistent) > 0:
+                # For a sweep, report only the inconsistent parameter sets
+                reported = tuple(
+                    np.broadcast_to(values, is_overdamped.shape)[:, is_inconsistent]
+                    for values in reported
+                )
+            eps_str = np.array2string(reported[0], precision=2)
+            d_str = np.array2string(reported[1], precision=2)
+            h_str = np.array2string(reported[2], precision=2)
 
             msg = (
                 f"Inconsistent damping behavior across parameter variations.\n"
                 f"Epsilon values: {eps_str}.\n"
-                f"Is Overdamped (>=1): {is_overdamped}.\n"
+                f"Is Overdamped (>=1): {reported[3]}.\n"
                 f"D values: {d_str}. H values: {h_str}.\n"
                 f"Variations must maintain the same damping type"
                 " (all overdamped or all underdamped)."
@@ -282,7 +293,6 @@ class SCRJump(GFMCalculator):
         time_array: np.ndarray,
         event_time: float,
         tunnel_value: float,
-        is_overdamped: bool,
         delta_p_at_event: float,
         delta_p_base: np.ndarray,
     ) -> tuple[np.ndarray, np.ndarray]:
@@ -301,11 +311,11 @@ class SCRJump(GFMCalculator):
         event_time : float
             The absolute time at which the event occurs.
         tunnel_value : float
-            The static tolerance margin applied to the operational band.
-        is_overdamped : bool
-            Flag denoting if the current system response is classified as overdamped.
+            The static tolerance margin applied to the operational band (one value per trace
+            when delta_p holds several traces).
         delta_p_at_event : float
-            Instantaneous delta_p value immediately post-event utilized to infer vector direction.
+            Instantaneous delta_p value immediately post-event utilized to infer vector direction
+            (one value per row for a sweep).
         delta_p_base : np.ndarray
             The nominal baseline delta_p waveform.
 
@@ -314,53 +324,43 @@ class SCRJump(GFMCalculator):
         tuple[np.ndarray, np.ndarray]
             A tuple containing the synthesized upper and lower envelope traces.
         """
-        if delta_p_at_event > 0:
-            # Case 1: Trajectory indicates a power surge (positive delta_p).
-            upper_trace = (
-                self._initial_active_power + delta_p * (1 + self._margin_high) + tunnel_value
-            )
-            lower_trace = (
-                self._initial_active_power + delta_p * (1 - self._margin_low) - tunnel_value
-            )
-
-            power_at_50_percent = self._initial_active_power + np.where(
-                time_array >= event_time, delta_p_base * 0.5 + 0.005, delta_p
-            )
-
-            time_mask = (time_array >= event_time) & (time_array <= constants.SIMULATION_END_TIME)
-            condition = time_mask & (lower_trace > self._pmax_mois_tunnel)
+        # Case 1: Trajectory indicates a power surge (positive delta_p).
+        # Case 2: Trajectory indicates a power drop (negative delta_p).
+        # Both are evaluated and selected per row, so a sweep may mix them.
+        surge = np.expand_dims(np.asarray(delta_p_at_event) > 0, -1)
+
+        upper_trace = (
+            self._initial_active_power
+            + delta_p * np.where(surge, 1 + self._margin_high, 1 - self._margin_high)
+            + tunnel_value
+        )
+        lower_trace = (
+            self._initial_active_power
+            + delta_p * np.where(surge, 1 - self._margin_low, 1 + self._margin_low)
+            - tunnel_value
+        )
 
-            if is_overdamped:
-                lower_trace = self._modify_envelope(
-                    lower_trace, power_at_50_percent, time_array, event_time
-                )
-                lower_trace = np.where(condition, self._pmax_mois_tunnel, lower_trace)
-            else:  # Underdamped execution branch
-                lower_trace = self._modify_envelope(
-                    lower_trace, power_at_50_percent, time_array, event_time
-                )
-                lower_trace = np.where(condition, self._pmax_mois_tunnel, lower_trace)
-        else:
-            # Case 2: Trajectory indicates a power drop (negative delta_p).
-            upper_trace = (
-                self._initial_active_power + delta_p * (1 - self._margin_high) + tunnel_value
-            )
-            lower_trace = (
-                self._initial_active_power + delta_p * (1 + self._margin_low) - tunnel_value
-            )
+        power_at_50_percent = self._initial_active_power + np.where(
+            time_array >= event_time, delta_p_base * 0.5 + 0.005, delta_p
+        )
 
-            power_at_50_percent = self._initial_active_power + np.where(
-                time_array >= event_time, delta_p_base * 0.5 + 0.005, delta_p
-            )
+        time_mask = (time_array >= event_time) & (time_array <= constants.SIMULATION_END_TIME)
 
-            time_mask = (time_array >= event_time) & (time_array <= constants.SIMULATION_END_TIME)
-            condition = time_mask & (upper_trace < self._pmin_mois_tunnel)
+        # Power surge: the lower trace is anchored to 50% of the change and capped by the
+        # saturation tunnel (the same for overdamped and underdamped responses).
+        surge_condition = time_mask & (lower_trace > self._pmax_mois_tunnel)
+        surge_lower_trace = np.where(
+            surge_condition,
+            self._pmax_mois_tunnel,
+            self._modify_envelope(lower_trace, power_at_50_percent, time_array, event_time),
+        )
+        # Power drop: the upper trace is floored by the saturation tunnel; the artificial
+        # flattening is bypassed to preserve the natural exponential decay.
+        drop_condition = time_mask & (upper_trace < self._pmin_mois_tunnel)
+        drop_upper_trace = np.where(drop_condition, self._pmin_mois_tunnel, upper_trace)
 
-            if is_overdamped:
-                # Artificial flattening constraint bypassed to preserve natural exponential decay
-                upper_trace = np.where(condition, self._pmin_mois_tunnel, upper_trace)
-            else:  # Underdamped execution branch
-                upper_trace = np.where(condition, self._pmin_mois_tunnel, upper_trace)
+        lower_trace = np.where(surge, surge_lower_trace, lower_trace)
+        upper_trace = np.where(surge, upper_trace, drop_upper_trace)
 
         # Enforce hard limits restricting signals to physical hardware capabilities.
         final_upper_trace = self._limit_signal(upper_trace)
@@ -474,6 +474,9 @@ class SCRJump(GFMCalculator):
             overdamped).
         p_peak_array : np.ndarray
             A 1D array reflecting the peak power deviations linked to each delta_p execution.
+
+        For a sweep, each array has an additional axis after the variation axis, with one
+        row per parameter set, and the returned signals have one row per parameter set.
         time_array : np.ndarray
             The array of time points corresponding to the simulation.
         event_time : float
@@ -485,65 +488,52 @@ class SCRJump(GFMCalculator):
             A tuple outputting the final consolidated PCC signal, along with the max upper
             and min lower envelopes.
         """
-        upper_trace_candidates = []
-        lower_trace_candidates = []
-        upper_traces_from_max_env = []
-        lower_traces_from_max_env = []
-        upper_traces_from_min_env = []
-        lower_traces_from_min_env = []
-
-        delta_p_nominal = delta_p_array[0, :]
+        delta_p_nominal = delta_p_array[0]
         event_index = np.searchsorted(time_array, event_time, side="right")
         delta_p_at_event = (
-            delta_p_nominal[event_index] if event_index < len(delta_p_nominal) else 0
+            delta_p_nominal[..., event_index]
+            if event_index < len(time_array)
+            else np.zeros(delta_p_nominal.shape[:-1])
         )
 
-        for i in range(delta_p_array.shape[0]):
-            current_delta_p = delta_p_array[i, :]
-            current_peak_power = p_peak_array[i]
-            tunnel_value = self._get_tunnel(current_peak_power)
-
-            upper_trace, lower_trace = self._get_envelope_traces(
-                delta_p=current_delta_p,
+        # All the variations are processed at once, with one tunnel value per trace
+        tunnel_value = np.reshape(self._get_tunnel(p_peak_array), delta_p_array.shape[:-1] + (1,))
+        upper_trace_candidates, lower_trace_candidates = self._get_envelope_traces(
+            delta_p=delta_p_array,
+            time_array=time_array,
+            event_time=event_time,
+            tunnel_value=tunnel_value,
+            delta_p_at_event=delta_p_at_event,
+            delta_p_base=delta_p_nominal,
+        )
+        upper_candidates = [upper_trace_candidates]
+        lower_candidates = [lower_trace_candidates]
+
+        # The exponential envelopes are NaN for overdamped responses; the traces derived
+        # from them are masked out (NaN) on those rows and ignored by the merge below. They
+        # only count when the last variation is also underdamped.
+        is_underdamped = ~np.isnan(delta_p_max_env_array[..., 0])
+        last_is_underdamped = is_underdamped[-1]
+        if np.any(is_underdamped):
+            selected = np.expand_dims(is_underdamped & last_is_underdamped, -1)
+            upper_from_max, _ = self._get_envelope_traces(
+                delta_p=delta_p_max_env_array,
                 time_array=time_array,
                 event_time=event_time,
                 tunnel_value=tunnel_value,
-                is_overdamped=np.isnan(delta_p_min_env_array[i, 0]),
                 delta_p_at_event=delta_p_at_event,
                 delta_p_base=delta_p_nominal,
             )
-            upper_trace_candidates.append(upper_trace)
-            lower_trace_candidates.append(lower_trace)
-
-            # If underdamped, execute and extract traces strictly derived from the upper
-            # exponential bounds.
-            if not np.isnan(delta_p_max_env_array[i, 0]):
-                upper_from_max, lower_from_max = self._get_envelope_traces(
-                    delta_p=delta_p_max_env_array[i, :],
-                    time_array=time_array,
-                    event_time=event_time,
-                    tunnel_value=tunnel_value,
-                    is_overdamped=np.isnan(delta_p_max_env_array[i, 0]),
-                    delta_p_at_event=delta_p_at_event,
-                    delta_p_base=delta_p_nominal,
-                )
-                upper_traces_from_max_env.append(upper_from_max)
-                lower_traces_from_max_env.append(lower_from_max)
-
-            # If underdamped, execute and extract traces strictly derived from the lower
-            # exponential bounds.
-            if not np.isnan(delta_p_min_env_array[i, 0]):
-                upper_from_min, lower_from_min = self._get_envelope_traces(
-                    delta_p=delta_p_min_env_array[i, :],
-                    time_array=time_array,
-                    event_time=event_time,
-                    tunnel_value=tunnel_value,
-                    is_overdamped=np.isnan(delta_p_min_env_array[i, 0]),
-                    delta_p_at_event=delta_p_at_event,
-                    delta_p_base=delta_p_nominal,
-                )
-                upper_traces_from_min_env.append(upper_from_min)
-                lower_traces_from_min_env.append(lower_from_min)
+            _, lower_from_min = self._get_envelope_traces(
+                delta_p=delta_p_min_env_array,
+                time_array=time_array,
+                event_time=event_time,
+                tunnel_value=tunnel_value,
+                delta_p_at_event=delta_p_at_event,
+                delta_p_base=delta_p_nominal,
+            )
+            upper_candidates.append(np.where(selected, upper_from_max, np.nan))
+            lower_candidates.append(np.where(selected, lower_from_min, np.nan))
 
         # Reconstruct the expected nominal power signal traversing the Point of Common Coupling.
         power_at_pcc = self._initial_active_power + delta_p_nominal
@@ -551,105 +541,79 @@ class SCRJump(GFMCalculator):
 
         # Isolate the anchor line representing exactly 50% of the active power deviation.
         power_at_50_percent = self._initial_active_power + np.where(
-            time_array >= time_array[0], current_delta_p * 0.5, current_delta_p
+            time_array >= time_array[0], delta_p_array[-1] * 0.5, delta_p_array[-1]
         )
         power_at_50_percent = self._limit_signal(power_at_50_percent)
+        # The anchor line only takes part in the merge when the last variation is underdamped
+        power_at_50_percent = np.where(
+            np.expand_dims(last_is_underdamped, -1), power_at_50_percent, np.nan
+        )
 
         # Merge and aggregate all viable candidate traces to finalize the bounding structures.
-        if np.isnan(delta_p_max_env_array[i, 0]):
-            upper_matrix = np.vstack(upper_trace_candidates)
-            combined_upper_envelope = np.nanmax(upper_matrix, axis=0)
-        else:
-            upper_matrix = np.vstack(
-                (upper_trace_candidates, [power_at_50_percent], upper_traces_from_max_env)
-            )
+        anchor = power_at_50_percent[np.newaxis]
+        upper_matrix = np.concatenate(upper_candidates + [anchor])
         combined_upper_envelope = np.nanmax(upper_matrix, axis=0)
 
-        if np.isnan(delta_p_min_env_array[i, 0]):
-            lower_matrix = np.vstack(lower_trace_candidates)
-        else:
-            lower_matrix = np.vstack(
-                (lower_trace_candidates, [power_at_50_percent], lower_traces_from_min_env)
-            )
+        lower_matrix = np.concatenate(lower_candidates + [anchor])
         combined_lower_envelope = np.nanmin(lower_matrix, axis=0)
 
         upper_envelope = combined_upper_envelope
         lower_envelope = combined_lower_envelope
 
         # Enforce temporal delays applicable strictly to Electro-Magnetic Transient (EMT)
-        # simulations.
-        if (self._initial_active_power > 0 and delta_p_at_event > 0) or (
-            self._initial_active_power < 0 and delta_p_at_event > 0
-        ):
-            if self._is_emt_flag:
-                # Robust extraction handling both vector arrays and isolated scalar values safely.
-                initial_upper_val = (
-                    np.max(upper_envelope) if not np.isscalar(upper_envelope) else upper_envelope
-                )
-                initial_lower_val = (
-                    lower_envelope[0] if not np.isscalar(lower_envelope) else lower_envelope
-                )
-                initial_pcc_val = (
-                    np.max(power_at_pcc) if not np.isscalar(power_at_pcc) else power_at_pcc
-                )
-
-                upper_envelope = self._apply_delay(
-                    self._emt_initial_delay, initial_upper_val, time_array, upper_envelope
-                )
-                lower_envelope = self._apply_delay(
-                    self._emt_initial_delay + constants.SCR_BOUND_DELAY_S,
-                    initial_lower_val,
-                    time_array,
-                    lower_envelope,
-                )
-                power_at_pcc = self._apply_delay(
-                    self._emt_initial_delay, initial_pcc_val, time_array, power_at_pcc
-                )
-            else:
-                initial_lower_val = (
-                    lower_envelope[0] if not np.isscalar(lower_envelope) else lower_envelope
-                )
-                lower_envelope = self._apply_delay(
-                    constants.SCR_BOUND_DELAY_S,
-                    initial_lower_val,
-                    time_array,
-                    lower_envelope,
-                )
+        # simulations. Both cases are computed and selected per row, so a sweep may mix them.
+        is_rising = ((self._initial_active_power > 0) & (delta_p_at_event > 0)) | (
+            (self._initial_active_power < 0) & (delta_p_at_event > 0)
+        )
+        rising = np.expand_dims(is_rising, -1)
+        if self._is_emt_flag:
+            rising_upper = self._apply_delay(
+                self._emt_initial_delay,
+                np.max(upper_envelope, axis=-1),
+                time_array,
+                upper_envelope,
+            )
+            rising_lower = self._apply_delay(
+                self._emt_initial_delay + constants.SCR_BOUND_DELAY_S,
+                lower_envelope[..., 0],
+                time_array,
+                lower_envelope,
+            )
+            falling_upper = self._apply_delay(
+                self._emt_initial_delay + constants.SCR_BOUND_DELAY_S,
+                upper_envelope[..., 0],
+                time_array,
+                upper_envelope,
+            )
+            falling_lower = self._apply_delay(
+                self._emt_initial_delay,
+                np.min(lower_envelope, axis=-1),
+                time_array,
+                lower_envelope,
+            )
+            initial_pcc_val = np.where(
+                is_rising, np.max(power_at_pcc, axis=-1), np.min(power_at_pcc, axis=-1)
+            )
+            power_at_pcc = self._apply_delay(
+                self._emt_initial_delay, initial_pcc_val, time_array, power_at_pcc
+            )
         else:
-            if self._is_emt_flag:
-                # Robust extraction handling both vector arrays and isolated scalar values safely.
-                initial_upper_val = (
-                    upper_envelope[0] if not np.isscalar(upper_envelope) else upper_envelope
-                )
-                initial_lower_val = (
-                    np.min(lower_envelope) if not np.isscalar(lower_envelope) else lower_envelope
-                )
-                initial_pcc_val = (
-                    np.min(power_at_pcc) if not np.isscalar(power_at_pcc) else power_at_pcc
-                )
-
-                upper_envelope = self._apply_delay(
-                    self._emt_initial_delay + constants.SCR_BOUND_DELAY_S,
-                    initial_upper_val,
-                    time_array,
-                    upper_envelope,
-                )
-                lower_envelope = self._apply_delay(
-                    self._emt_initial_delay, initial_lower_val, time_array, lower_envelope
-                )
-                power_at_pcc = self._apply_delay(
-                    self._emt_initial_delay, initial_pcc_val, time_array, power_at_pcc
-                )
-            else:
-                initial_upper_val = (
-                    upper_envelope[0] if not np.isscalar(upper_envelope) else upper_envelope
-                )
-                upper_envelope = self._apply_delay(
-                    constants.SCR_BOUND_DELAY_S,
-                    initial_upper_val,
-                    time_array,
-                    upper_envelope,
-                )
+            rising_upper = upper_envelope
+            rising_lower = self._apply_delay(
+                constants.SCR_BOUND_DELAY_S,
+                lower_envelope[..., 0],
+                time_array,
+                lower_envelope,
+            )
+            falling_upper = self._apply_delay(
+                constants.SCR_BOUND_DELAY_S,
+                upper_envelope[..., 0],
+                time_array,
+                upper_envelope,
+            )
+            falling_lower = lower_envelope
+        upper_envelope = np.where(rising, rising_upper, falling_upper)
+        lower_envelope = np.where(rising, rising_lower, falling_lower)
 
         return power_at_pcc, upper_envelope, lower_envelope
 
@@ -679,40 +643,41 @@ class SCRJump(GFMCalculator):
         voltage_product = self._initial_voltage * self._grid_voltage
         base_angular_freq = self._base_angular_frequency
 
-        if H <= 0 or total_reactance <= 0:
-            natural_frequency = 0
-            damping_ratio = float("inf")
-        else:
+        # Both damping profiles are evaluated and selected element-wise, so the parameters
+        # may be columns of a sweep; the invalid branches are discarded.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            is_valid = (H > 0) & (total_reactance > 0)
             alpha = D / (2 * H)
             betha = base_angular_freq / (2 * H * total_reactance)
+            sqrt_term_val = alpha**2 - 4 * betha
 
-            if (alpha**2 - 4 * betha) < 0:  # Validates logic for Underdamped profiles
-                # Calculate the natural frequency of oscillation (in rad/s)
-                natural_frequency = np.sqrt(
-                    base_angular_freq * voltage_product / (2 * H * total_reactance)
-                )
-                # Formulate the dimensionless damping ratio
-                damping_ratio = (
-                    D / (4 * H * natural_frequency) if natural_frequency > 0 else float("inf")
-                )
-            else:  # Validates logic for Overdamped profiles
-                sqrt_term_val = alpha**2 - 4 * betha
-                p1 = (alpha - np.sqrt(sqrt_term_val)) / 2
-                p2 = (alpha + np.sqrt(sqrt_term_val)) / 2
-
-                # Calculate the natural frequency of oscillation (in rad/s)
-                natural_frequency = np.sqrt(
-                    base_angular_freq * voltage_product / (2 * H * total_reactance)
-                )
-                # Formulate the dimensionless damping ratio
-                damping_ratio = (p1 + p2) / (2 * np.sqrt(p1 * p2))
-
-        # Define theoretical absolute peak power expected from the parameter shift
-        peak_power_change = (
-            self._delta_impedance * self._initial_active_power / total_reactance
-            if total_reactance > 0
-            else 0
-        )
+            # Calculate the natural frequency of oscillation (in rad/s)
+            natural_frequency = np.sqrt(
+                base_angular_freq * voltage_product / (2 * H * total_reactance)
+            )
+
+            # Formulate the dimensionless damping ratio of Underdamped profiles
+            underdamped_ratio = np.where(
+                natural_frequency > 0, D / (4 * H * natural_frequency), float("inf")
+            )
+            # and of Overdamped profiles
+            p1 = (alpha - np.sqrt(sqrt_term_val)) / 2
+            p2 = (alpha + np.sqrt(sqrt_term_val)) / 2
+            overdamped_ratio = (p1 + p2) / (2 * np.sqrt(p1 * p2))
+
+            damping_ratio = np.where(
+                is_valid,
+                np.where(sqrt_term_val < 0, underdamped_ratio, overdamped_ratio),
+                float("inf"),
+            )[()]
+            natural_frequency = np.where(is_valid, natural_frequency, 0)[()]
+
+            # Define theoretical absolute peak power expected from the parameter shift
+            peak_power_change = np.where(
+                total_reactance > 0,
+                self._delta_impedance * self._initial_active_power / total_reactance,
+                0,
+            )[()]
         self._epsilon = damping_ratio
         return total_reactance, damping_ratio, natural_frequency, peak_power_change
 
@@ -745,17 +710,19 @@ class SCRJump(GFMCalculator):
         """
         _, damping_ratio, _, _ = self._calculate_common_params(D, H, Xeff)
 
-        # An Epsilon value >= 1 inherently indicates an overdamped or critically damped state.
-        if damping_ratio >= 1:
+        def overdamped(D, H, Xeff):
             delta_p, p_peak, calculated_epsilon = self._get_overdamped_delta_p(
                 D, H, Xeff, time_array, event_time
             )
             return delta_p, None, None, p_peak, calculated_epsilon
-        else:  # An Epsilon value < 1 explicitly confirms an underdamped behavior profile.
-            delta_p, delta_p_min, delta_p_max, p_peak, calculated_epsilon = (
-                self._get_underdamped_delta_p(D, H, Xeff, time_array, event_time)
-            )
-            return delta_p, delta_p_min, delta_p_max, p_peak, calculated_epsilon
+
+        def underdamped(D, H, Xeff):
+            return self._get_underdamped_delta_p(D, H, Xeff, time_array, event_time)
+
+        # An Epsilon value >= 1 inherently indicates an overdamped or critically damped state,
+        # while an Epsilon value < 1 explicitly confirms an underdamped behavior profile.
+        # For a sweep, the min/max envelopes of the overdamped rows are NaN.
+        return self._evaluate_by_damping(damping_ratio >= 1, overdamped, underdamped, D, H, Xeff)
 
     def _get_overdamped_delta_p_base(
         self, D: float, H: float, Xeff: float, time_array: np.ndarray
@@ -788,26 +755,25 @@ class SCRJump(GFMCalculator):
         beta_coeff = self._base_angular_frequency / (2 * H * total_reactance)
 
         sqrt_term_val = alpha_coeff**2 - 4 * beta_coeff
-        if sqrt_term_val < 0:
+        if np.any(sqrt_term_val < 0):
             logger.warning(
                 "Negative sqrt term detected in overdamped execution; forced to 0 to prevent "
                 "complex numbers."
             )
-            sqrt_term_val = 0
+            sqrt_term_val = np.maximum(sqrt_term_val, 0)
 
         p1 = (alpha_coeff - np.sqrt(sqrt_term_val)) / 2
         p2 = (alpha_coeff + np.sqrt(sqrt_term_val)) / 2
 
-        if abs(p2 - p1) < 1e-9:  # Logic handling strictly critically damped scenarios
-            A = 0.5
-            B = 0.5
-        else:
-            A = (2 * H * (-p1) + D) / ((p2 - p1) * (2 * H))
-            B = (2 * H * (-p2) + D) / ((p1 - p2) * (2 * H))
+        # Logic handling strictly critically damped scenarios
+        is_critical = abs(p2 - p1) < 1e-9
+        with np.errstate(divide="ignore", invalid="ignore"):
+            A = np.where(is_critical, 0.5, (2 * H * (-p1) + D) / ((p2 - p1) * (2 * H)))
+            B = np.where(is_critical, 0.5, (2 * H * (-p2) + D) / ((p1 - p2) * (2 * H)))
 
         # Project the finalized form: p_peak * (A * e^(-p1*t) + B * e^(-p2*t))
-        term1 = A * np.exp(-p1 * time_array)
-        term2 = B * np.exp(-p2 * time_array)
+        term1 = A * basis.exp_decay(p1, time_array)
+        term2 = B * basis.exp_decay(p2, time_array)
         delta_p_base = peak_power * (term1 + term2)
 
         return delta_p_base, peak_power, epsilon
@@ -839,7 +805,7 @@ class SCRJump(GFMCalculator):
             and the applied epsilon.
         """
         # Formulate zero-floor offsets mapped directly to event initialization
-        time_since_event = np.maximum(0, time_array - event_time)
+        time_since_event = basis.elapsed(time_array, event_time)
         delta_p_base, p_peak, epsilon = self._get_overdamped_delta_p_base(
             D, H, Xeff, time_since_event
         )
@@ -879,14 +845,14 @@ class SCRJump(GFMCalculator):
         damped_frequency = natural_frequency * np.sqrt(1 - epsilon**2)
 
         # Structure individual transient mathematical components resolving the underdamped DE
-        exp_term = np.exp(-epsilon * natural_frequency * time_array)
-        cos_term = np.cos(damped_frequency * time_array)
-        sin_term = np.sin(damped_frequency * time_array)
-        sin_coeff = (
-            (D / (2 * H) - epsilon * natural_frequency) / damped_frequency
-            if damped_frequency > 0
-            else 0
-        )
+        exp_term = basis.exp_decay(epsilon * natural_frequency, time_array)
+        cos_term, sin_term = basis.oscillation(damped_frequency, time_array)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sin_coeff = np.where(
+                damped_frequency > 0,
+                (D / (2 * H) - epsilon * natural_frequency) / damped_frequency,
+                0,
+            )
 
         # Aggregated solution resolves as an exponentially decaying sinusoidal wave
         delta_p_base = peak_power * -1 * (exp_term * cos_term + sin_coeff * exp_term * sin_term)
@@ -924,7 +890,7 @@ class SCRJump(GFMCalculator):
             envelopes, explicit peak power evaluation, and epsilon constraint.
         """
         # Constrain processing solely mapping the temporal bounds extending post-event
-        time_since_event = np.maximum(0, time_array - event_time)
+        time_since_event = basis.elapsed(time_array, event_time)
 
         delta_p_base, min_env_base, max_env_base, p_peak, epsilon = (
             self._get_underdamped_delta_p_base(D, H, Xeff, time_since_event)
@@ -952,7 +918,7 @@ class SCRJump(GFMCalculator):
         float
             The definitively formulated constant boundary margin value.
         """
-        return max(
+        return np.maximum(
             self._final_allowed_tunnel_pn,
             self._final_allowed_tunnel_variation * np.abs(peak_power),
         )
@@ -22,6 +22,14 @@ SIMULATION_END_TIME = 5.0
 SIMULATION_POINTS = 3000
 SIMULATION_EVENT_TIME = 0.0
 
+# Adaptive time grid of the outputs
+ADAPTIVE_GRID_TOLERANCE = 1e-4  # Maximum interpolation error (pu)
+ADAPTIVE_GRID_INITIAL_STEP = 64  # Spacing of the initial coarse selection (points)
+
+# Output files written for each operating condition
+OUTPUT_FORMATS = ("csv", "png", "html")
+PLOT_FORMATS = ("png", "html")
+
 # Delay and Time Constants (in seconds)
 EMT_FINAL_DELAY_S = 0.02
 SCR_BOUND_DELAY_S = 0.01
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Fingerprints of the inputs of the GFM envelopes of each operating condition.
+
+The outputs of an operating condition only depend on the parameter values read while
+they are generated, and on the dycov version. During the generation, the parameters are
+wrapped by `RecordingParameters`, which records the value returned by each of their
+getters (the calculator name, D, H, P0, the output formats...). The recorded inputs are
+saved with their hash next to the outputs, and an incremental generation evaluates the
+same getters again on the current configuration: the operating conditions whose inputs
+are unchanged keep their previous outputs.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+# Suffix of the fingerprint file written next to the outputs of each operating condition
+FINGERPRINT_SUFFIX = "_fingerprint.json"
+
+# Prefixes of the parameter getters whose results are recorded as inputs
+_GETTER_PREFIXES = ("get_", "is_", "should_", "use_")
+
+# Marks the values that are not inputs (e.g. the producer object or the working paths)
+_NOT_AN_INPUT = object()
+
+
+def _dycov_version() -> str:
+    try:
+        return importlib.metadata.version("dycov")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _to_json(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float, np.number)):
+        return value.item() if isinstance(value, np.number) else value
+    if isinstance(value, (tuple, list, np.ndarray)):
+        items = [_to_json(item) for item in value]
+        return _NOT_AN_INPUT if any(item is _NOT_AN_INPUT for item in items) else items
+    if isinstance(value, dict):
+        items = {str(key): _to_json(item) for key, item in value.items()}
+        return _NOT_AN_INPUT if _NOT_AN_INPUT in items.values() else items
+    return _NOT_AN_INPUT
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+def _compute_hash(inputs: dict) -> str:
+    values = {key: entry["value"] for key, entry in inputs.items()}
+    return hashlib.sha256(
+        _dumps({"dycov": _dycov_version(), "inputs": values}).encode()
+    ).hexdigest()
+
+
+class RecordingParameters:
+    """
+    Wrapper of the GFM parameters of an operating condition that records the values
+    returned by their getters.
+
+    Parameters
+    ----------
+    parameters : GFMParameters
+        The wrapped parameters, to which every attribute access is forwarded.
+    """
+
+    __slots__ = ("_parameters", "_inputs")
+
+    def __init__(self, parameters: Any) -> None:
+        self._parameters = parameters
+        self._inputs = {}
+
+    @property
+    def __dict__(self) -> dict:
+        # The attributes of the wrapped parameters, e.g. for the INI dumps
+        return self._parameters.__dict__
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._parameters, name)
+        if not name.startswith(_GETTER_PREFIXES) or not callable(attribute):
+            return attribute
+
+        def _record(*args):
+            value = attribute(*args)
+            data = _to_json(value)
+            if data is not _NOT_AN_INPUT:
+                key = f"{name}{_dumps(list(args))}" if args else name
+                self._inputs[key] = {"call": name, "args": list(args), "value": data}
+            return value
+
+        return _record
+
+    def get_inputs(self) -> dict:
+        """
+        Returns the inputs recorded so far.
+
+        Returns
+        -------
+        dict
+            The getter calls, keyed by a unique call name, with their arguments and the
+            value they returned.
+        """
+        return dict(self._inputs)
+
+
+def save(path: Path, inputs: dict) -> None:
+    """
+    Saves the fingerprint of the inputs of an operating condition.
+
+    Parameters
+    ----------
+    path : Path
+        The fingerprint file.
+    inputs : dict
+        The inputs recorded by `RecordingParameters`.
+    """
+    fingerprint = {"dycov": _dycov_version(), "hash": _compute_hash(inputs), "inputs": inputs}
+    path.write_text(json.dumps(fingerprint, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def get_changes(path: Path, parameters: Any) -> Optional[str]:
+    """
+    Compares the fingerprint saved by a previous generation with the current parameters.
+
+    The section of the operating condition must be selected in the parameters.
+
+    Parameters
+    ----------
+    path : Path
+        The fingerprint file of the previous generation.
+    parameters : GFMParameters
+        The current parameters.
+
+    Returns
+    -------
+    Optional[str]
+        None if the inputs are unchanged, otherwise the reason to regenerate the outputs.
+    """
+    if not path.is_file():
+        return "no previous results"
+    try:
+        previous = json.loads(path.read_text(encoding="utf-8"))
+        previous_inputs = previous["inputs"]
+    except (OSError, ValueError, KeyError):
+        return "unreadable fingerprint"
+    if previous.get("dycov") != _dycov_version():
+        return f"dycov version changed from {previous.get('dycov')}"
+
+    changed = set()
+    for entry in previous_inputs.values():
+        try:
+            value = _to_json(getattr(parameters, entry["call"])(*entry["args"]))
+        except Exception:
+            # A getter that no longer applies to the configuration is a change as well
+            value = _NOT_AN_INPUT
+        if value is _NOT_AN_INPUT or _dumps(value) != _dumps(entry["value"]):
+            changed.add(entry["call"].removeprefix("get_"))
+
+    if changed:
+        return f"changed {', '.join(sorted(changed))}"
+    if _compute_hash(previous_inputs) != previous.get("hash"):
+        return "fingerprint mismatch"
+    return None
@@ -8,54 +8,104 @@
 #     demiguelm@aia.es
 #
 
-import logging
 import sys
-from multiprocessing import Pool
 from pathlib import Path
+from typing import Optional
 
 from dycov.configuration.cfg import config
+from dycov.core import worker_pool
 from dycov.files import manage_files
+from dycov.gfm import fingerprint, output_writer
 from dycov.gfm.parameters import GFMParameters
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
+from dycov.model.benchmark import Benchmark
 from dycov.model.pcs import Pcs
 
+# PCS configuration files loaded by this worker for the current run: (state file, paths)
+_loaded_pcs_configs: tuple = (None, set())
 
-def _generate_pcs(pcs_args: tuple[GFMParameters, str, str]) -> None:
+
+def _generate_operating_condition(
+    parameters: GFMParameters, task: tuple[str, str, str, str, tuple]
+) -> tuple[Optional[str], dict]:
     """
-    Worker function that generates envelopes for a specific Power Conversion System (PCS).
+    Worker function that generates the envelopes of a single operating condition (OC).
 
-    Designed to be executed concurrently within a multiprocessing Pool. It initializes
-    a Pcs object and triggers the internal envelope generation routine.
+    The task is self-contained, so that the OCs of all the PCS can be distributed freely
+    among the workers: the GFM parameters select their section for the PCS, benchmark and
+    OC, and the outputs are written to the working directory of the OC. The parameter
+    values read by the generation are recorded, for the fingerprint of the OC.
 
     Parameters
     ----------
-    pcs_args : tuple[GFMParameters, str, str]
-        A tuple structured as (parameters, pcs_name, producer_name) containing the
-        GFM simulation configuration and identifiers for the target PCS and producer.
+    parameters : GFMParameters
+        The GFM simulation configuration.
+    task : tuple[str, str, str, str, tuple]
+        A tuple structured as (producer_name, pcs_name, bm_name, oc_name, pcs_configs).
+
+    Returns
+    -------
+    tuple[Optional[str], dict]
+        The reason why the generation was aborted, or None if it succeeded, and the
+        recorded inputs of the OC.
     """
-    parameters, pcs_name, producer_name = pcs_args
-    pcs = Pcs(producer_name, pcs_name, parameters)
-
+    producer_name, pcs_name, bm_name, oc_name, _ = task
+    recording_parameters = fingerprint.RecordingParameters(parameters)
     try:
-        # Validate the PCS definition before proceeding with the generation pipeline
-        if not pcs.is_valid():
-            dycov_logging.get_logger("GFMGeneration").error(f"{pcs.get_name()} is not a valid PCS")
-            return
-
-        # Execute the core envelope generation
-        pcs.generate()
+        Benchmark.generate_operating_condition(
+            recording_parameters, producer_name, pcs_name, bm_name, oc_name
+        )
     except (FileNotFoundError, IOError, ValueError) as e:
-        # Catch explicit exceptions related to input/output or faulty values and log them
-        # appropriately
-        if dycov_logging.get_logger("GFMGeneration").getEffectiveLevel() == logging.DEBUG:
-            dycov_logging.get_logger("GFMGeneration").exception(
-                f"Aborted execution for {pcs.get_name()}. {e}"
-            )
-        else:
-            dycov_logging.get_logger("GFMGeneration").error(
-                f"Aborted execution for {pcs.get_name()}. {e}"
-            )
-        return
+        # Catch explicit exceptions related to input/output or faulty values; the caller
+        # logs them, in task order
+        dycov_logging.get_logger("GFMGeneration").debug("Generation error", exc_info=True)
+        return f"Aborted execution for {pcs_name}.{bm_name}.{oc_name}. {e}", {}
+    return None, recording_parameters.get_inputs()
+
+
+def _generate_shared_operating_condition(
+    task: tuple[str, int, tuple],
+) -> tuple[int, Optional[str], dict]:
+    """
+    Pool worker counterpart of `_generate_operating_condition`, taking the parameters from
+    the state published for the run.
+
+    Parameters
+    ----------
+    task : tuple[str, int, tuple]
+        A tuple structured as (state_file, index, oc_task).
+
+    Returns
+    -------
+    tuple[int, Optional[str], dict]
+        The index of the task, the reason why the generation was aborted, if it was, and
+        the recorded inputs of the OC.
+    """
+    global _loaded_pcs_configs
+    state_file, index, oc_task = task
+    parameters = worker_pool.load_state(state_file)
+
+    # The worker may predate the run, so it loads the PCS configurations it needs itself
+    if _loaded_pcs_configs[0] != state_file:
+        _loaded_pcs_configs = (state_file, set())
+    for pcs_config in oc_task[-1]:
+        if pcs_config not in _loaded_pcs_configs[1]:
+            config.load_pcs_config(pcs_config)
+            _loaded_pcs_configs[1].add(pcs_config)
+
+    try:
+        message, inputs = _generate_operating_condition(parameters, oc_task)
+        # The outputs must be complete when the task is reported as done; the writer logs
+        # the errors, so that the task is only reported as aborted
+        if not output_writer.flush(raise_errors=False) and message is None:
+            oc_path = ".".join(oc_task[1:4])
+            message, inputs = f"Aborted execution for {oc_path}. Error writing the outputs", {}
+    finally:
+        # Never leave outputs pending past the task, even when it was aborted
+        output_writer.flush(raise_errors=False)
+        # Save the spans of this worker before it picks another task (or exits)
+        profiling.flush()
+    return index, message, inputs
 
 
 class GFMGeneration:
@@ -69,7 +119,7 @@ class GFMGeneration:
     parallel multiprocessing workflows.
     """
 
-    def __init__(self, parameters: GFMParameters) -> None:
+    def __init__(self, parameters: GFMParameters, incremental: bool = False) -> None:
         """
         Initializes the GFMGeneration orchestrator with the required simulation parameters.
 
@@ -77,8 +127,13 @@ class GFMGeneration:
         ----------
         parameters : GFMParameters
             An object containing all parsed GFM simulation configurations and settings.
+        incremental : bool, optional
+            If True, the results of a previous generation in the output directory are
+            updated: only the operating conditions whose inputs changed are generated
+            again. Defaults to False.
         """
         self._parameters = parameters
+        self._incremental = incremental
         self._templates_path = Path(config.get_value("Global", "templates_path"))
 
         self.__initialize_working_environment()
@@ -91,9 +146,16 @@ class GFMGeneration:
 
         It ensures the working directory is available and implements safety checks on
         the target output directory to prevent the accidental overwriting of pre-existing results.
+        An incremental generation keeps and updates the existing results instead.
         """
         manage_files.create_dir(self._parameters.get_working_dir(), clean_first=False)
 
+        if self._incremental and self._parameters.get_output_dir().exists():
+            dycov_logging.get_logger("GFMGeneration").info(
+                f"Updating the results in {self._parameters.get_output_dir()}."
+            )
+            return
+
         # Verify if the designated results output path already exists to safeguard previous data
         if manage_files.check_output_dir(self._parameters.get_output_dir()):
             dycov_logging.get_logger("GFMGeneration").warning(
@@ -196,14 +258,142 @@ class GFMGeneration:
             )
         return pcs_list
 
+    def __prepare_oc_tasks(self) -> list[tuple[str, str, str, str, tuple]]:
+        """
+        Splits the generation into one task per operating condition of every valid PCS.
+
+        Returns
+        -------
+        list[tuple[str, str, str, str, tuple]]
+            A list of tuples, each formatted as (producer_name, pcs_name, bm_name, oc_name,
+            pcs_configs), where pcs_configs are the PCS configuration files the task needs.
+        """
+        tasks: list[tuple[str, str, str, str, tuple]] = []
+        for _, pcs_name, producer_name in self._pcs_list:
+            pcs = Pcs(producer_name, pcs_name, self._parameters)
+            # Validate the PCS definition before proceeding with the generation pipeline
+            if not pcs.is_valid():
+                dycov_logging.get_logger("GFMGeneration").error(
+                    f"{pcs.get_name()} is not a valid PCS"
+                )
+                continue
+
+            pcs_configs = tuple(str(path) for path in pcs.get_config_paths())
+            tasks.extend(
+                (producer_name, pcs_name, bm_name, oc_name, pcs_configs)
+                for bm_name, oc_name in pcs.get_operating_conditions()
+            )
+        return tasks
+
+    def __get_fingerprint_path(self, task: tuple[str, str, str, str, tuple]) -> Path:
+        """
+        Returns the fingerprint file of an operating condition in the output directory.
+
+        Parameters
+        ----------
+        task : tuple[str, str, str, str, tuple]
+            The task of the operating condition.
+
+        Returns
+        -------
+        Path
+            The fingerprint file, next to the outputs of the operating condition.
+        """
+        _, pcs_name, bm_name, oc_name, _ = task
+        return (
+            self._parameters.get_output_dir()
+            / pcs_name
+            / bm_name
+            / oc_name
+            / f"{pcs_name}.{bm_name}.{oc_name}{fingerprint.FINGERPRINT_SUFFIX}"
+        )
+
+    def __select_changed_tasks(
+        self, tasks: list[tuple[str, str, str, str, tuple]]
+    ) -> list[tuple[str, str, str, str, tuple]]:
+        """
+        Selects the operating conditions whose inputs changed since the previous generation,
+        and lists them with the reason of the change.
+
+        Parameters
+        ----------
+        tasks : list[tuple[str, str, str, str, tuple]]
+            The tasks of all the operating conditions.
+
+        Returns
+        -------
+        list[tuple[str, str, str, str, tuple]]
+            The tasks of the operating conditions to generate again.
+        """
+        logger = dycov_logging.get_logger("GFMGeneration")
+        changed_tasks = []
+        for task in tasks:
+            _, pcs_name, bm_name, oc_name, _ = task
+            self._parameters.set_section(pcs_name, bm_name, oc_name)
+            changes = fingerprint.get_changes(self.__get_fingerprint_path(task), self._parameters)
+            if changes:
+                logger.info(f"Regenerating {pcs_name}.{bm_name}.{oc_name}: {changes}.")
+                changed_tasks.append(task)
+
+        logger.info(
+            f"Regenerating {len(changed_tasks)} of {len(tasks)} operating conditions, "
+            f"{len(tasks) - len(changed_tasks)} unchanged."
+        )
+        return changed_tasks
+
+    def __publish_results(
+        self,
+        tasks: list[tuple[str, str, str, str, tuple]],
+        results: list[tuple[Optional[str], dict]],
+        outputs_written: bool,
+    ) -> None:
+        """
+        Moves the outputs from the working directory to the output directory, and saves the
+        fingerprints of the operating conditions generated successfully.
+
+        Parameters
+        ----------
+        tasks : list[tuple[str, str, str, str, tuple]]
+            The tasks of the generated operating conditions.
+        results : list[tuple[Optional[str], dict]]
+            The abort reason, if any, and the recorded inputs of each task.
+        outputs_written : bool
+            False if any output failed to be written, in which case no fingerprint is saved.
+        """
+        if self._incremental:
+            # Replace the previous outputs of the regenerated operating conditions only
+            for task in tasks:
+                manage_files.remove_dir(self.__get_fingerprint_path(task).parent)
+
+        # Migrate all finalized generation artifacts from the temporary workspace to the user
+        # output directory
+        for _, pcs_name, producer_name in self._pcs_list:
+            manage_files.copy_directory(
+                self._parameters.get_working_dir() / producer_name,
+                self._parameters.get_output_dir(),
+                pcs_name,
+                dirs_exist_ok=self._incremental,
+            )
+
+        if not outputs_written:
+            return
+        for task, (message, inputs) in zip(tasks, results):
+            path = self.__get_fingerprint_path(task)
+            if message is None and path.parent.is_dir():
+                fingerprint.save(path, inputs)
+
     def generate(self, use_parallel: bool = False, num_processes: int = 4) -> None:
         """
         Executes the generation of GFM envelopes, supporting both sequential execution
         and multiprocessing parallelism.
 
-        Following the successful generation of all required envelopes, this method automatically
-        handles the transfer of output artifacts to the final directory and wipes the temporary
-        working environment.
+        The work is split into one task per operating condition, so that the PCS with many
+        operating conditions are shared among all the workers instead of keeping one busy
+        while the others are idle. Following the successful generation of all required
+        envelopes, this method automatically handles the transfer of output artifacts to
+        the final directory, along with the fingerprint of the inputs of each operating
+        condition, and wipes the temporary working environment. An incremental generation
+        skips the operating conditions whose fingerprint is unchanged.
 
         Parameters
         ----------
@@ -214,27 +404,48 @@ class GFMGeneration:
             The maximum number of concurrent worker processes to utilize when `use_parallel`
             is True. Defaults to 4.
         """
-        if use_parallel:
+        tasks = self.__prepare_oc_tasks()
+        if self._incremental:
+            tasks = self.__select_changed_tasks(tasks)
+
+        results: list[tuple[Optional[str], dict]] = [(None, {})] * len(tasks)
+        outputs_written = True
+        if not tasks:
+            pass
+        elif use_parallel:
             dycov_logging.get_logger("GFMGeneration").info(
                 f"Generating envelopes in parallel using {num_processes} processes."
             )
-            # Dispatch generation tasks concurrently using a managed process pool
-            with Pool(processes=num_processes) as pool:
-                pool.map(_generate_pcs, self._pcs_list)
+            # Dispatch the tasks on the long-lived worker pool in small chunks, which idle
+            # workers take as they finish the previous ones; the parameters are sent once
+            # per worker instead of with every task
+            pool = worker_pool.get_pool(num_processes)
+            chunksize = max(1, len(tasks) // (4 * num_processes))
+            with worker_pool.shared_state(self._parameters) as state_file:
+                shared_tasks = [(state_file, index, task) for index, task in enumerate(tasks)]
+                try:
+                    for index, message, inputs in pool.imap_unordered(
+                        _generate_shared_operating_condition, shared_tasks, chunksize
+                    ):
+                        results[index] = (message, inputs)
+                finally:
+                    worker_pool.release()
         else:
             dycov_logging.get_logger("GFMGeneration").info("Generating envelopes sequentially.")
-            # Execute tasks synchronously on the main thread
-            for pcs_tuple in self._pcs_list:
-                _generate_pcs(pcs_tuple)
-
-        # Migrate all finalized generation artifacts from the temporary workspace to the user
-        # output directory
-        for _, pcs_name, producer_name in self._pcs_list:
-            manage_files.copy_directory(
-                self._parameters.get_working_dir() / producer_name,
-                self._parameters.get_output_dir(),
-                pcs_name,
-            )
+            # Execute tasks synchronously on the main thread, while the outputs are written
+            # in the background
+            for index, task in enumerate(tasks):
+                results[index] = _generate_operating_condition(self._parameters, task)
+            # Stop the writer threads too, since this process may fork a worker pool later
+            outputs_written = output_writer.shutdown()
+            profiling.flush()
+
+        # Report the aborted tasks in task order, whatever the order in which they finished
+        for message, _ in results:
+            if message:
+                dycov_logging.get_logger("GFMGeneration").error(message)
+
+        self.__publish_results(tasks, results, outputs_written)
 
         # Perform routine cleanup by securely deleting the temporary working directory
         manage_files.remove_dir(self._parameters.get_working_dir())
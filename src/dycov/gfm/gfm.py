@@ -12,10 +12,16 @@ from pathlib import Path
 
 import numpy as np
 
-from dycov.gfm import constants
-from dycov.gfm.calculators import calculator_factory
+from dycov.gfm import constants, output_writer
+from dycov.gfm.adaptive_grid import select_time_points
+from dycov.gfm.calculators import basis, calculator_factory
 from dycov.gfm.calculators.gfm_calculator import GFMCalculator
-from dycov.gfm.outputs import plot_results, save_ini_dump, save_results_to_csv
+from dycov.gfm.outputs import (
+    plot_results,
+    save_ini_dump,
+    save_results_to_csv,
+    save_sweep_results,
+)
 from dycov.gfm.parameters import GFMParameters
 from dycov.logging import dycov_logging
 
@@ -43,7 +49,12 @@ class GridForming:
         It automatically detects if "Hybrid" parameters (Overdamped/Underdamped conditions)
         are defined within the configuration. If detected, it calculates envelopes for both
         damping conditions and merges them (applying Min/Max boundary logic). Otherwise,
-        it proceeds with the standard predefined D and H parameters.
+        it proceeds with the standard predefined D and H parameters. When a parameter sweep
+        is requested, the envelopes of all its parameter sets are exported instead.
+
+        The output files are queued to the background writer (`output_writer`), so that the
+        envelopes of the next operating condition are calculated while they are written; only
+        the formats requested in the parameters are written.
 
         Parameters
         ----------
@@ -67,6 +78,14 @@ class GridForming:
         time_array, event_time = self._get_time(calculator_name)
 
         params_list = calculator.get_plot_parameter_names() if calculator else None
+        title = f"{pcs_name}.{bm_name}.{oc_name}"
+
+        sweep = parameters.get_sweep()
+        if sweep is not None:
+            self._generate_sweep(
+                working_path, title, parameters, calculator, time_array, event_time, sweep
+            )
+            return
 
         # Determine the execution path: Hybrid (Merged) Mode vs Standard Mode
         hybrid_params = parameters.get_hybrid_parameters()
@@ -79,7 +98,6 @@ class GridForming:
 
         # Dictionary to hold supplementary curves if 'save_all_envelopes' is enabled
         extra_envelopes = None
-        title = f"{pcs_name}.{bm_name}.{oc_name}"
 
         if hybrid_params:
             LOGGER.info(
@@ -165,17 +183,31 @@ class GridForming:
         is_inconsistent = getattr(calculator, "_is_inconsistent", False)
         disclaimer_msg = getattr(calculator, "_disclaimer_message", None)
 
-        # Execute data export and rendering routines
-        self._export_csv(
-            working_path,
-            title,
-            magnitude_name,
-            time_array,
-            pcc_signal,
-            lower_envelope,
-            upper_envelope,
-            extra_envelopes=extra_envelopes,
-        )
+        if parameters.use_adaptive_time_grid():
+            time_array, pcc_signal, lower_envelope, upper_envelope, extra_envelopes = (
+                self._select_time_points(
+                    time_array,
+                    event_time,
+                    pcc_signal,
+                    lower_envelope,
+                    upper_envelope,
+                    extra_envelopes,
+                )
+            )
+
+        # Queue the data export and rendering routines to the background writer
+        output_formats = parameters.get_output_formats()
+        if "csv" in output_formats:
+            self._export_csv(
+                working_path,
+                title,
+                magnitude_name,
+                time_array,
+                pcc_signal,
+                lower_envelope,
+                upper_envelope,
+                extra_envelopes=extra_envelopes,
+            )
 
         if not hybrid_params:
             producer = parameters.get_producer()
@@ -188,21 +220,149 @@ class GridForming:
                 calculator=calculator,
             )
 
-        self._plot(
-            working_path,
-            title,
-            magnitude_name,
-            time_array,
-            event_time,
-            pcc_signal,
-            lower_envelope,
-            upper_envelope,
-            parameters,
-            params_list,
-            calculator,
-            is_inconsistent,
-            disclaimer_msg,
-            extra_envelopes=extra_envelopes,
+        plot_formats = [name for name in constants.PLOT_FORMATS if name in output_formats]
+        if plot_formats:
+            self._plot(
+                working_path,
+                title,
+                magnitude_name,
+                time_array,
+                event_time,
+                pcc_signal,
+                lower_envelope,
+                upper_envelope,
+                parameters,
+                params_list,
+                calculator,
+                is_inconsistent,
+                disclaimer_msg,
+                extra_envelopes=extra_envelopes,
+                output_format="&".join(plot_formats),
+            )
+
+    def _generate_sweep(
+        self,
+        working_path: Path,
+        title: str,
+        parameters: GFMParameters,
+        calculator: GFMCalculator,
+        time_array: np.ndarray,
+        event_time: float,
+        sweep: dict,
+    ) -> None:
+        """
+        Computes the envelopes of every parameter set of a sweep in a single batched call and
+        exports them to a compressed NumPy archive.
+
+        The parameters missing from the sweep take the values of the configuration: the
+        standard D and H parameters and the effective reactance.
+
+        Parameters
+        ----------
+        working_path : Path
+            The base directory path designated for saving the generated output file.
+        title : str
+            The base filename for the output file.
+        parameters : GFMParameters
+            The loaded parameter configuration object guiding the simulation.
+        calculator : GFMCalculator
+            The instantiated envelope calculator object.
+        time_array : np.ndarray
+            The X-axis time array mapped for the simulation.
+        event_time : float
+            The absolute point in time where the grid event is triggered.
+        sweep : dict
+            The values of the swept parameters, keyed by parameter name.
+        """
+        if "D" in sweep and "H" in sweep:
+            d_values, h_values = sweep["D"], sweep["H"]
+        else:
+            standard_params = parameters.get_standard_parameters()
+            if standard_params is None:
+                error_msg = (
+                    f"Configuration Error in {title}: "
+                    "the sweep must define both D and H when the standard parameters (D, H) "
+                    "are not defined in the Producer.ini or configuration files."
+                )
+                LOGGER.error(error_msg)
+                raise ValueError(error_msg)
+            d_values = sweep.get("D", standard_params[0])
+            h_values = sweep.get("H", standard_params[1])
+        x_values = sweep.get("Xeff", parameters.get_effective_reactance())
+        d_values, h_values, x_values = np.broadcast_arrays(d_values, h_values, x_values)
+
+        LOGGER.info(f"Generating the envelopes of {len(d_values)} parameter sets for {title}.")
+        magnitude_name, pcc_signal, upper_envelope, lower_envelope = (
+            calculator.calculate_envelopes_sweep(
+                D=d_values,
+                H=h_values,
+                Xeff=x_values,
+                time_array=time_array,
+                event_time=event_time,
+            )
+        )
+
+        output_writer.submit(
+            save_sweep_results,
+            path=working_path / f"{title}_sweep.npz",
+            magnitude=magnitude_name,
+            time_array=time_array,
+            damping_constant=d_values,
+            inertia_constant=h_values,
+            x_eff=x_values,
+            pcc_signal=pcc_signal,
+            lower_envelope=lower_envelope,
+            upper_envelope=upper_envelope,
+        )
+
+    def _select_time_points(
+        self,
+        time_array: np.ndarray,
+        event_time: float,
+        pcc_signal: np.ndarray,
+        lower_envelope: np.ndarray,
+        upper_envelope: np.ndarray,
+        extra_envelopes: dict = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Coarsens the time grid of the results to the points needed to reproduce all the
+        signals within the adaptive grid tolerance.
+
+        Parameters
+        ----------
+        time_array : np.ndarray
+            The uniform time array on which the signals were calculated.
+        event_time : float
+            The absolute point in time where the grid event is triggered.
+        pcc_signal : np.ndarray
+            The PCC signal data array.
+        lower_envelope : np.ndarray
+            The lower bound envelope data array.
+        upper_envelope : np.ndarray
+            The upper bound envelope data array.
+        extra_envelopes : dict, optional
+            The supplementary curves, keyed by name.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]
+            The time array, PCC signal, lower and upper envelopes and supplementary curves
+            on the selected time points.
+        """
+        signals = [pcc_signal, lower_envelope, upper_envelope]
+        if extra_envelopes:
+            signals += list(extra_envelopes.values())
+        indices = select_time_points(time_array, signals, keep_times=(event_time,))
+        LOGGER.debug(f"Adaptive time grid: {len(indices)} of {len(time_array)} points.")
+
+        if extra_envelopes:
+            extra_envelopes = {name: signal[indices] for name, signal in extra_envelopes.items()}
+        return (
+            time_array[indices],
+            pcc_signal[indices],
+            lower_envelope[indices],
+            upper_envelope[indices],
+            extra_envelopes,
         )
 
     def _get_time(self, calculator_name: str) -> tuple[np.ndarray, float]:
@@ -231,7 +391,7 @@ class GridForming:
         end_time = constants.SIMULATION_END_TIME
         event_time = constants.SIMULATION_EVENT_TIME
         nb_points = constants.SIMULATION_POINTS
-        time_array = np.linspace(start_time, end_time, nb_points)
+        time_array = basis.time_grid(start_time, end_time, nb_points)
 
         return time_array, event_time
 
@@ -296,6 +456,7 @@ class GridForming:
     ) -> None:
         """
         Marshals the generated mathematical signals and exports them to a structured CSV format.
+        The file is written in the background, by the output writer.
 
         Parameters
         ----------
@@ -316,7 +477,8 @@ class GridForming:
         extra_envelopes : dict, optional
             A dictionary appending supplementary data series as additional columns.
         """
-        save_results_to_csv(
+        output_writer.submit(
+            save_results_to_csv,
             path=csv_path / f"{title}.csv",
             magnitude=magnitude_name,
             time_array=time_array,
@@ -433,9 +595,11 @@ class GridForming:
         is_inconsistent: bool = False,
         disclaimer_msg: str = None,
         extra_envelopes: dict = None,
+        output_format: str = "png&html",
     ) -> None:
         """
         Dispatches the internal variables to render and export the final visual plots.
+        The plots are rendered in the background, by the output writer.
 
         Parameters
         ----------
@@ -467,8 +631,11 @@ class GridForming:
             Specific warning message overlay injected into the plot.
         extra_envelopes : dict, optional
             Supplementary graphs triggered during hybrid evaluation structures.
+        output_format : str, optional
+            The figure formats to export, such as 'png&html'. Defaults to both.
         """
-        plot_results(
+        output_writer.submit(
+            plot_results,
             path=png_path / f"{title}.png",
             title=title,
             magnitude=magnitude_name,
@@ -478,7 +645,7 @@ class GridForming:
             pcc_signal=pcc_signal,
             lower_envelope=lower_envelope,
             upper_envelope=upper_envelope,
-            output_format="png&html",
+            output_format=output_format,
             params_list=self._get_params_plot_info(parameters, params_list, calculator),
             show_disclaimer=is_inconsistent,
             disclaimer_message=disclaimer_msg,
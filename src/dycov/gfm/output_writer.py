@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Background writer of the GFM envelope outputs.
+
+Writing the CSV files and, above all, rendering the PNG and HTML figures takes longer
+than calculating the envelopes. The outputs of each operating condition are therefore
+handed to a small pool of writer threads, which write them while the envelopes of the
+next operating conditions are calculated. Each process has its own pool: `flush()` waits
+for the outputs submitted by the process, and must be called before the output files are
+used, and `shutdown()` also stops the threads. With 'output_writer_threads = 0' in the GFM
+configuration, the outputs are written synchronously.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from dycov.configuration.cfg import config
+from dycov.logging import dycov_logging
+
+LOGGER = dycov_logging.get_logger(__name__)
+
+_executor = None
+_executor_pid = None
+_pending: list[Future] = []
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executor_pid
+
+    # A pool inherited by a forked worker has no threads, nor outputs of its own
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(
+            max_workers=config.get_int("GFM", "output_writer_threads", 2),
+            thread_name_prefix="gfm-writer",
+        )
+        _executor_pid = os.getpid()
+        _pending.clear()
+    return _executor
+
+
+def submit(function: Callable, *args, **kwargs) -> None:
+    """
+    Queues the writing of an output. The arguments must not be modified afterwards.
+
+    Parameters
+    ----------
+    function : Callable
+        The function that writes the output (e.g. `outputs.save_results_to_csv`).
+    *args, **kwargs
+        The arguments of the function.
+    """
+    if config.get_int("GFM", "output_writer_threads", 2) <= 0:
+        function(*args, **kwargs)
+        return
+    _pending.append(_get_executor().submit(function, *args, **kwargs))
+
+
+def flush(raise_errors: bool = True) -> bool:
+    """
+    Waits until all the outputs submitted by the current process have been written.
+
+    Parameters
+    ----------
+    raise_errors : bool, optional
+        If True, the first error raised while writing an output is raised again here, and
+        the others are logged. If False, all the errors are logged. Defaults to True.
+
+    Returns
+    -------
+    bool
+        True if all the outputs were written.
+    """
+    if _executor_pid != os.getpid():
+        return True
+
+    pending = list(_pending)
+    _pending.clear()
+    errors = [error for error in (future.exception() for future in pending) if error]
+    if errors and raise_errors:
+        for error in errors[1:]:
+            LOGGER.error(f"Error writing the GFM outputs: {error}")
+        raise errors[0]
+    for error in errors:
+        LOGGER.error(f"Error writing the GFM outputs: {error}")
+    return not errors
+
+
+def shutdown() -> bool:
+    """
+    Waits for the pending outputs, logging their errors, and stops the writer threads, so
+    that the process can later be forked safely (e.g. to start a worker pool).
+
+    Returns
+    -------
+    bool
+        True if all the outputs were written.
+    """
+    global _executor, _executor_pid
+    written = flush(raise_errors=False)
+    if _executor is not None and _executor_pid == os.getpid():
+        _executor.shutdown(wait=True)
+    _executor = None
+    _executor_pid = None
+    return written
@@ -16,7 +16,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 
 
 def save_results_to_csv(
@@ -70,6 +70,58 @@ def save_results_to_csv(
     df.to_csv(path, index=False, sep=";", float_format="%.3e")
 
 
+def save_sweep_results(
+    path: Path,
+    magnitude: str,
+    time_array: np.ndarray,
+    damping_constant: np.ndarray,
+    inertia_constant: np.ndarray,
+    x_eff: np.ndarray,
+    pcc_signal: np.ndarray,
+    lower_envelope: np.ndarray,
+    upper_envelope: np.ndarray,
+) -> None:
+    """
+    Exports the envelopes of a parameter sweep into a compressed NumPy archive.
+
+    The archive holds one array per column: 'magnitude', 'time', the parameters of each set
+    ('D', 'H' and 'Xeff') and the signals ('pcc', 'lower' and 'upper'), whose row i is
+    the signal of the parameter set i.
+
+    Parameters
+    ----------
+    path : Path
+        The destination path for the output archive.
+    magnitude : str
+        The physical magnitude being analyzed (e.g., 'P', 'Iq').
+    time_array : np.ndarray
+        Array containing all time steps used in the simulation.
+    damping_constant : np.ndarray
+        The damping constant (D) of each parameter set.
+    inertia_constant : np.ndarray
+        The inertia constant (H) of each parameter set.
+    x_eff : np.ndarray
+        The effective reactance (Xeff) of each parameter set.
+    pcc_signal : np.ndarray
+        The signal at the Point of Common Coupling of each parameter set.
+    lower_envelope : np.ndarray
+        The lower bound of the envelope of each parameter set.
+    upper_envelope : np.ndarray
+        The upper bound of the envelope of each parameter set.
+    """
+    np.savez_compressed(
+        path,
+        magnitude=np.array(magnitude),
+        time=time_array,
+        D=damping_constant,
+        H=inertia_constant,
+        Xeff=x_eff,
+        pcc=pcc_signal,
+        lower=lower_envelope,
+        upper=upper_envelope,
+    )
+
+
 def find_start_trim_index(
     pcc_signal: np.ndarray,
     lower_envelope: np.ndarray,
@@ -245,7 +297,9 @@ def plot_results(
 
     # --- Static Plot Generation via Matplotlib (PNG) ---
     if "png" in output_format:
-        plt.figure(figsize=(8, 5))
+        # Figures are built without pyplot, whose global state is not thread-safe
+        fig = Figure(figsize=(8, 5))
+        ax = fig.add_subplot()
 
         # Render supplementary envelopes beneath the main data lines
         if extra_trimmed:
@@ -257,7 +311,7 @@ def plot_results(
                 if "underdamped" in name:
                     style_color = colors["underdamped"]
 
-                plt.plot(
+                ax.plot(
                     time_trimmed,
                     signal,
                     linestyle=":",
@@ -268,22 +322,22 @@ def plot_results(
                 )
 
         # Render the primary bounds and PCC signal
-        plt.plot(
+        ax.plot(
             time_trimmed,
             pcc_trimmed,
             label=f"{magnitude} at PGU",
             linewidth=3,
         )
-        plt.plot(
+        ax.plot(
             time_trimmed, down_trimmed, label=f"{magnitude} envelopes", linewidth=2, color="red"
         )
-        plt.plot(time_trimmed, up_trimmed, linewidth=2, color="red")
+        ax.plot(time_trimmed, up_trimmed, linewidth=2, color="red")
 
-        plt.xlabel("Time (s)")
-        plt.ylabel(f"{magnitude} (pu)")
-        plt.title(title)
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel(f"{magnitude} (pu)")
+        ax.set_title(title)
 
-        plt.axvline(
+        ax.axvline(
             x=event_time + shift_time / 1000,
             color="black",
             linestyle="--",
@@ -292,11 +346,11 @@ def plot_results(
 
         if params_list:
             full_text = "\n".join(params_list)
-            plt.text(
+            ax.text(
                 0.98,
                 0.98,
                 full_text,
-                transform=plt.gca().transAxes,
+                transform=ax.transAxes,
                 fontsize=9,
                 verticalalignment="top",
                 horizontalalignment="right",
@@ -304,11 +358,11 @@ def plot_results(
             )
 
         if show_disclaimer:
-            plt.text(
+            ax.text(
                 0.02,
                 0.02,
                 disclaimer_text_mpl,
-                transform=plt.gca().transAxes,
+                transform=ax.transAxes,
                 fontsize=8,
                 color="red",
                 verticalalignment="bottom",
@@ -317,11 +371,11 @@ def plot_results(
             )
 
         # Add watermark text to Matplotlib plot ---
-        plt.text(
+        ax.text(
             0.98,
             0.02,
             watermark_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             fontsize=12,
             color="gray",
             alpha=0.3,  # Semi-transparent
@@ -330,13 +384,12 @@ def plot_results(
         )
 
         # Apply layout adjustments and export
-        plt.legend(loc="center left", bbox_to_anchor=(1, 0.5), fontsize="small")
-        plt.grid(True, linestyle="--", alpha=0.6)
-        plt.xlim(time_trimmed[0], time_trimmed[-1])
+        ax.legend(loc="center left", bbox_to_anchor=(1, 0.5), fontsize="small")
+        ax.grid(True, linestyle="--", alpha=0.6)
+        ax.set_xlim(time_trimmed[0], time_trimmed[-1])
 
-        plt.tight_layout()
-        plt.savefig(path.with_suffix(".png"), bbox_inches="tight", dpi=300)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(path.with_suffix(".png"), bbox_inches="tight", dpi=300)
 
     # --- Interactive Plot Generation via Plotly (HTML) ---
     if "html" in output_format:
@@ -12,12 +12,50 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 import numpy as np
+import pandas as pd
 
 from dycov.configuration.cfg import config
 from dycov.core.parameters import Parameters
 from dycov.files import model_parameters
+from dycov.gfm import constants
 from dycov.gfm.producer import GFMProducer
 
+# Columns accepted in a parameter sweep file
+SWEEP_COLUMNS = ("D", "H", "Xeff")
+
+
+def _read_sweep(sweep: Path) -> dict:
+    """Reads a parameter sweep file: a CSV table, separated by ';' or ',', with D, H
+    and/or Xeff columns and one parameter set per row.
+
+    Parameters
+    ----------
+    sweep : Path
+        The path of the sweep file.
+
+    Returns
+    -------
+    dict
+        The float array of each column present in the file, keyed by column name.
+    """
+    table = pd.read_csv(sweep, sep=r"\s*[;,]\s*", engine="python")
+    table.columns = [str(column).strip() for column in table.columns]
+    unknown = [column for column in table.columns if column not in SWEEP_COLUMNS]
+    if unknown:
+        raise ValueError(
+            f"Unknown columns in the sweep file {sweep}: {', '.join(unknown)}. "
+            f"Valid columns are: {', '.join(SWEEP_COLUMNS)}"
+        )
+    if table.empty:
+        raise ValueError(f"The sweep file {sweep} has no parameter sets")
+    try:
+        values = {column: table[column].to_numpy(dtype=float) for column in table.columns}
+    except ValueError as e:
+        raise ValueError(f"Non-numeric value in the sweep file {sweep}: {e}") from e
+    if any(np.isnan(column).any() for column in values.values()):
+        raise ValueError(f"Missing values in the sweep file {sweep}")
+    return values
+
 
 class GFMParameters(Parameters):
     """
@@ -36,6 +74,8 @@ class GFMParameters(Parameters):
         output_dir: Path,
         only_dtr: bool,
         emt: bool,
+        sweep: Optional[Path] = None,
+        output_formats: Optional[tuple[str, ...]] = None,
     ) -> None:
         """
         Initializes the GFMParameters configuration instance.
@@ -55,10 +95,20 @@ class GFMParameters(Parameters):
         emt : bool
             A flag defining whether the Electro-Magnetic Transients (EMT) simulation engine is
             enabled.
+        sweep : Path, optional
+            A CSV file with the D, H and/or Xeff parameter sets whose envelopes are generated
+            instead of those of the producer parameters.
+        output_formats : tuple[str, ...], optional
+            The output files written for each operating condition, among 'csv', 'png' and
+            'html'. Defaults to all of them.
         """
         super().__init__(None, selected_pcs, output_dir, only_dtr)
         self._emt = emt
         self._producer = GFMProducer(producer_ini)
+        self._sweep = _read_sweep(sweep) if sweep else None
+        self._output_formats = (
+            tuple(output_formats) if output_formats is not None else constants.OUTPUT_FORMATS
+        )
 
     def set_section(self, pcs_name: str, bm_name: str, oc_name: str) -> None:
         """
@@ -99,6 +149,40 @@ class GFMParameters(Parameters):
         """
         return self._emt
 
+    def get_sweep(self) -> Optional[dict]:
+        """
+        Returns the parameter sets of the sweep requested by the user.
+
+        Returns
+        -------
+        Optional[dict]
+            The values of each column of the sweep file (D, H and/or Xeff), keyed by column
+            name, or None if no sweep was requested.
+        """
+        return self._sweep
+
+    def get_output_formats(self) -> tuple[str, ...]:
+        """
+        Returns the output files to write for each operating condition.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The requested formats, among 'csv', 'png' and 'html'.
+        """
+        return self._output_formats
+
+    def use_adaptive_time_grid(self) -> bool:
+        """
+        Determines whether the envelopes are exported on an adaptive time grid.
+
+        Returns
+        -------
+        bool
+            True if 'adaptive_time_grid' is enabled in the GFM configuration (default True).
+        """
+        return config.get_boolean("GFM", "adaptive_time_grid", True)
+
     def get_calculator_name(self) -> str:
         """
         Retrieves the designated calculator strategy name for the current PCS and benchmark.
@@ -14,17 +14,21 @@ from typing import Optional
 
 # Import functions from the new modules
 from dycov.cli.cli_parsers import setup_cli_parsers
-from dycov.cli.command_handlers import (
-    handle_anonymize_command,
-    handle_compile_command,
-    handle_generate_command,
-    handle_generate_envelopes_command,
-    handle_performance_command,
-    handle_validate_command,
-)
 from dycov.cli.utils import check_dynawo_launcher_availability, get_dynawo_launcher_name
 from dycov.core.initialization import DycovInitializer
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
+
+# Handler of each command in dycov.cli.command_handlers, and whether it receives the
+# Dynawo launcher. The handlers are imported on dispatch to keep the startup light.
+_COMMAND_HANDLERS = {
+    "generateEnvelopes": ("handle_generate_envelopes_command", False),
+    "validate": ("handle_validate_command", True),
+    "generate": ("handle_generate_command", True),
+    "compile": ("handle_compile_command", True),
+    "performance": ("handle_performance_command", True),
+    "anonymize": ("handle_anonymize_command", False),
+    "serve": ("handle_serve_command", False),
+}
 
 
 class DycovCLI:
@@ -58,6 +62,12 @@ class DycovCLI:
             parser.error("Please provide a command. Use 'dycov --help' for available commands.")
             return 1
 
+        if args.command == "submit":
+            # The client stays thin: the daemon initializes the tool and runs the job
+            from dycov.cli import server
+
+            return server.submit(args.socket or server.default_address(), args.job, args.stop)
+
         return self._execute_command(parser, args)
 
     def _execute_command(self, parser, args) -> int:
@@ -94,7 +104,26 @@ class DycovCLI:
         self.logger.debug("DycovInitializer completed initialization.")
 
         # Dispatch the command to the appropriate handler function.
-        return self._dispatch_command(parser, args, dynawo_launcher_path)
+        if not getattr(args, "profile", None):
+            return self._dispatch_command(parser, args, dynawo_launcher_path)
+
+        profiling.enable()
+        try:
+            return self._dispatch_command(parser, args, dynawo_launcher_path)
+        finally:
+            self._write_profile(Path(args.profile))
+
+    def _write_profile(self, trace_file: Path) -> None:
+        """Writes the Chrome trace of the command and logs the time spent in each stage.
+
+        Parameters
+        ----------
+        trace_file : Path
+            Trace file to write.
+        """
+        events = profiling.write_trace(trace_file)
+        self.logger.info(f"Profiling trace written to {trace_file.resolve()}")
+        self.logger.info("Time per stage:\n" + profiling.summary(events))
 
     def _apply_diagnostic_mode(self, args):
         if not getattr(args, "diagnostic", False):
@@ -124,24 +153,21 @@ class DycovCLI:
             Resolved path to the Dynawo launcher executable, if required.
         """
         self.logger.info(f"Dispatching command: {args.command}")
-        if args.command == "generateEnvelopes":
-            ret = handle_generate_envelopes_command(parser, args)
-        elif args.command == "validate":
-            ret = handle_validate_command(parser, args, dynawo_launcher_path)
-        elif args.command == "generate":
-            ret = handle_generate_command(parser, args, dynawo_launcher_path)
-        elif args.command == "compile":
-            ret = handle_compile_command(parser, args, dynawo_launcher_path)
-        elif args.command == "performance":
-            ret = handle_performance_command(parser, args, dynawo_launcher_path)
-        elif args.command == "anonymize":
-            ret = handle_anonymize_command(parser, args)
-        else:
+        if args.command not in _COMMAND_HANDLERS:
             # This case should ideally not be reached due to argparse
             # configuration, but it serves as a safeguard.
             self.logger.error(f"Unknown command: {args.command}")
             parser.print_help()
-            ret = 1
+            return 1
+
+        from dycov.cli import command_handlers
+
+        handler_name, takes_launcher = _COMMAND_HANDLERS[args.command]
+        handler = getattr(command_handlers, handler_name)
+        if takes_launcher:
+            ret = handler(parser, args, dynawo_launcher_path)
+        else:
+            ret = handler(parser, args)
         return ret
 
 
@@ -116,6 +116,13 @@ class DycovLogger(logging.getLoggerClass()):
         disable_file: bool, optional
             If True, the file handler will not be added. Default is False.
         """
+        # Replace the handlers of a previous initialization (e.g. in a daemon that
+        # initializes each job), so records are not written twice
+        for handler in getattr(self, "_dycov_handlers", []):
+            self.removeHandler(handler)
+            handler.close()
+        previous_handlers = list(self.handlers)
+
         # Set the effective level to the lowest of console/file levels
         self.setLevel(console_log_level)
         if file_log_level < console_log_level:
@@ -125,6 +132,7 @@ class DycovLogger(logging.getLoggerClass()):
         self._add_file_handler(
             file_log_level, file_formatter, file_max_bytes, log_dir, disable_file
         )
+        self._dycov_handlers = [h for h in self.handlers if h not in previous_handlers]
 
     def enable_warning_capture(self, force_runtimewarning_visible: bool = True) -> None:
         """
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Timing spans for the main processing stages.
+
+Profiling is enabled for the current process and its children (worker processes
+inherit the environment) with `enable()`. Each process keeps its spans in memory and
+appends them to its own file in the trace directory on `flush()`; `write_trace()`
+merges the files of all processes into a single Chrome trace.
+
+Every span also samples the resident set size (RSS) of its process when the stage
+starts and ends, and the peak RSS of the process when it ends, so the memory growth
+of each stage can be read next to its duration.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from dycov.logging.test_context import get_test_context_parts
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_TRACE_DIR_ENV = "DYCOV_PROFILE_DIR"
+
+_events: list = []
+_events_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # Forked workers must not write the spans pending in their parent again
+    global _events_lock
+    _events_lock = threading.Lock()
+    _events.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _read_proc_status(field: str) -> Optional[float]:
+    # Memory fields of /proc/self/status (Linux) are in kB
+    try:
+        with open("/proc/self/status", encoding="ascii") as file:
+            for line in file:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024.0
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Returns the resident set size of this process in MB, or None if the platform
+    does not report it."""
+    return _read_proc_status("VmRSS")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Returns the peak resident set size of this process in MB (since it started or
+    since the last `reset_peak_rss()`), or None if the platform does not report it."""
+    peak = _read_proc_status("VmHWM")
+    if peak is None and resource is not None:
+        # ru_maxrss is in kB on Linux and in bytes on macOS
+        scale = 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    return peak
+
+
+def children_usage() -> Optional[tuple[float, float]]:
+    """Returns the usage of the child processes of this process that have finished and
+    been waited for, such as the Dynawo simulations, or None if the platform does not
+    report it.
+
+    Returns
+    -------
+    tuple[float, float]
+        The largest peak RSS of the children in MB, and their total CPU time in seconds.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    scale = 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+    return usage.ru_maxrss / scale, usage.ru_utime + usage.ru_stime
+
+
+def reset_peak_rss() -> bool:
+    """Resets the peak RSS of this process to its current RSS, so the next
+    `peak_rss_mb()` measures a single task.
+
+    Returns
+    -------
+    bool
+        False if the platform does not allow it (only Linux does); the peak then
+        covers the whole life of the process.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _memory_args(rss_start: Optional[float]) -> dict:
+    rss_end = current_rss_mb()
+    if rss_end is None:
+        return {}
+    return {
+        "rss_mb": round(rss_end, 1),
+        "rss_delta_mb": round(rss_end - rss_start, 1) if rss_start is not None else None,
+        "peak_rss_mb": round(peak_rss_mb() or rss_end, 1),
+    }
+
+
+def is_enabled() -> bool:
+    """Returns True if profiling is enabled in this process."""
+    return _TRACE_DIR_ENV in os.environ
+
+
+def enable() -> Path:
+    """Enables profiling for this process and the processes it starts.
+
+    Returns
+    -------
+    Path
+        Temporary directory where each process stores its spans.
+    """
+    trace_dir = Path(tempfile.mkdtemp(prefix="dycov_profile_"))
+    os.environ[_TRACE_DIR_ENV] = str(trace_dir)
+    return trace_dir
+
+
+def disable() -> None:
+    """Disables profiling and discards the spans not yet written."""
+    trace_dir = os.environ.pop(_TRACE_DIR_ENV, None)
+    with _events_lock:
+        _events.clear()
+    if trace_dir:
+        shutil.rmtree(trace_dir, ignore_errors=True)
+
+
+@contextmanager
+def span(name: str):
+    """Times the enclosed block (or the decorated function) as a stage named name,
+    tagged with the PCS, benchmark and operating condition of the current thread.
+    It does nothing when profiling is disabled.
+
+    Parameters
+    ----------
+    name : str
+        Stage name.
+    """
+    if not is_enabled():
+        yield
+        return
+
+    pcs, benchmark, oc = get_test_context_parts()
+    rss_start = current_rss_mb()
+    start_ns = time.time_ns()
+    try:
+        yield
+    finally:
+        end_ns = time.time_ns()
+        args = {"pcs": pcs, "benchmark": benchmark, "oc": oc}
+        args.update(_memory_args(rss_start))
+        event = {
+            "name": name,
+            "cat": "dycov",
+            "ph": "X",
+            "ts": start_ns / 1000.0,
+            "dur": (end_ns - start_ns) / 1000.0,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+        with _events_lock:
+            _events.append(event)
+
+
+def flush() -> None:
+    """Appends the spans recorded by this process to its file in the trace directory.
+    Worker processes call it at the end of each task, since they may exit without
+    running any cleanup."""
+    trace_dir = os.environ.get(_TRACE_DIR_ENV)
+    if not trace_dir:
+        return
+    with _events_lock:
+        events = list(_events)
+        _events.clear()
+    if not events:
+        return
+    with open(Path(trace_dir) / f"trace-{os.getpid()}.jsonl", "a", encoding="utf-8") as file:
+        for event in events:
+            file.write(json.dumps(event) + "\n")
+
+
+def collect() -> list:
+    """Returns the spans recorded by this process and by its workers, sorted by start
+    time.
+
+    Returns
+    -------
+    list
+        Spans as Chrome trace events.
+    """
+    flush()
+    trace_dir = os.environ.get(_TRACE_DIR_ENV)
+    if not trace_dir:
+        return []
+    events = []
+    for trace_file in sorted(Path(trace_dir).glob("trace-*.jsonl")):
+        with open(trace_file, encoding="utf-8") as file:
+            events.extend(json.loads(line) for line in file if line.strip())
+    return sorted(events, key=lambda event: event["ts"])
+
+
+def write_trace(output_file: Path) -> list:
+    """Writes all the spans in Chrome trace format (viewable in chrome://tracing or
+    Perfetto) and disables profiling.
+
+    Parameters
+    ----------
+    output_file : Path
+        Trace file to write.
+
+    Returns
+    -------
+    list
+        Spans written.
+    """
+    events = collect()
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+    disable()
+    return events
+
+
+def summary(events: list, group_by: Optional[str] = None) -> str:
+    """Returns a text table with the number of calls, the total, mean and maximum
+    duration, the largest RSS growth and the peak RSS of each stage.
+
+    Parameters
+    ----------
+    events : list
+        Spans as returned by collect().
+    group_by : str, optional
+        Tag ("pcs", "benchmark" or "oc") whose value is appended to the stage name.
+
+    Returns
+    -------
+    str
+        Summary table, sorted by total duration.
+    """
+    durations = defaultdict(list)
+    rss_deltas = defaultdict(list)
+    peaks = defaultdict(list)
+    for event in events:
+        name = event["name"]
+        if group_by and event["args"].get(group_by):
+            name = f"{name} [{event['args'][group_by]}]"
+        durations[name].append(event["dur"] / 1e6)
+        if event["args"].get("rss_delta_mb") is not None:
+            rss_deltas[name].append(event["args"]["rss_delta_mb"])
+        if event["args"].get("peak_rss_mb") is not None:
+            peaks[name].append(event["args"]["peak_rss_mb"])
+
+    def _max_mb(values: list) -> str:
+        return f"{max(values):.1f}" if values else "-"
+
+    width = max([len("Stage")] + [len(name) for name in durations])
+    lines = [
+        f"{'Stage':<{width}}  {'Calls':>6}  {'Total (s)':>10}  {'Mean (s)':>9}  {'Max (s)':>8}"
+        f"  {'dRSS (MB)':>10}  {'Peak (MB)':>10}"
+    ]
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        lines.append(
+            f"{name:<{width}}  {len(values):>6}  {sum(values):>10.3f}  "
+            f"{sum(values) / len(values):>9.3f}  {max(values):>8.3f}  "
+            f"{_max_mb(rss_deltas[name]):>10}  {_max_mb(peaks[name]):>10}"
+        )
+    return "\n".join(lines)
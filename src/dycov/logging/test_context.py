@@ -41,3 +41,12 @@ def get_test_context() -> str:
         parts = [p for p in (pcs, benchmark, oc) if p]
         return ".".join(parts)
     return ""
+
+
+def get_test_context_parts() -> tuple:
+    """Return the active (pcs, benchmark, oc) of the current thread, each None if unset."""
+    return (
+        getattr(_local, "pcs", None),
+        getattr(_local, "benchmark", None),
+        getattr(_local, "oc", None),
+    )
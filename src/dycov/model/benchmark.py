@@ -812,24 +812,39 @@ class Benchmark:
 
         return success
 
-    def generate(self) -> None:
-        """Execute the generation step for all operating conditions of the benchmark."""
+    @staticmethod
+    def generate_operating_condition(
+        parameters: Parameters,
+        producer_name: str,
+        pcs_name: str,
+        benchmark_name: str,
+        oc_name: str,
+    ) -> None:
+        """Execute the generation step for a single operating condition of a benchmark.
 
-        for op_cond in self._oc_list:
-            dycov_logging.set_test_context(
-                pcs=self._pcs_name,
-                benchmark=self._name,
-                oc=op_cond.get_name(),
-            )
-            dycov_logging.get_logger("Benchmark").info("Generate")
-            working_oc_dir = (
-                self._working_dir
-                / self._producer_name
-                / self._pcs_name
-                / self._name
-                / op_cond.get_name()
-            )
-            op_cond.generate(working_oc_dir)
+        It does not need the benchmark to be built, so that each operating condition can
+        be generated by a different process; the working directory of the operating
+        condition is created when the benchmark is built.
+
+        Parameters
+        ----------
+        parameters: Parameters
+            Tool parameters
+        producer_name: str
+            Producer name
+        pcs_name: str
+            PCS name
+        benchmark_name: str
+            Benchmark name
+        oc_name: str
+            Operating condition name
+        """
+        dycov_logging.set_test_context(pcs=pcs_name, benchmark=benchmark_name, oc=oc_name)
+        dycov_logging.get_logger("Benchmark").info("Generate")
+        working_oc_dir = (
+            parameters.get_working_dir() / producer_name / pcs_name / benchmark_name / oc_name
+        )
+        OperatingCondition(parameters, pcs_name, benchmark_name, oc_name).generate(working_oc_dir)
 
     def get_name(self) -> str:
         """Get the benchmark name.
@@ -841,6 +856,16 @@ class Benchmark:
         """
         return self._name
 
+    def get_operating_condition_names(self) -> list[str]:
+        """Get the names of the operating conditions of the benchmark.
+
+        Returns
+        -------
+        list[str]
+            Operating condition names
+        """
+        return [op_cond.get_name() for op_cond in self._oc_list]
+
     def get_figures_description(self) -> list:
         """Get the figure description.
 
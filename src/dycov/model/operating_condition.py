@@ -16,7 +16,7 @@ from dycov.core.parameters import Parameters
 from dycov.core.validator import Validator
 from dycov.curves.curves import get_cfg_oc_name
 from dycov.gfm.gfm import GridForming
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
 
 
 class OperatingCondition:
@@ -68,13 +68,14 @@ class OperatingCondition:
             get_cfg_oc_name(self._pcs_name, self._bm_name, self._name),
             self._name,
         )
-        results = validator.validate(
-            self._name,
-            working_oc_dir,
-            jobs_output_dir,
-            event_params,
-            has_reference=has_reference,
-        )
+        with profiling.span("validation_checks"):
+            results = validator.validate(
+                self._name,
+                working_oc_dir,
+                jobs_output_dir,
+                event_params,
+                has_reference=has_reference,
+            )
 
         if not validator.has_validations():
             results["compliance"] = None
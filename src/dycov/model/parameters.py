@@ -34,7 +34,7 @@ class CurvesAvailability(IntEnum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Terminal:
     """Electrical terminal initial conditions and connections."""
 
@@ -45,7 +45,7 @@ class Terminal:
     q0: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Equipment:
     """Base class for network equipment parameters."""
 
@@ -55,7 +55,7 @@ class Equipment:
     terminals: tuple[Terminal, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class BusParams(Equipment):
     """Parameters of an electrical bus."""
 
@@ -63,7 +63,7 @@ class BusParams(Equipment):
     v_max: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LineParams(Equipment):
     """Parameters of a transmission line."""
 
@@ -73,7 +73,7 @@ class LineParams(Equipment):
     g: float
 
 
-@dataclass
+@dataclass(slots=True)
 class XfmrParams(Equipment):
     """Parameters of a transformer."""
 
@@ -85,7 +85,7 @@ class XfmrParams(Equipment):
     alpha_tfo: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadParams(Equipment):
     """Parameters of a load model."""
 
@@ -97,7 +97,7 @@ class LoadParams(Equipment):
     beta: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GenParams(Equipment):
     """Parameters of a generator model."""
 
@@ -128,7 +128,7 @@ class PdrEquipments:
     var: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PdrParams:
     """Electrical quantities at the PDR connection point."""
 
@@ -46,6 +46,7 @@ class Pcs:
 
         self._has_pcs_config = False
         self._has_user_config = False
+        self._config_paths = []
 
         report_name, bms_by_pcs, pcs_id, pcs_zone = self.__prepare_pcs_config(self._producer)
         self._producer.set_zone(pcs_zone, producer_name)
@@ -78,6 +79,7 @@ class Pcs:
         dycov_logging.get_logger("PCS").debug(f"PCS Path {pcs_path}")
         if pcs_path and pcs_path.exists():
             config.load_pcs_config(pcs_path)
+            self._config_paths.append(pcs_path)
             self._has_pcs_config = True
 
         # It checks if the PCS configuration file exists in the user directory and reads it.
@@ -87,6 +89,7 @@ class Pcs:
         dycov_logging.get_logger("PCS").debug(f"User PCS Path {pcs_path}")
         if pcs_path and pcs_path.exists():
             config.load_pcs_config(pcs_path)
+            self._config_paths.append(pcs_path)
             self._has_user_config = True
 
         # Read configurations
@@ -148,11 +151,29 @@ class Pcs:
 
         return self._report_name, success, pcs_results
 
-    def generate(self) -> None:
-        """Execute the generation step for all benchmarks of the current PCS."""
+    def get_operating_conditions(self) -> list[tuple[str, str]]:
+        """Get the operating conditions of all the benchmarks of the PCS.
 
-        for bm in self._bm_list:
-            bm.generate()
+        Returns
+        -------
+        list[tuple[str, str]]
+            Benchmark and operating condition names, in generation order
+        """
+        return [
+            (bm.get_name(), oc_name)
+            for bm in self._bm_list
+            for oc_name in bm.get_operating_condition_names()
+        ]
+
+    def get_config_paths(self) -> list[Path]:
+        """Get the PCS configuration files loaded for the PCS.
+
+        Returns
+        -------
+        list[Path]
+            Tool and user PCS configuration files, in loading order
+        """
+        return self._config_paths
 
     def get_zone(self) -> int:
         """Get the zone of the PCS.
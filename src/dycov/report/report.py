@@ -33,7 +33,7 @@ from dycov.core.global_variables import (
     REPORT_NAME,
 )
 from dycov.files import manage_files
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
 from dycov.report import figure, html
 from dycov.report.curve_classification import get_curve_style
 from dycov.report.tables import (
@@ -112,6 +112,7 @@ def terminate_all_children(timeout: float = 5.0) -> None:
                 pass
 
 
+@profiling.span("pdflatex")
 def _run_pdflatex(working_path: Path, report_name_noext: str):
     """Run pdflatex in a controllable way (as a process group) so we can terminate it on abort."""
     proc = subprocess.Popen(
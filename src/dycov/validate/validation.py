@@ -12,14 +12,13 @@ import logging
 import operator
 import os
 import shutil
-import signal
 import subprocess
 import sys
-from multiprocessing import Pool
 from operator import attrgetter
 from pathlib import Path
 
 from dycov.configuration.cfg import config
+from dycov.core import memory_budget, worker_pool
 from dycov.core.global_variables import (
     CASE_SEPARATOR,
     ELECTRIC_PERFORMANCE_BESS,
@@ -32,12 +31,15 @@ from dycov.core.global_variables import (
 )
 from dycov.core.graceful_shutdown import terminate_all_children
 from dycov.files import manage_files
-from dycov.logging import dycov_logging
+from dycov.logging import dycov_logging, profiling
 from dycov.model.pcs import Pcs
 from dycov.report import report
 from dycov.report.LatexReportException import LatexReportException
 from dycov.validate.parameters import ValidationParameters
 
+# Keys of the PCS results read by the report of the main process
+_REPORT_KEYS = ("producer", "report_name", "sim_type", "success")
+
 
 def _open_document(file: Path, is_testing: bool) -> None:
     """Opens a document using the appropriate system command.
@@ -63,11 +65,6 @@ def _open_document(file: Path, is_testing: bool) -> None:
             dycov_logging.get_logger("Validation").info(f"Report saved in: {file}")
 
 
-def _worker_initializer():
-    """Workers ignore SIGINT; main process coordinates shutdown."""
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
-
-
 def _validate_pcs(pcs_args) -> tuple:
     """Helper function to validate a single PCS.
 
@@ -107,6 +104,46 @@ def _validate_pcs(pcs_args) -> tuple:
                 f"Aborted execution for {pcs.get_name()}. {e}"
             )
         return pcs.get_producer_name(), pcs.get_name(), summary_list, {}
+    finally:
+        rss_mb = profiling.current_rss_mb()
+        if rss_mb is not None:
+            children = profiling.children_usage()
+            children_peak = f", simulations peak {children[0]:.0f} MB" if children else ""
+            dycov_logging.get_logger("Validation").info(
+                f"{producer_name} {pcs_name}: RSS {rss_mb:.0f} MB, "
+                f"peak {profiling.peak_rss_mb() or rss_mb:.0f} MB{children_peak}"
+            )
+        # Save the spans of this worker before it picks another task (or exits)
+        profiling.flush()
+
+
+def _validate_shared_pcs(task: tuple) -> tuple:
+    """Validates a PCS in a pool worker, taking the parameters and the path to the LaTeX
+    files from the state published for the run. The worker has already written the
+    figures and the LaTeX files of the PCS, so only the keys of the results read by the
+    report are sent back, without the curves and the Pcs object.
+
+    Parameters
+    ----------
+    task : tuple
+        A tuple containing the state file, PCS name and producer name.
+
+    Returns
+    -------
+    tuple
+        A tuple containing producer name, PCS name, summary list, and PCS results.
+    """
+    state_file, pcs_name, producer_name = task
+    parameters, path_latex_files = worker_pool.load_state(state_file)
+    producer_name, pcs_name, summary_list, pcs_results = _validate_pcs(
+        (parameters, pcs_name, producer_name, path_latex_files)
+    )
+    pcs_results = {key: pcs_results[key] for key in _REPORT_KEYS if key in pcs_results}
+    return producer_name, pcs_name, summary_list, pcs_results
+
+
+def _pcs_task_label(task: tuple) -> str:
+    return f"{task[2]} {task[1]}"
 
 
 def _prepare_report_pcs(
@@ -352,18 +389,38 @@ class Validation:
             dycov_logging.get_logger("Validation").info(
                 f"Validating PCS in parallel using {num_processes} processes."
             )
-            # Use an initializer so only the main process handles SIGINT
-            with Pool(processes=num_processes, initializer=_worker_initializer) as pool:
+            budget_mb = config.get_float("Global", "parallel_memory_budget_mb", 0.0)
+            producer = self._parameters.get_producer()
+            # Parse the producer model before forking, so that the workers inherit it
+            worker_pool.preload(
+                producer.get_producer_path() if producer.is_dynawo_model() else None
+            )
+            pool = worker_pool.get_pool(num_processes)
+            with worker_pool.shared_state(
+                (self._parameters, self._path_latex_files)
+            ) as state_file:
+                tasks = [
+                    (state_file, pcs_name, producer_name)
+                    for _, pcs_name, producer_name, _ in self._pcs_list
+                ]
                 try:
-                    results = pool.map(_validate_pcs, self._pcs_list)
-                    pool.close()
-                    pool.join()
+                    if budget_mb > 0:
+                        results = memory_budget.map_with_budget(
+                            pool,
+                            _validate_shared_pcs,
+                            tasks,
+                            num_processes,
+                            budget_mb,
+                            config.get_float("Global", "parallel_task_memory_mb", 1024.0),
+                            label=_pcs_task_label,
+                        )
+                    else:
+                        results = pool.map(_validate_shared_pcs, tasks)
                 except KeyboardInterrupt:
                     # 1) Terminate external children before tearing down the pool
                     terminate_all_children(timeout=5.0)
                     # 2) Stop workers cleanly, avoiding multiple worker tracebacks
-                    pool.terminate()
-                    pool.join()
+                    worker_pool.shutdown(terminate=True)
                     logger = dycov_logging.get_logger("Validation")
                     logger.error(
                         "Execution interrupted by user (SIGINT). "
@@ -371,6 +428,8 @@ class Validation:
                     )
                     # Propagate conventional exit code for SIGINT
                     raise SystemExit(130)
+                finally:
+                    worker_pool.release()
             # Collect results only if we reached here (no interrupt)
             for producer_name, pcs_name, summary, pcs_results in results:
                 summary_list.extend(summary)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from dycov.cli import server
+from dycov.configuration.cfg import config
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+
+
+class _FakeChannel:
+    def __init__(self):
+        self.messages = []
+
+    def send(self, **message):
+        self.messages.append(message)
+        return True
+
+    def output(self, stream):
+        return "".join(m["out"] for m in self.messages if m.get("stream") == stream)
+
+
+@pytest.fixture
+def daemon(mocker):
+    mocker.patch("dycov.cli.cli_parsers.version", return_value="0.0")
+    return server._Daemon()
+
+
+def test_run_job_streams_output_and_restores_state(daemon, mocker, tmp_path):
+    previous = config.get_value("Global", "parallel_num_processes")
+
+    def execute(parser, args):
+        print(f"running {args.command} in {os.getcwd()}")
+        config.set_value("Global", "parallel_num_processes", "7")
+        return 3
+
+    mocker.patch.object(daemon._cli, "_execute_command", side_effect=execute)
+    channel = _FakeChannel()
+    daemon_dir = os.getcwd()
+
+    code = daemon.run_job(["validate", "Reference"], str(tmp_path), channel)
+
+    assert code == 3
+    assert channel.output("stdout") == f"running validate in {tmp_path}\n"
+    assert os.getcwd() == daemon_dir
+    assert config.get_value("Global", "parallel_num_processes") == previous
+
+
+def test_run_job_rejects_other_commands(daemon):
+    channel = _FakeChannel()
+
+    assert daemon.run_job(["serve"], None, channel) == 2
+    assert "cannot be submitted" in channel.output("stderr")
+    assert daemon.run_job(["validate"], None, channel) == 2
+    assert "required: reference" in channel.output("stderr")
+
+
+def test_submit_to_daemon(mocker, capsys):
+    mocker.patch("dycov.core.worker_pool.shutdown")
+
+    def run_job(self, argv, cwd, channel):
+        channel.send(out=f"{' '.join(argv)} from {cwd}\n", stream="stdout")
+        return 5
+
+    mocker.patch.object(server._Daemon, "run_job", run_job)
+    # Unix socket paths are limited to about 100 characters
+    address = str(Path(tempfile.mkdtemp(prefix="dycov_")) / "d.sock")
+    daemon = threading.Thread(target=server.serve, args=(address,))
+    daemon.start()
+    try:
+        while not server._is_running(address):
+            assert daemon.is_alive()
+
+        assert os.stat(address).st_mode & 0o777 == 0o600
+        assert server.submit(address, ["--", "validate", "Reference"]) == 5
+        assert capsys.readouterr().out == f"validate Reference from {os.getcwd()}\n"
+    finally:
+        assert server.submit(address, [], stop=True) == 0
+        daemon.join(timeout=10)
+
+    assert not daemon.is_alive()
+    assert not os.path.exists(address)
+    os.rmdir(os.path.dirname(address))
+
+
+def test_tcp_daemon_requires_token(mocker, capsys, tmp_path):
+    mocker.patch("dycov.core.worker_pool.shutdown")
+    mocker.patch.object(server, "_token_path", return_value=tmp_path / "token")
+    mocker.patch.object(server._Daemon, "run_job", lambda self, argv, cwd, channel: 5)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        address = f"127.0.0.1:{sock.getsockname()[1]}"
+    daemon = threading.Thread(target=server.serve, args=(address,))
+    daemon.start()
+    try:
+        while not (tmp_path / "token").exists() or not server._is_running(address):
+            assert daemon.is_alive()
+        assert (tmp_path / "token").stat().st_mode & 0o777 == 0o600
+
+        with socket.create_connection(("127.0.0.1", int(address.split(":")[1]))) as sock:
+            with sock.makefile("rwb") as stream:
+                stream.write(b'{"argv": ["validate", "Reference"], "token": "guess"}\n')
+                stream.flush()
+                replies = [json.loads(line) for line in stream]
+        assert replies[-1] == {"exit": 2}
+        assert "invalid token" in replies[0]["out"]
+
+        assert server.submit(address, ["validate", "Reference"]) == 5
+    finally:
+        assert server.submit(address, [], stop=True) == 0
+        daemon.join(timeout=10)
+
+    assert not daemon.is_alive()
+    assert not (tmp_path / "token").exists()
+
+
+def test_submit_without_daemon(capsys):
+    assert server.submit(os.path.join(tempfile.gettempdir(), "missing.sock"), ["validate"]) == 1
+    assert "cannot connect" in capsys.readouterr().err
@@ -9,6 +9,8 @@
 #
 
 import configparser
+import os
+from pathlib import Path
 
 import pytest
 
@@ -129,3 +131,133 @@ def test_get_list_empty_or_missing_returns_empty_list(tmp_path):
     assert cfg.get_list("empty_section", "missing") == []
     # Missing section returns empty list
     assert cfg.get_list("no_section", "no_key") == []
+
+
+def test_lookups_are_memoized(config_with_priority, monkeypatch):
+    calls = []
+    has_option = config_with_priority._user_config.has_option
+    monkeypatch.setattr(
+        config_with_priority._user_config,
+        "has_option",
+        lambda section, key: calls.append((section, key)) or has_option(section, key),
+    )
+    for _ in range(3):
+        assert config_with_priority.get_value("section", "key") == "user_value"
+        assert config_with_priority.get_value("section", "missing") is None
+    assert calls == [("section", "key"), ("section", "missing")]
+
+
+def test_set_value_invalidates_memoized_lookups(tmp_path):
+    default_config = configparser.ConfigParser()
+    default_config.add_section("section")
+    default_config.set("section", "number", "1.5")
+    default_config.set("section", "flag", "false")
+    cfg = Config(
+        tmp_path, default_config, configparser.ConfigParser(), configparser.ConfigParser()
+    )
+    assert cfg.get_float("section", "number", 0.0) == 1.5
+    assert cfg.get_boolean("section", "flag") is False
+
+    cfg.set_value("section", "number", "2.5")
+    cfg.set_value("section", "flag", "True")
+    assert cfg.get_float("section", "number", 0.0) == 2.5
+    assert cfg.get_boolean("section", "flag") is True
+
+
+def test_load_pcs_config_invalidates_memoized_lookups(tmp_path):
+    cfg = Config(
+        tmp_path,
+        configparser.ConfigParser(),
+        configparser.ConfigParser(),
+        configparser.ConfigParser(),
+    )
+    assert cfg.get_int("pcs_section", "count", 0) == 0
+
+    pcs_file = tmp_path / "pcs.ini"
+    pcs_file.write_text("[pcs_section]\ncount=3\n")
+    cfg.load_pcs_config(pcs_file)
+    assert cfg.get_int("pcs_section", "count", 0) == 3
+
+
+def _write_pcs_with_aliases(tmp_path, alias_value):
+    pcs_dir = tmp_path / "PCS" / "PCS_1"
+    pcs_dir.mkdir(parents=True)
+    (tmp_path / "PCS" / "config_aliases.ini").write_text(
+        f"[common]\nShared={alias_value}\nOverridden=alias\n"
+    )
+    pcs_file = pcs_dir / "PCS_1.ini"
+    pcs_file.write_text("[PCS_1]\ninherit=common\nOverridden=pcs\n")
+    return pcs_file
+
+
+def _empty_config(tmp_path):
+    return Config(
+        tmp_path,
+        configparser.ConfigParser(),
+        configparser.ConfigParser(),
+        configparser.ConfigParser(),
+    )
+
+
+def test_load_pcs_config_inherits_alias_sections(tmp_path):
+    pcs_file = _write_pcs_with_aliases(tmp_path, "1")
+    cfg = _empty_config(tmp_path)
+    cfg.load_pcs_config(pcs_file)
+    assert cfg.get_value("PCS_1", "Shared") == "1"
+    assert cfg.get_value("PCS_1", "Overridden") == "pcs"
+    assert cfg.get_value("PCS_1", "inherit") is None
+
+
+def test_load_pcs_config_reuses_parsed_alias_files(tmp_path, monkeypatch):
+    pcs_file = _write_pcs_with_aliases(tmp_path, "1")
+    _empty_config(tmp_path).load_pcs_config(pcs_file)
+
+    def fail_rglob(*args):
+        raise AssertionError("alias files searched again")
+
+    monkeypatch.setattr(Path, "rglob", fail_rglob)
+    cfg = _empty_config(tmp_path)
+    cfg.load_pcs_config(pcs_file)
+    assert cfg.get_value("PCS_1", "Shared") == "1"
+
+
+def test_load_pcs_config_rereads_modified_alias_files(tmp_path):
+    pcs_file = _write_pcs_with_aliases(tmp_path, "1")
+    _empty_config(tmp_path).load_pcs_config(pcs_file)
+
+    aliases_file = tmp_path / "PCS" / "config_aliases.ini"
+    aliases_file.write_text("[common]\nShared=2\n")
+    stat = aliases_file.stat()
+    os.utime(aliases_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    cfg = _empty_config(tmp_path)
+    cfg.load_pcs_config(pcs_file)
+    assert cfg.get_value("PCS_1", "Shared") == "2"
+
+
+def test_load_pcs_config_reads_added_alias_files(tmp_path):
+    pcs_file = _write_pcs_with_aliases(tmp_path, "1")
+    _empty_config(tmp_path).load_pcs_config(pcs_file)
+
+    extra_dir = tmp_path / "PCS" / "Extra"
+    extra_dir.mkdir()
+    (extra_dir / "extra_aliases.ini").write_text("[common]\nAdded=3\n")
+
+    cfg = _empty_config(tmp_path)
+    cfg.load_pcs_config(pcs_file)
+    assert cfg.get_value("PCS_1", "Added") == "3"
+
+
+def test_restore_discards_changes(config_with_priority, tmp_path):
+    snapshot = config_with_priority.snapshot()
+    user_file = tmp_path / "user.ini"
+    user_file.write_text("[section]\nuser_only = loaded\n")
+
+    config_with_priority.load_user_config(user_file)
+    config_with_priority.set_value("section", "key", "runtime_value")
+    assert config_with_priority.get_value("section", "user_only") == "loaded"
+
+    config_with_priority.restore(snapshot)
+    assert config_with_priority.get_value("section", "key") == "user_value"
+    assert not config_with_priority.has_option("section", "user_only")
+    assert config_with_priority.get_value("section", "pcs_only") == "pcs_only_value"
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import multiprocessing
+import subprocess
+import sys
+
+import pytest
+
+from dycov.core import memory_budget
+from dycov.logging import profiling
+
+
+class _FakeResult:
+    def __init__(self, pool, value):
+        self._pool = pool
+        self._value = value
+        self._polls = 0
+
+    def ready(self):
+        # Each task takes one poll to finish, so several can be running at once
+        self._polls += 1
+        return self._polls > 1
+
+    def get(self):
+        self._pool.running -= 1
+        return self._value
+
+
+class _FakePool:
+    """Runs the tasks synchronously and records how many were running at once."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    def apply_async(self, func, args):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        return _FakeResult(self, func(*args))
+
+
+def test_max_concurrency():
+    assert memory_budget.max_concurrency(4000, 1000, 8) == 4
+    assert memory_budget.max_concurrency(4000, 1000, 2) == 2
+    assert memory_budget.max_concurrency(500, 1000, 4) == 1
+    assert memory_budget.max_concurrency(4000, 0, 4) == 4
+
+
+def test_map_with_budget_caps_running_tasks(monkeypatch):
+    monkeypatch.setattr(memory_budget, "_POLL_INTERVAL", 0.0)
+    monkeypatch.setattr(profiling, "peak_rss_mb", lambda: 100.0)
+    pool = _FakePool()
+
+    results = memory_budget.map_with_budget(pool, abs, [-1, 2, -3, 4, -5], 4, 250.0, 50.0)
+
+    assert results == [1, 2, 3, 4, 5]
+    # 250 MB fit 4 tasks of the initial 50 MB estimate, but only 2 of the measured 100 MB
+    assert pool.max_running == 4
+    pool.max_running = 0
+    memory_budget.map_with_budget(pool, abs, [-1, 2, -3, 4, -5], 4, 250.0, 100.0)
+    assert pool.max_running == 2
+
+
+def test_map_with_budget_on_pool():
+    with multiprocessing.get_context("fork").Pool(processes=2) as pool:
+        results = memory_budget.map_with_budget(pool, abs, list(range(-5, 5)), 2, 1.0, 1.0)
+
+    assert results == [abs(value) for value in range(-5, 5)]
+
+
+def test_run_measured_adds_the_peak_of_the_simulations(monkeypatch):
+    monkeypatch.setattr(profiling, "peak_rss_mb", lambda: 100.0)
+    usages = iter([(300.0, 1.0), (500.0, 3.0), (500.0, 3.0), (500.0, 3.0)])
+    monkeypatch.setattr(profiling, "children_usage", lambda: next(usages))
+
+    # A child process finished while the task ran
+    assert memory_budget._run_measured((abs, -1)) == (1, 600.0)
+    # No child process ran
+    assert memory_budget._run_measured((abs, -2)) == (2, 100.0)
+
+
+def test_children_usage_includes_child_processes():
+    if profiling.children_usage() is None:
+        pytest.skip("getrusage is not available")
+    subprocess.run(
+        [sys.executable, "-c", "data = bytearray(96 * 1024 * 1024); data[::4096] = b'x' * 24576"],
+        check=True,
+    )
+    peak_mb, cpu_time = profiling.children_usage()
+    assert peak_mb >= 96.0
+    assert cpu_time > 0.0
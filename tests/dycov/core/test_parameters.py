@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+from collections import namedtuple
+from pathlib import Path
+from unittest.mock import patch
+
+from dycov.core.parameters import _select_base_dir
+
+_DiskUsage = namedtuple("_DiskUsage", "total used free")
+
+
+def _scratch_config(mock_config, scratch_path, min_free_mb=2048.0):
+    mock_config.get_value.return_value = scratch_path
+    mock_config.get_float.return_value = min_free_mb
+
+
+@patch("dycov.core.parameters.config")
+def test_select_base_dir_without_scratch_path(mock_config):
+    _scratch_config(mock_config, "")
+    assert _select_base_dir() == Path.cwd()
+
+
+@patch("dycov.core.parameters.config")
+def test_select_base_dir_uses_scratch_path(mock_config, tmp_path):
+    _scratch_config(mock_config, str(tmp_path), min_free_mb=0.0)
+    assert _select_base_dir() == tmp_path
+
+
+@patch("dycov.core.parameters.shutil.disk_usage")
+@patch("dycov.core.parameters.config")
+def test_select_base_dir_falls_back_when_space_is_tight(mock_config, mock_usage, tmp_path):
+    _scratch_config(mock_config, str(tmp_path), min_free_mb=2048.0)
+    mock_usage.return_value = _DiskUsage(total=4096 * 1024**2, used=0, free=1024 * 1024**2)
+    assert _select_base_dir() == Path.cwd()
+
+
+@patch("dycov.core.parameters.config")
+def test_select_base_dir_falls_back_when_missing(mock_config, tmp_path):
+    _scratch_config(mock_config, str(tmp_path / "missing"))
+    assert _select_base_dir() == Path.cwd()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import logging
+import os
+
+import pytest
+
+from dycov.configuration.cfg import config
+from dycov.core import worker_pool
+from dycov.files import model_parameters
+from dycov.logging import dycov_logging
+
+
+@pytest.fixture(autouse=True)
+def stop_pool():
+    yield
+    worker_pool.keep_alive(False)
+    worker_pool.shutdown()
+
+
+def test_shared_state_is_loaded_once():
+    with worker_pool.shared_state({"pcs": "PCS_RTE-I2"}) as state_file:
+        first = worker_pool.load_state(state_file)
+        assert first == {"pcs": "PCS_RTE-I2"}
+        assert worker_pool.load_state(state_file) is first
+    assert not os.path.exists(state_file)
+
+
+def test_state_replaces_the_configuration_and_log_levels_of_earlier_runs():
+    snapshot = config.snapshot()
+    level = dycov_logging.level
+    try:
+        config.set_value("PCS_Earlier", "key", "value")
+        dycov_logging.setLevel(logging.DEBUG)
+        with worker_pool.shared_state(None) as state_file:
+            config.set_value("PCS_Later", "key", "value")
+            dycov_logging.setLevel(logging.INFO)
+
+            worker_pool.load_state(state_file)
+
+            assert config.get_value("PCS_Earlier", "key") == "value"
+            assert config.get_value("PCS_Later", "key") is None
+            assert dycov_logging.get_logger("Bisection").getEffectiveLevel() == logging.DEBUG
+    finally:
+        config.restore(snapshot)
+        dycov_logging.setLevel(level)
+
+
+def test_pool_is_reused_between_runs():
+    pool = worker_pool.get_pool(2)
+
+    assert worker_pool.get_pool(2) is pool
+    assert pool.map(abs, [-1, 2, -3]) == [1, 2, 3]
+    assert worker_pool.get_pool(1) is not pool
+
+
+def test_pool_is_restarted_when_configuration_changes():
+    pool = worker_pool.get_pool(1)
+    previous = config.get_value("Global", "parallel_num_processes")
+    config.set_value("Global", "parallel_num_processes", "7")
+    try:
+        assert worker_pool.get_pool(1) is not pool
+    finally:
+        config.set_value("Global", "parallel_num_processes", previous)
+
+
+def _worker_pid(_):
+    return os.getpid()
+
+
+def test_release_stops_the_workers_unless_kept_alive():
+    worker_pool.get_pool(1)
+    worker_pool.release()
+    assert worker_pool._pool is None
+
+    worker_pool.keep_alive()
+    pool = worker_pool.get_pool(1)
+    worker_pool.release()
+    assert worker_pool.get_pool(1) is pool
+    # Each task runs in a new worker, which does not keep the memory of the previous one
+    assert len(set(pool.map(_worker_pid, range(3), chunksize=1))) == 3
+
+
+def test_preload_parses_the_producer_model(tmp_path):
+    (tmp_path / "Zone1").mkdir()
+    dyd = tmp_path / "Zone1" / "Producer.dyd"
+    dyd.write_text('<dyn:dynamicModelsArchitecture xmlns:dyn="http://www.rte-france.com/dynawo"/>')
+
+    worker_pool.preload(tmp_path)
+
+    hits = model_parameters._parse_model_document.cache_info().hits
+    model_parameters._read_model_document(dyd)
+    assert model_parameters._parse_model_document.cache_info().hits == hits + 1
@@ -19,6 +19,7 @@ from dycov.curves.dynawo.orchestrator.bisection import (
     CCT_REL_TOL,
     BisectionEngine,
 )
+from dycov.curves.dynawo.orchestrator.warm_start import WarmStart
 from dycov.curves.voltage_dip import VoltDipResult
 
 # ---------------------------------------------------------------------------
@@ -34,6 +35,7 @@ def _make_engine(**overrides) -> BisectionEngine:
     producer.get_zone.return_value = 1
     producer.generators = [MagicMock(id="GEN1", lib="GenLib")]
     producer.s_nom = 100.0
+    producer.get_producer_dyd.return_value = Path("/model/producer.dyd")
 
     defaults = dict(
         pcs_name="PCS1",
@@ -171,12 +173,29 @@ class TestIsolatedCopy:
 
         with engine._isolated_copy(Path("/src")) as work:
             assert work.name.startswith("fault_time_execution_")
-            mock_mf.copy_directory.assert_called_once_with(Path("/src"), work)
+            mock_mf.link_directory.assert_called_once_with(
+                Path("/src"), work, materialize=("TSOModel.par", "solvers.par", "TSOModel.jobs")
+            )
             temp_root = work.parent
             assert temp_root.exists()
 
         assert not temp_root.exists()
 
+    def test_workspace_links_inputs_and_copies_mutable_files(self, tmp_path):
+        src = tmp_path / "oc"
+        src.mkdir()
+        (src / "TSOModel.par").write_text("par")
+        (src / "TableInfiniteBus.txt").write_text("table")
+        engine = _make_engine()
+
+        with engine._isolated_copy(src) as work:
+            assert work.parent.parent == tmp_path
+            assert (work / "TableInfiniteBus.txt").samefile(src / "TableInfiniteBus.txt")
+            assert not (work / "TSOModel.par").samefile(src / "TSOModel.par")
+            (work / "TSOModel.par").write_text("modified")
+
+        assert (src / "TSOModel.par").read_text() == "par"
+
 
 # ---------------------------------------------------------------------------
 # _bolted_fault_max_residual_voltage
@@ -435,6 +454,7 @@ class TestFindHizFault:
             ("Global", "hiz_fault_min_impedance"): 1e-10,
             ("Global", "hiz_fault_rel_tol"): 1e-5,
         }.get((section, key), default)
+        config_mock.get_boolean.side_effect = lambda section, key, default=None: default
         return _make_engine()
 
     @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
@@ -696,6 +716,201 @@ class TestFindHizFault:
             Path("/tmp/work"), Path("/work") / "bisection_last_success"
         )
 
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.replace_placeholders")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_early_stop_limits_iteration_horizon(self, mock_config, mock_mf, mock_rp, mock_cvd):
+        engine = self._engine_with_config(mock_config)
+        mock_config.get_boolean.side_effect = lambda section, key, default=None: (
+            key == "bisection_early_stop"
+        )
+        mock_cvd.return_value = VoltDipResult.DIP_CORRECT
+
+        with _fake_isolated_copy(engine):
+            with patch.object(engine, "_is_bisection_complete", return_value=True):
+                engine.find_hiz_fault(
+                    Path("/out"),
+                    Path("/work"),
+                    Path("/jobs"),
+                    1.0,
+                    0.15,
+                    0.2,
+                    "BM",
+                    "OC",
+                    MagicMock(return_value=_succeed_outcome()),
+                    MagicMock(),
+                )
+        # Only the iteration workspace is shortened, never the original directory, and
+        # the impedance found is confirmed over the full horizon
+        mock_rp.limit_simulation_stop.assert_called_once_with(
+            Path("/tmp/work"), "TSOModel.jobs", pytest.approx(2.15)
+        )
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.replace_placeholders")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_early_stop_rejects_impedance_diverging_after_the_horizon(
+        self, mock_config, mock_mf, mock_rp, mock_cvd
+    ):
+        engine = self._engine_with_config(mock_config)
+        mock_config.get_boolean.side_effect = lambda section, key, default=None: (
+            key == "bisection_early_stop"
+        )
+        mock_cvd.return_value = VoltDipResult.DIP_CORRECT
+        # The truncated simulations succeed, the full horizon ones diverge
+        simulate_fn = MagicMock(side_effect=[_succeed_outcome(), _fail_outcome()])
+
+        with _fake_isolated_copy(engine):
+            with patch.object(engine, "_is_bisection_complete", return_value=True):
+                with pytest.raises(ValueError, match="Fault simulation fails"):
+                    engine.find_hiz_fault(
+                        Path("/out"),
+                        Path("/work"),
+                        Path("/jobs"),
+                        1.0,
+                        0.15,
+                        0.2,
+                        "BM",
+                        "OC",
+                        simulate_fn,
+                        MagicMock(),
+                    )
+        assert simulate_fn.call_count == 2
+        mock_rp.limit_simulation_stop.assert_called_once()
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.replace_placeholders")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_early_stop_accepts_impedance_confirmed_over_full_horizon(
+        self, mock_config, mock_mf, mock_rp, mock_cvd
+    ):
+        engine = self._engine_with_config(mock_config)
+        mock_config.get_boolean.side_effect = lambda section, key, default=None: (
+            key == "bisection_early_stop"
+        )
+        mock_cvd.side_effect = [VoltDipResult.DIP_TOO_LARGE, VoltDipResult.DIP_CORRECT]
+        simulate_fn = MagicMock(return_value=_succeed_outcome())
+
+        with _fake_isolated_copy(engine):
+            engine.find_hiz_fault(
+                Path("/out"),
+                Path("/work"),
+                Path("/jobs"),
+                1.0,
+                0.15,
+                0.2,
+                "BM",
+                "OC",
+                simulate_fn,
+                MagicMock(),
+            )
+        # Two truncated iterations, and only the accepted one is simulated again
+        assert simulate_fn.call_count == 3
+        assert mock_rp.limit_simulation_stop.call_count == 2
+        assert mock_rp.fault_par_file.call_args_list[-1][0][0] == Path("/work")
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.replace_placeholders")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_limit_horizon_disabled_by_default(self, mock_config, mock_rp):
+        engine = self._engine_with_config(mock_config)
+        engine._limit_horizon(Path("/tmp/work"), 1.0, 0.15)
+        mock_rp.limit_simulation_stop.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Regula falsi search for the HIZ fault
+# ---------------------------------------------------------------------------
+
+
+class TestRegulaFalsi:
+    def test_dip_residual_sign(self):
+        assert BisectionEngine._dip_residual(0.5, 0.25) > 0.0
+        assert BisectionEngine._dip_residual(0.1, 0.25) < 0.0
+        assert BisectionEngine._dip_residual(None, 0.25) is None
+        assert BisectionEngine._dip_residual(0.0, 0.25) is None
+
+    def test_candidate_interpolates(self):
+        assert BisectionEngine._regula_falsi_candidate(0.0, 10.0, 1.0, -4.0) == 2.0
+
+    def test_candidate_falls_back_to_midpoint(self):
+        assert BisectionEngine._regula_falsi_candidate(0.0, 10.0, None, -4.0) == 5.0
+        assert BisectionEngine._regula_falsi_candidate(0.0, 10.0, 1.0, None) == 5.0
+        # Residuals without a sign change
+        assert BisectionEngine._regula_falsi_candidate(0.0, 10.0, -1.0, -4.0) == 5.0
+
+    def _search(self, mock_config, mock_cvd, mock_mvd, method):
+        """Runs find_hiz_fault on a Thevenin source: dip = 1 / (1 + xpu), target 0.25."""
+        mock_config.get_float.side_effect = lambda section, key, default=None: {
+            ("GridCode", "fault_r_factor"): 10.0,
+            ("Global", "hiz_fault_max_impedance"): 10.0,
+            ("Global", "hiz_fault_min_impedance"): 1e-10,
+            ("Global", "hiz_fault_rel_tol"): 1e-5,
+        }.get((section, key), default)
+        mock_config.get_value.side_effect = lambda section, key, default=None: {
+            ("Global", "hiz_fault_search_method"): method,
+        }.get((section, key), default)
+        mock_config.get_boolean.side_effect = lambda section, key, default=None: default
+        engine = _make_engine()
+        probes = []
+
+        def measured_dip(*args):
+            return 1.0 / (1.0 + probes[-1])
+
+        def classify(*args):
+            delta = measured_dip() - 0.25
+            if abs(delta) < 0.01:
+                return VoltDipResult.DIP_CORRECT
+            return VoltDipResult.DIP_TOO_LARGE if delta > 0 else VoltDipResult.DIP_TOO_SMALL
+
+        mock_mvd.side_effect = measured_dip
+        mock_cvd.side_effect = classify
+        simulate_fn = MagicMock(return_value=_succeed_outcome())
+
+        with _fake_isolated_copy(engine):
+            with patch.object(
+                engine, "_modify_fault", side_effect=lambda *args: probes.append(args[3])
+            ):
+                engine.find_hiz_fault(
+                    Path("/out"),
+                    Path("/work"),
+                    Path("/jobs"),
+                    1.0,
+                    0.15,
+                    0.25,
+                    "BM",
+                    "OC",
+                    simulate_fn,
+                    MagicMock(),
+                )
+        # The last call applies the result to the original directory
+        return probes[:-1]
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.measure_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_needs_fewer_simulations_than_bisection(
+        self, mock_config, mock_mf, mock_cvd, mock_mvd
+    ):
+        bisection = self._search(mock_config, mock_cvd, mock_mvd, "bisection")
+        regula_falsi = self._search(mock_config, mock_cvd, mock_mvd, "regula_falsi")
+
+        assert regula_falsi[0] == bisection[0] == pytest.approx(5.0)
+        assert regula_falsi[-1] == pytest.approx(3.0, rel=0.05)
+        assert len(regula_falsi) < len(bisection)
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.measure_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_bisection_does_not_measure_dip(self, mock_config, mock_mf, mock_cvd, mock_mvd):
+        self._search(mock_config, mock_cvd, mock_mvd, "bisection")
+        # Only the test's own classification helper reads the dip
+        assert mock_mvd.call_count == 0
+
 
 # ---------------------------------------------------------------------------
 # _run_time_cct
@@ -948,3 +1163,118 @@ class TestFindCctDebugRename:
         mock_mf.rename_path.assert_called_with(
             Path("/tmp/work"), Path("/work") / "bisection_last_failure"
         )
+
+
+# ---------------------------------------------------------------------------
+# Warm start from the bisection history
+# ---------------------------------------------------------------------------
+
+
+class TestWarmStart:
+    def _engine_with_history(self, config_mock, warm: WarmStart | None):
+        config_mock.get_float.side_effect = lambda section, key, default=None: {
+            ("GridCode", "fault_r_factor"): 10.0,
+            ("Global", "hiz_fault_max_impedance"): 10.0,
+            ("Global", "hiz_fault_min_impedance"): 1e-10,
+            ("Global", "hiz_fault_rel_tol"): 1e-5,
+            ("Global", "bisection_warm_start_rel_width"): 0.05,
+        }.get((section, key), default)
+        config_mock.get_boolean.side_effect = lambda section, key, default=None: default
+        engine = _make_engine()
+        engine._history = MagicMock()
+        engine._history.lookup.return_value = warm
+        engine._fingerprint = MagicMock(return_value="fingerprint")
+        return engine
+
+    def _find_hiz(self, engine, simulate_fn):
+        engine.find_hiz_fault(
+            Path("/out"),
+            Path("/work"),
+            Path("/jobs"),
+            1.0,
+            0.15,
+            0.2,
+            "BM",
+            "OC",
+            simulate_fn,
+            MagicMock(),
+        )
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.replace_placeholders")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_hiz_accepts_stored_impedance_in_one_simulation(
+        self, mock_config, mock_rp, mock_mf, mock_cvd
+    ):
+        engine = self._engine_with_history(mock_config, WarmStart(2.0, same_model=True))
+        mock_cvd.return_value = VoltDipResult.DIP_CORRECT
+        simulate_fn = MagicMock(return_value=_succeed_outcome())
+
+        with _fake_isolated_copy(engine):
+            self._find_hiz(engine, simulate_fn)
+
+        assert simulate_fn.call_count == 1
+        assert mock_rp.fault_par_file.call_args_list[-1][0][3] == pytest.approx(2.0)
+        engine._history.store.assert_called_once()
+        assert engine._history.store.call_args[0][2] == pytest.approx(2.0)
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.classify_voltage_dip")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.replace_placeholders")
+    @patch("dycov.curves.dynawo.orchestrator.bisection.config")
+    def test_hiz_probes_bracket_end_pointed_by_first_classification(
+        self, mock_config, mock_rp, mock_mf, mock_cvd
+    ):
+        engine = self._engine_with_history(mock_config, WarmStart(2.0, same_model=False))
+        mock_cvd.side_effect = [VoltDipResult.DIP_TOO_LARGE, VoltDipResult.DIP_CORRECT]
+        simulate_fn = MagicMock(return_value=_succeed_outcome())
+
+        with _fake_isolated_copy(engine):
+            self._find_hiz(engine, simulate_fn)
+
+        assert simulate_fn.call_count == 2
+        assert mock_rp.fault_par_file.call_args_list[-1][0][3] == pytest.approx(2.1)
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    def test_cct_returns_stored_value_after_two_checks(self, mock_mf):
+        engine = _make_engine()
+        engine._history = MagicMock()
+        engine._history.lookup.return_value = WarmStart(0.2, same_model=True)
+        engine._fingerprint = MagicMock(return_value="fingerprint")
+        engine._run_time_cct = MagicMock(side_effect=[True, False])
+        engine._find_max_duration = MagicMock()
+
+        with _fake_isolated_copy(engine):
+            result = engine.find_cct(Path("/work"), Path("/jobs"), 0.1, "BM", "OC")
+
+        assert result == pytest.approx(0.2)
+        assert engine._run_time_cct.call_count == 2
+        engine._find_max_duration.assert_not_called()
+        engine._history.store.assert_called_once_with(
+            (str(Path("/model/producer.dyd").resolve()), "PCS1", "BM", "OC", "cct"),
+            "fingerprint",
+            result,
+        )
+
+    def test_history_key_differs_between_producers_with_the_same_model_name(self):
+        first = _make_engine()
+        second = _make_engine()
+        second._producer.get_producer_dyd.return_value = Path("/other/producer.dyd")
+
+        assert first._history_key("BM", "OC", "cct") != second._history_key("BM", "OC", "cct")
+
+    @patch("dycov.curves.dynawo.orchestrator.bisection.manage_files")
+    def test_cct_falls_back_to_full_search_when_check_fails(self, mock_mf):
+        engine = _make_engine()
+        engine._history = MagicMock()
+        engine._history.lookup.return_value = WarmStart(0.2, same_model=False)
+        engine._fingerprint = MagicMock(return_value="fingerprint")
+        engine._run_time_cct = MagicMock(return_value=False)
+        engine._find_max_duration = MagicMock(return_value=(0.1, 0.2))
+
+        with _fake_isolated_copy(engine):
+            with patch.object(engine, "_is_bisection_complete", return_value=True):
+                engine.find_cct(Path("/work"), Path("/jobs"), 0.1, "BM", "OC")
+
+        engine._find_max_duration.assert_called_once()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#
+from dycov.curves.dynawo.orchestrator.warm_start import BisectionHistory, model_fingerprint
+
+_KEY = ("producer", "PCS1", "BM", "OC", "cct")
+
+
+def test_lookup_without_history_returns_none(tmp_path):
+    assert BisectionHistory(tmp_path).lookup(_KEY, "abc") is None
+
+
+def test_store_and_lookup_same_model(tmp_path):
+    history = BisectionHistory(tmp_path / "history")
+    history.store(_KEY, "abc", 0.25)
+
+    warm = history.lookup(_KEY, "abc")
+
+    assert warm.value == 0.25
+    assert warm.same_model
+
+
+def test_lookup_changed_model(tmp_path):
+    history = BisectionHistory(tmp_path)
+    history.store(_KEY, "abc", 0.25)
+
+    warm = history.lookup(_KEY, "def")
+
+    assert warm.value == 0.25
+    assert not warm.same_model
+
+
+def test_corrupted_entry_is_ignored(tmp_path):
+    history = BisectionHistory(tmp_path)
+    history.store(_KEY, "abc", 0.25)
+    next(tmp_path.glob("*.json")).write_text("{not json")
+
+    assert history.lookup(_KEY, "abc") is None
+
+
+def test_fingerprint_ignores_subdirectories(tmp_path):
+    (tmp_path / "TSOModel.par").write_text("par")
+    before = model_fingerprint(tmp_path, 0.5)
+
+    (tmp_path / "outputs").mkdir()
+    (tmp_path / "outputs" / "curves.csv").write_text("time")
+    assert model_fingerprint(tmp_path, 0.5) == before
+
+    assert model_fingerprint(tmp_path, 0.6) != before
+    (tmp_path / "TSOModel.par").write_text("modified")
+    assert model_fingerprint(tmp_path, 0.5) != before
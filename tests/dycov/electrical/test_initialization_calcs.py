@@ -10,13 +10,16 @@
 """Unit tests for dycov.electrical.initialization_calcs (pi-model solvers and init_calcs)."""
 import cmath
 
+import pytest
+
 from dycov.electrical.initialization_calcs import (
     _calc_pimodel,
     _calc_twobus_pf,
+    _solve_gen_circuits,
     _zero_imp_line,
     init_calcs,
 )
-from dycov.electrical.pimodel_parameters import line_pimodel
+from dycov.electrical.pimodel_parameters import line_pimodel, xfmr_pimodel
 from dycov.model.parameters import (
     GenParams,
     LineParams,
@@ -668,3 +671,87 @@ def test_init_calcs_zero_imp_grid_line(monkeypatch):
     assert res.u_phase0 == 0
     assert res.p0 == 1
     assert res.q0 == 0
+
+
+# ---------------------------------------------------------------------------
+# _solve_gen_circuits
+# ---------------------------------------------------------------------------
+
+
+def _solve_gen_circuit_reference(gen, gen_xfmr, v_int, s_int_share):
+    # Per-generator solution, one branch at a time
+    if gen_xfmr is None:
+        return v_int, s_int_share
+    xfmr = xfmr_pimodel(gen_xfmr)
+    if gen_xfmr.terminals[0].connected_equipment == gen.id:
+        v_gen, _, s_gen = _calc_pimodel(
+            xfmr.y_tr, xfmr.y_sh2, xfmr.y_sh1, v_int, None, s_int_share
+        )
+    else:
+        v_gen, _, s_gen = _calc_pimodel(
+            xfmr.y_tr, xfmr.y_sh1, xfmr.y_sh2, v_int, None, s_int_share
+        )
+    return v_gen, s_gen
+
+
+def test_solve_gen_circuits_matches_the_per_generator_solution():
+    """Many identical strings, a reversed transformer and a unit without one."""
+    gens = []
+    xfmrs = []
+    for i in range(40):
+        gen_id = f"G{i}"
+        gens.append(
+            GenParams(
+                id=gen_id,
+                lib=None,
+                par_id=None,
+                terminals=(Terminal(connected_equipment=f"X{i}"),),
+                p=0.02 if i < 30 else 0.04,
+                q=0.025,
+                s_nom=5,
+                i_max=None,
+                voltage_droop=None,
+                use_voltage_droop=False,
+            )
+        )
+        terminals = (Terminal(gen_id), Terminal("Int"))
+        xfmrs.append(
+            XfmrParams(
+                id=f"X{i}",
+                lib=None,
+                par_id=None,
+                r=0.0003,
+                x=0.0268 if i < 30 else 0.03,
+                g=0.0,
+                b=0.001,
+                r_tfo=0.9574,
+                alpha_tfo=0.0,
+                terminals=terminals if i % 7 else terminals[::-1],
+            )
+        )
+    xfmrs[-1] = None
+    v_int = cmath.rect(1.02, 0.1)
+    s_int = complex(0.8, 0.3)
+
+    _solve_gen_circuits(tuple(gens), tuple(xfmrs), v_int, s_int)
+
+    for gen, gen_xfmr in zip(gens, xfmrs):
+        s_int_share = complex(s_int.real * gen.p / 1.0, s_int.imag * gen.q / 1.0)
+        v_gen, s_gen = _solve_gen_circuit_reference(gen, gen_xfmr, v_int, s_int_share)
+        assert _is_equal(gen.terminals[0].u0, abs(v_gen))
+        assert _is_equal(gen.terminals[0].u_phase0, cmath.phase(v_gen))
+        assert _is_equal(gen.terminals[0].p0, s_gen.real)
+        assert _is_equal(gen.terminals[0].q0, s_gen.imag)
+        if gen_xfmr is not None:
+            gen_side = 0 if gen_xfmr.terminals[0].connected_equipment == gen.id else 1
+            assert _is_equal(gen_xfmr.terminals[gen_side].p0, -s_gen.real)
+            assert _is_equal(gen_xfmr.terminals[1 - gen_side].u0, abs(v_int))
+            assert _is_equal(gen_xfmr.terminals[1 - gen_side].q0, s_int_share.imag)
+
+
+def test_solve_gen_circuits_with_zero_shares_raises():
+    gen, gen_xfmr = _make_gen_and_xfmr()
+    gen.q = 0
+
+    with pytest.raises(ZeroDivisionError):
+        _solve_gen_circuits((gen,), (gen_xfmr,), complex(1.0, 0.0), complex(0.8, 0.0))
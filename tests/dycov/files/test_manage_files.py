@@ -27,6 +27,8 @@ from dycov.files.manage_files import (
     get_dynawo_version,
     get_latex_version,
     get_uv_version,
+    link_directory,
+    link_file,
     list_directories,
     move_report,
     read_curves,
@@ -169,6 +171,46 @@ def test_clone_as_subdirectory(tmp_path):
     assert (res / "a.txt").exists()
 
 
+def test_clone_as_subdirectory_materialize(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.txt").write_text("x")
+    (src / "solvers.par").write_text("y")
+    (src / "curves.csv").write_text("z")
+
+    res = clone_as_subdirectory(src, "clone", materialize=["solvers.par"])
+
+    assert (res / "a.txt").samefile(src / "a.txt")
+    assert not (res / "solvers.par").samefile(src / "solvers.par")
+    assert not (res / "curves.csv").exists()
+
+
+def test_link_directory(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "TSOModel.par").write_text("par")
+    (src / "sub" / "table.txt").write_text("table")
+    dst = tmp_path / "dst"
+
+    link_directory(src, dst, materialize=["tsomodel.par"])
+
+    assert (dst / "sub" / "table.txt").samefile(src / "sub" / "table.txt")
+    assert not (dst / "TSOModel.par").samefile(src / "TSOModel.par")
+    (dst / "TSOModel.par").write_text("modified")
+    assert (src / "TSOModel.par").read_text() == "par"
+
+
+def test_link_file_falls_back_to_copy(tmp_path):
+    src = tmp_path / "a.txt"
+    src.write_text("x")
+
+    with patch("dycov.files.manage_files.os.link", side_effect=OSError("EXDEV")):
+        link_file(src, tmp_path / "b.txt")
+
+    assert (tmp_path / "b.txt").read_text() == "x"
+    assert not (tmp_path / "b.txt").samefile(src)
+
+
 # ---------------------------------------------------------------------------
 # Reports
 # ---------------------------------------------------------------------------
@@ -230,3 +230,81 @@ def test_adjust_producer_init_without_stepup(tmp_path, monkeypatch):
     assert is_test_applicable is True
     assert calls["gen"] == 1
     assert calls["xfmr"] == 0
+
+
+def test_model_documents_are_parsed_again_only_when_the_file_changes(tmp_path):
+    par_path = tmp_path / "Model.par"
+    root = _make_root()
+    etree.SubElement(root, f"{{{_NS}}}set", id="Gen")
+    _write_xml(root, par_path)
+
+    document = model_parameters._read_model_document(par_path)
+
+    assert model_parameters._read_model_document(par_path) is document
+    assert [parset.get("id") for parset in document.get_parset("Gen")] == ["Gen"]
+    assert document.get_parset("Xfmr") == []
+
+    etree.SubElement(root, f"{{{_NS}}}set", id="Xfmr")
+    _write_xml(root, par_path)
+
+    changed = model_parameters._read_model_document(par_path)
+    assert changed is not document
+    assert len(changed.get_parset("Xfmr")) == 1
+
+
+def test_model_document_indexes_connections_by_blackbox_model(tmp_path):
+    dyd_path = tmp_path / "Model.dyd"
+    root = _make_root()
+    etree.SubElement(root, f"{{{_NS}}}blackBoxModel", id="Gen", lib="GenLib")
+    etree.SubElement(root, f"{{{_NS}}}blackBoxModel", id="Xfmr", lib="XfmrLib")
+    etree.SubElement(root, f"{{{_NS}}}connect", id1="Gen", var1="t", id2="Xfmr", var2="t1")
+    etree.SubElement(root, f"{{{_NS}}}connect", id1="Xfmr", var1="t2", id2="BusPDR", var2="t")
+    _write_xml(root, dyd_path)
+
+    document = model_parameters._read_model_document(dyd_path)
+
+    assert [bbmodel.get("id") for bbmodel in document.get_bbmodels("XfmrLib")] == ["Xfmr"]
+    assert len(document.get_connections("Xfmr")) == 2
+    assert model_parameters._get_connected_equipment(document, "Gen") == "Xfmr"
+    assert model_parameters._get_connected_equipment_by_terminal(document, "Xfmr", "t2") == (
+        "BusPDR"
+    )
+
+
+def test_adjust_producer_init_does_not_modify_the_shared_par_file(tmp_path, monkeypatch):
+    from dycov.model.parameters import GenParams, Terminal
+
+    producer_par = tmp_path / "Producer.par"
+    root = _make_root()
+    etree.SubElement(root, f"{{{_NS}}}set", id="parGen")
+    _write_xml(root, producer_par)
+    output_dir = tmp_path / "OC"
+    output_dir.mkdir()
+
+    def fake_adjust_generator(producer_par, generator, *args):
+        parset = producer_par.get_parset(generator.par_id)[0]
+        etree.SubElement(parset, "par", name="P0Pu", value="0.5")
+        return True
+
+    monkeypatch.setattr(model_parameters, "_adjust_generator", fake_adjust_generator)
+    gen = GenParams(
+        id="Gen1",
+        lib="IEC",
+        par_id="parGen",
+        terminals=(Terminal(connected_equipment=None),),
+        s_nom=90,
+        i_max=None,
+        p=1,
+        q=1,
+        voltage_droop=None,
+        use_voltage_droop=False,
+    )
+
+    for _ in range(2):
+        model_parameters.adjust_producer_init(
+            output_dir, producer_par, [gen], [], None, None, "USetpoint", False, 1
+        )
+
+    output = etree.parse(output_dir / "Producer.par").getroot()
+    assert len(output[0]) == 1
+    assert len(model_parameters._read_model_document(producer_par).get_parset("parGen")[0]) == 0
@@ -64,6 +64,26 @@ class TestReplacePlaceholders:
             assert solver.get("parId") == "new_id"
             assert solver.get("lib") == "new_lib"
 
+    def test_limit_simulation_stop_shortens_horizon(self):
+        from lxml import etree
+
+        from dycov.files.replace_placeholders import limit_simulation_stop
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            file_path = path / "jobs.xml"
+            for stop_time, expected in ((1.5, "1.5"), (30.0, "20")):
+                file_path.write_text(
+                    '<jobs xmlns="http://example.com"><simulation startTime="0" stopTime="20"/>'
+                    "</jobs>",
+                    encoding="utf-8",
+                )
+                limit_simulation_stop(path, "jobs.xml", stop_time)
+
+                tree = etree.parse(str(file_path))
+                simulation = tree.find(".//ns:simulation", namespaces={"ns": "http://example.com"})
+                assert simulation.get("stopTime") == expected
+
     def test_get_all_variables_extracts_template_variables(self):
         from dycov.files.replace_placeholders import get_all_variables
 
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import numpy as np
+
+from dycov.gfm.adaptive_grid import select_time_points
+from dycov.gfm.calculators.gfm_calculator import GFMCalculator
+
+
+def _step_response(time_array: np.ndarray, event_time: float) -> np.ndarray:
+    time_since_event = np.maximum(0, time_array - event_time)
+    response = 1 - np.exp(-30 * time_since_event) * np.cos(40 * time_since_event)
+    return np.where(time_array < event_time, 0, response)
+
+
+def test_select_time_points_reproduces_signals_within_tolerance():
+    time_array = np.linspace(-1, 5, 3000)
+    signals = [_step_response(time_array, 0.2), 0.5 * _step_response(time_array, 0.3)]
+
+    indices = select_time_points(time_array, signals, tolerance=1e-4, keep_times=(0.2,))
+
+    assert indices[0] == 0
+    assert indices[-1] == len(time_array) - 1
+    assert np.searchsorted(time_array, 0.2) in indices
+    assert len(indices) < len(time_array) / 4
+    for signal in signals:
+        approximation = np.interp(time_array, time_array[indices], signal[indices])
+        assert np.max(np.abs(approximation - signal)) <= 1e-4
+
+
+def test_select_time_points_ignores_undefined_signals():
+    time_array = np.linspace(0, 5, 1000)
+    undefined = np.full_like(time_array, np.nan)
+
+    indices = select_time_points(time_array, [time_array, undefined])
+
+    assert len(indices) < 20
+
+
+def test_apply_delay_on_non_uniform_time_array():
+    calculator = GFMCalculator.__new__(GFMCalculator)
+    time_array = np.unique(np.r_[np.linspace(0, 0.5, 2000), np.geomspace(0.5, 5, 1000)])
+    signal = np.sin(3 * time_array)
+
+    delayed = calculator._apply_delay(0.1, -1.0, time_array, signal)
+
+    expected = np.where(time_array < 0.1, -1.0, np.sin(3 * (time_array - 0.1)))
+    assert np.max(np.abs(delayed - expected)) < 1e-3
+
+
+def test_apply_delay_on_non_uniform_time_array_with_rows():
+    calculator = GFMCalculator.__new__(GFMCalculator)
+    time_array = np.geomspace(1e-3, 5, 3000)
+    signals = np.vstack([time_array, 2 * time_array])
+
+    delayed = calculator._apply_delay(
+        0.5, np.array([-1.0, -2.0]), time_array, signals, start_time=1.0
+    )
+
+    assert delayed.shape == signals.shape
+    before = time_array < 1.0
+    assert np.array_equal(delayed[:, before], signals[:, before])
+    held = (time_array >= 1.0) & (time_array < time_array[np.argmax(time_array >= 1.0)] + 0.5)
+    assert np.all(delayed[0, held] == -1.0)
+    assert np.all(delayed[1, held] == -2.0)
+    after = time_array > 2.0
+    np.testing.assert_allclose(delayed[1, after], 2 * (time_array[after] - 0.5), rtol=1e-9)
@@ -80,6 +80,7 @@ class ParametersHelper(GFMParameters):
         self._oc_section = "DEFAULT"
 
         config._pcs_config.read_string(config_str)
+        config._invalidate()
 
 
 def test_amplitude_step_initialization():
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import numpy as np
+import pytest
+
+from dycov.gfm.calculators import basis
+
+
+def test_time_grid_is_shared_and_read_only():
+    time_array = basis.time_grid(-1.0, 2.0, 300)
+
+    assert basis.time_grid(-1.0, 2.0, 300) is time_array
+    assert np.array_equal(time_array, np.linspace(-1.0, 2.0, 300))
+    with pytest.raises(ValueError):
+        time_array[0] = 0.0
+
+
+def test_basis_functions_are_cached_for_read_only_arrays():
+    basis.clear_cache()
+    time_array = basis.time_grid(-1.0, 2.0, 300)
+    shifted = basis.shifted(time_array, 0.2)
+
+    decay = basis.exp_decay(3.5, shifted)
+    cos_term, sin_term = basis.oscillation(12.0, shifted)
+
+    assert basis.shifted(time_array, 0.2) is shifted
+    assert basis.exp_decay(3.5, shifted) is decay
+    assert basis.oscillation(12.0, shifted)[0] is cos_term
+    assert basis.exp_decay(4.0, shifted) is not decay
+    assert np.array_equal(decay, np.exp(-3.5 * (time_array - 0.2)))
+    assert np.array_equal(cos_term, np.cos(12.0 * (time_array - 0.2)))
+    assert np.array_equal(sin_term, np.sin(12.0 * (time_array - 0.2)))
+    assert not decay.flags.writeable
+
+
+def test_basis_functions_are_not_cached_for_writable_arrays_or_sweeps():
+    time_array = np.linspace(-1.0, 2.0, 300)
+
+    decay = basis.exp_decay(3.5, time_array)
+    assert basis.exp_decay(3.5, time_array) is not decay
+    assert decay.flags.writeable
+
+    rates = np.array([[1.0], [2.0]])
+    decay = basis.exp_decay(rates, basis.time_grid(-1.0, 2.0, 300))
+    assert decay.shape == (2, 300)
+    assert np.array_equal(decay, np.exp(-rates * time_array))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+from pathlib import Path
+
+import numpy as np
+
+from dycov.gfm import fingerprint
+
+
+class _Parameters:
+    def __init__(self, damping=100.0):
+        self._damping = damping
+        self._working_dir = Path("/tmp")
+
+    def get_damping_constant(self):
+        return np.float64(self._damping)
+
+    def get_output_formats(self):
+        return ("csv", "png")
+
+    def get_working_dir(self):
+        return self._working_dir
+
+    def set_section(self, *args):
+        self._section = args
+
+
+def test_recording_parameters_records_plain_getter_values():
+    parameters = _Parameters()
+    recording = fingerprint.RecordingParameters(parameters)
+
+    recording.set_section("PCS", "BM", "OC")
+    assert recording.get_damping_constant() == 100.0
+    assert recording.get_output_formats() == ("csv", "png")
+    assert recording.get_working_dir() == Path("/tmp")
+
+    assert recording.get_inputs() == {
+        "get_damping_constant": {"call": "get_damping_constant", "args": [], "value": 100.0},
+        "get_output_formats": {"call": "get_output_formats", "args": [], "value": ["csv", "png"]},
+    }
+    assert recording.__dict__ is parameters.__dict__
+    assert parameters._section == ("PCS", "BM", "OC")
+
+
+def test_get_changes_compares_the_saved_inputs_with_the_parameters(tmp_path):
+    path = tmp_path / f"OC{fingerprint.FINGERPRINT_SUFFIX}"
+    assert fingerprint.get_changes(path, _Parameters()) == "no previous results"
+
+    recording = fingerprint.RecordingParameters(_Parameters())
+    recording.get_damping_constant()
+    recording.get_output_formats()
+    fingerprint.save(path, recording.get_inputs())
+
+    assert fingerprint.get_changes(path, _Parameters()) is None
+    assert fingerprint.get_changes(path, _Parameters(200.0)) == "changed damping_constant"
+
+    path.write_text("{")
+    assert fingerprint.get_changes(path, _Parameters()) == "unreadable fingerprint"
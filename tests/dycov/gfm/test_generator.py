@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import logging
+import shutil
+from pathlib import Path
+
+from dycov.gfm.generator import GFMGeneration
+from dycov.gfm.parameters import GFMParameters
+
+GFM = Path(__file__).resolve().parent.parent.parent.parent / "examples" / "GFM"
+
+
+def _generate(
+    output_dir: Path,
+    use_parallel: bool,
+    producer_ini: Path = GFM / "Overdamped" / "Producer.ini",
+    incremental: bool = False,
+) -> dict:
+    parameters = GFMParameters(
+        producer_ini=producer_ini,
+        selected_pcs="PCS_RTE-IGFM1",
+        output_dir=output_dir,
+        only_dtr=False,
+        emt=False,
+        output_formats=("csv",),
+    )
+    GFMGeneration(parameters, incremental=incremental).generate(
+        use_parallel=use_parallel, num_processes=2
+    )
+    parameters.cleanup_working_dir()
+    return {path.relative_to(output_dir): path for path in output_dir.rglob("*") if path.is_file()}
+
+
+def test_parallel_generation_by_operating_condition_matches_sequential(tmp_path):
+    sequential = _generate(tmp_path / "sequential", use_parallel=False)
+    parallel = _generate(tmp_path / "parallel", use_parallel=True)
+
+    assert sorted(parallel) == sorted(sequential)
+    csv_files = [path for path in sequential if path.suffix == ".csv"]
+    assert len(csv_files) == 20
+    assert not [path for path in sequential if path.suffix in (".png", ".html")]
+    for path in csv_files:
+        assert parallel[path].read_bytes() == sequential[path].read_bytes()
+
+
+def test_incremental_generation_only_regenerates_changed_operating_conditions(tmp_path, caplog):
+    producer_ini = tmp_path / "Producer.ini"
+    shutil.copy(GFM / "Overdamped" / "Producer.ini", producer_ini)
+    output_dir = tmp_path / "Results"
+    outputs = _generate(output_dir, False, producer_ini)
+    fingerprints = [path for path in outputs if path.name.endswith("_fingerprint.json")]
+    assert len(fingerprints) == 20
+    mtimes = {path: outputs[path].stat().st_mtime_ns for path in outputs}
+
+    with caplog.at_level(logging.INFO):
+        unchanged = _generate(output_dir, False, producer_ini, incremental=True)
+    assert "Regenerating 0 of 20 operating conditions" in caplog.text
+    assert {path: unchanged[path].stat().st_mtime_ns for path in unchanged} == mtimes
+
+    producer_ini.write_text(producer_ini.read_text().replace("H = 2.0", "H = 3.0"))
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        changed = _generate(output_dir, True, producer_ini, incremental=True)
+    assert "Regenerating 20 of 20 operating conditions" in caplog.text
+    assert "changed standard_parameters" in caplog.text
+    assert sorted(changed) == sorted(outputs)
+    assert all(changed[path].stat().st_mtime_ns != mtimes[path] for path in fingerprints)
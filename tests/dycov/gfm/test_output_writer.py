@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import threading
+
+import numpy as np
+import pytest
+
+from dycov.cli import cli_parsers
+from dycov.cli.command_handlers import _get_output_formats
+from dycov.configuration.cfg import Config
+from dycov.gfm import output_writer
+from dycov.gfm.outputs import plot_results
+
+
+@pytest.fixture(autouse=True)
+def _stop_writer():
+    yield
+    # Do not leave writer threads behind in the test process, which may fork workers later
+    output_writer.shutdown()
+
+
+def _write(path, text, threads):
+    threads.append(threading.current_thread().name)
+    path.write_text(text)
+
+
+def _fail(message):
+    raise IOError(message)
+
+
+def test_outputs_are_written_in_background_until_flush(tmp_path):
+    threads = []
+    for i in range(4):
+        output_writer.submit(_write, tmp_path / f"out{i}.txt", f"{i}", threads)
+
+    output_writer.flush()
+
+    assert [(tmp_path / f"out{i}.txt").read_text() for i in range(4)] == ["0", "1", "2", "3"]
+    assert all(name.startswith("gfm-writer") for name in threads)
+
+
+def test_flush_raises_the_first_write_error_once():
+    output_writer.submit(_fail, "disk full")
+
+    with pytest.raises(IOError, match="disk full"):
+        output_writer.flush()
+    output_writer.flush()
+
+
+def test_outputs_are_written_synchronously_without_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "get_int", lambda *args, **kwargs: 0)
+    threads = []
+
+    output_writer.submit(_write, tmp_path / "out.txt", "sync", threads)
+
+    assert (tmp_path / "out.txt").read_text() == "sync"
+    assert threads == [threading.current_thread().name]
+
+
+def test_plot_results_renders_only_the_requested_formats(tmp_path):
+    time_array = np.linspace(0, 1, 200)
+    signal = np.where(time_array < 0.5, 0.0, 1.0)
+
+    output_writer.submit(
+        plot_results,
+        path=tmp_path / "plot.png",
+        title="plot",
+        magnitude="P",
+        time_array=time_array,
+        event_time=0.5,
+        shift_time=0,
+        pcc_signal=signal,
+        lower_envelope=signal - 0.1,
+        upper_envelope=signal + 0.1,
+        output_format="png",
+    )
+    output_writer.flush()
+
+    assert (tmp_path / "plot.png").stat().st_size > 0
+    assert not (tmp_path / "plot.html").exists()
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ([], None),
+        (["--no-plots"], ("csv",)),
+        (["--formats", "csv", "html"], ("csv", "html")),
+        (["--formats", "png", "csv", "png", "--no-plots"], ("csv",)),
+    ],
+)
+def test_output_formats_from_command_line(mocker, options, expected):
+    mocker.patch("dycov.cli.cli_parsers.version", return_value="0.0")
+    parser = cli_parsers.setup_cli_parsers()
+
+    args = parser.parse_args(["generateEnvelopes", "-i", "Producer.ini"] + options)
+
+    assert _get_output_formats(args) == expected
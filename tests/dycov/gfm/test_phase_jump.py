@@ -103,6 +103,7 @@ class ParametersHelper(GFMParameters):
         self._oc_section = "DEFAULT"
 
         config._pcs_config.read_string(config_str)
+        config._invalidate()
 
 
 def test_phase_jump_initialization():
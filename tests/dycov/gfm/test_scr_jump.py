@@ -105,6 +105,7 @@ class ParametersHelper(GFMParameters):
         self._oc_section = "DEFAULT"
 
         config._pcs_config.read_string(config_str)
+        config._invalidate()
 
 
 def test_scr_jump_initialization():
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import numpy as np
+import pytest
+from tests.dycov.gfm import test_amplitude_step, test_phase_jump, test_rocof, test_scr_jump
+
+from dycov.gfm.calculators.amplitude_step import AmplitudeStep
+from dycov.gfm.calculators.phase_jump import PhaseJump
+from dycov.gfm.calculators.rocof import RoCoF
+from dycov.gfm.calculators.scr_jump import SCRJump
+
+
+@pytest.mark.parametrize(
+    "calculator, test_module, params, time_array, event_time, d_values, h_values, x_values",
+    [
+        (
+            AmplitudeStep,
+            test_amplitude_step,
+            test_amplitude_step.gfm_params,
+            np.linspace(-1, 2, 600),
+            0.2,
+            [152.0, 40.0, 600.0],
+            [3.0, 10.0, 2.0],
+            [0.26, 0.06, 0.26],
+        ),
+        (
+            PhaseJump,
+            test_phase_jump,
+            test_phase_jump.gfm_overdamped_params,
+            np.linspace(-1, 2, 600),
+            0,
+            [152.0, 40.0, 600.0, 152.0],
+            [3.0, 10.0, 2.0, 3.0],
+            [0.06, 0.06, 0.25, 0.25],
+        ),
+        (
+            RoCoF,
+            test_rocof,
+            test_rocof.gfm_overdamped_params,
+            np.linspace(-1, 2, 600),
+            0.2,
+            [200.0, 40.0, 600.0, 200.0],
+            [7.0, 10.0, 2.0, 7.0],
+            [0.25, 0.06, 0.25, 0.06],
+        ),
+        (
+            SCRJump,
+            test_scr_jump,
+            test_scr_jump.gfm_underdamped_params,
+            np.linspace(-1, 4, 1000),
+            0,
+            [140.0, 133.0, 600.0, 140.0],
+            [5.0, 2.2, 2.0, 5.0],
+            [0.06, 0.25, 0.25, 0.25],
+        ),
+    ],
+    ids=["amplitude_step", "phase_jump", "rocof", "scr_jump"],
+)
+def test_sweep_matches_single_envelopes(
+    calculator, test_module, params, time_array, event_time, d_values, h_values, x_values
+):
+    """
+    Tests that the envelopes of a parameter sweep match those calculated one parameter set at
+    a time, for both overdamped and underdamped parameter sets.
+    """
+    d_values = np.array(d_values)
+    h_values = np.array(h_values)
+    x_values = np.array(x_values)
+
+    test_params = test_module.ParametersHelper(params)
+    envelopes = calculator(gfm_params=test_params)
+    magnitude, pcc, up, down = envelopes.calculate_envelopes_sweep(
+        D=d_values, H=h_values, Xeff=x_values, time_array=time_array, event_time=event_time
+    )
+
+    assert pcc.shape == (len(d_values), len(time_array))
+    for i, (d, h, x) in enumerate(zip(d_values, h_values, x_values)):
+        single = envelopes.calculate_envelopes(
+            D=d, H=h, Xeff=x, time_array=time_array, event_time=event_time
+        )
+        assert single[0] == magnitude
+        np.testing.assert_allclose(pcc[i], single[1], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(up[i], single[2], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(down[i], single[3], rtol=0, atol=1e-12)
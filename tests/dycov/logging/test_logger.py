@@ -104,3 +104,23 @@ class TestDycovLogger:
                 console_formatter="%(levelname)s:%(message)s",
                 log_dir=invalid_dir,
             )
+
+
+def test_init_handlers_replaces_previous_handlers(tmp_path):
+    logger = DycovLogger("reinitialized_logger")
+    other = logging.NullHandler()
+    logger.addHandler(other)
+    for _ in range(2):
+        logger.init_handlers(
+            file_log_level=logging.INFO,
+            file_formatter="%(levelname)s:%(message)s",
+            file_max_bytes=1024,
+            console_log_level=logging.INFO,
+            console_formatter="%(levelname)s:%(message)s",
+            log_dir=tmp_path,
+        )
+
+    assert len(logger.handlers) == 3
+    assert other in logger.handlers
+    for handler in logger.handlers:
+        handler.close()
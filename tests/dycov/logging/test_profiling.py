@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+
+import json
+import multiprocessing
+import sys
+
+import pytest
+
+from dycov.logging import profiling
+from dycov.logging.test_context import clear_test_context, set_test_context
+
+
+@pytest.fixture
+def profiler():
+    trace_dir = profiling.enable()
+    yield trace_dir
+    profiling.disable()
+    clear_test_context()
+
+
+def _worker_task(name):
+    with profiling.span(name):
+        pass
+    profiling.flush()
+
+
+def test_span_is_noop_when_disabled():
+    with profiling.span("stage"):
+        pass
+    assert not profiling.is_enabled()
+    assert profiling.collect() == []
+
+
+def test_span_records_stage_and_context(profiler):
+    set_test_context("PCS_RTE-I2", "Benchmark", "OC")
+    with profiling.span("stage"):
+        pass
+
+    events = profiling.collect()
+    assert len(events) == 1
+    assert events[0]["name"] == "stage"
+    assert events[0]["ph"] == "X"
+    assert events[0]["dur"] >= 0.0
+    assert {key: events[0]["args"][key] for key in ("pcs", "benchmark", "oc")} == {
+        "pcs": "PCS_RTE-I2",
+        "benchmark": "Benchmark",
+        "oc": "OC",
+    }
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RSS is read from /proc")
+def test_span_records_memory(profiler):
+    with profiling.span("allocate"):
+        data = bytearray(64 * 1024 * 1024)
+        data[::4096] = b"x" * len(data[::4096])
+
+    args = profiling.collect()[0]["args"]
+    assert args["rss_delta_mb"] >= 60.0
+    assert args["peak_rss_mb"] >= args["rss_mb"]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RSS is read from /proc")
+def test_reset_peak_rss():
+    data = bytearray(64 * 1024 * 1024)
+    data[::4096] = b"x" * len(data[::4096])
+    del data
+    if not profiling.reset_peak_rss():
+        pytest.skip("clear_refs is not writable")
+    assert profiling.peak_rss_mb() < profiling.current_rss_mb() + 32.0
+
+
+def test_span_as_decorator(profiler):
+    @profiling.span("decorated")
+    def work(value):
+        return value * 2
+
+    assert work(2) == 4
+    assert [event["name"] for event in profiling.collect()] == ["decorated"]
+
+
+def test_span_records_failed_stage(profiler):
+    with pytest.raises(ValueError):
+        with profiling.span("failing"):
+            raise ValueError()
+    assert [event["name"] for event in profiling.collect()] == ["failing"]
+
+
+def test_collect_merges_worker_spans(profiler):
+    with profiling.span("before"):
+        pass
+    with profiling.span("parent"):
+        process = multiprocessing.get_context("fork").Process(target=_worker_task, args=("child",))
+        process.start()
+        process.join()
+
+    events = profiling.collect()
+    assert sorted(event["name"] for event in events) == ["before", "child", "parent"]
+    assert len({event["pid"] for event in events}) == 2
+
+
+def test_write_trace(profiler, tmp_path):
+    with profiling.span("stage"):
+        pass
+
+    trace_file = tmp_path / "out" / "trace.json"
+    events = profiling.write_trace(trace_file)
+
+    trace = json.loads(trace_file.read_text())
+    assert trace["traceEvents"] == events
+    assert not profiling.is_enabled()
+    assert not profiler.exists()
+
+
+def test_summary():
+    events = [
+        {"name": "dynawo_run", "dur": 3e6, "args": {"pcs": "A", "rss_delta_mb": 2.0}},
+        {
+            "name": "dynawo_run",
+            "dur": 1e6,
+            "args": {"pcs": "B", "rss_delta_mb": 5.0, "peak_rss_mb": 300.0},
+        },
+        {"name": "pdflatex", "dur": 5e6, "args": {"pcs": None}},
+    ]
+
+    lines = profiling.summary(events).splitlines()
+    assert lines[1].split() == ["pdflatex", "1", "5.000", "5.000", "5.000", "-", "-"]
+    assert lines[2].split() == ["dynawo_run", "2", "4.000", "2.000", "3.000", "5.0", "300.0"]
+
+    grouped = profiling.summary(events, group_by="pcs")
+    assert "dynawo_run [A]" in grouped
+    assert "dynawo_run [B]" in grouped
@@ -83,3 +83,27 @@ def test_get_figures_description(monkeypatch):
     res = bm.get_figures_description()
 
     assert res is None
+
+
+def test_generate_operating_condition(monkeypatch, tmp_path):
+    from dycov.model.benchmark import Benchmark
+
+    class DummyParams:
+        def get_working_dir(self): return tmp_path
+
+    generated = []
+
+    class DummyOperatingCondition:
+        def __init__(self, parameters, pcs_name, bm_name, oc_name):
+            self._name = ".".join((pcs_name, bm_name, oc_name))
+
+        def generate(self, working_path):
+            generated.append((self._name, working_path))
+
+    monkeypatch.setattr(
+        "dycov.model.benchmark.OperatingCondition", DummyOperatingCondition
+    )
+
+    Benchmark.generate_operating_condition(DummyParams(), "Prod", "PCS", "Bench", "OC")
+
+    assert generated == [("PCS.Bench.OC", tmp_path / "Prod" / "PCS" / "Bench" / "OC")]
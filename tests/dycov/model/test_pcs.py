@@ -34,7 +34,6 @@ class DummyBenchmark:
     def __init__(self, pcs_name, pcs_id, pcs_zone, producer_name, report_name,
                  bm_name, parameters, producer):
         self._name = bm_name
-        self.generated = False
         DummyBenchmark.instances.append(self)
 
     def get_name(self):
@@ -47,9 +46,6 @@ class DummyBenchmark:
     def get_figures_description(self):
         return {"fig_" + self._name: 1}
 
-    def generate(self):
-        self.generated = True
-
 
 def _make_pcs(monkeypatch, bms=("BM_OK", "BM_KO")):
     import dycov.model.pcs as pcs_module
@@ -117,14 +113,6 @@ def test_validate_all_fail(monkeypatch):
     assert success is False
 
 
-def test_generate(monkeypatch):
-    pcs = _make_pcs(monkeypatch)
-
-    pcs.generate()
-
-    assert all(bm.generated for bm in DummyBenchmark.instances)
-
-
 def test_get_pcs_path_prefers_pcs_description(monkeypatch, tmp_path):
     pcs = _make_pcs(monkeypatch)
     producer = DummyProducer()
@@ -47,6 +47,7 @@ class ConfigReset:
             else None
         )
         config._user_config.set(section, key, str(value))
+        config._invalidate()
 
     def remove(self, section, key):
         if (section, key) in self._backup:
@@ -54,6 +55,7 @@ class ConfigReset:
                 config._user_config.remove_option(section, key)
             else:
                 config._user_config.set(section, key, self._backup[(section, key)])
+            config._invalidate()
 
 
 @pytest.fixture(autouse=True)
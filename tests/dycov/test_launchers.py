@@ -1,7 +1,17 @@
+import json
+import os
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
 import pytest
 
+# Time allowed for `dycov --help`, from the import of the entry point to its exit, in
+# seconds. It used to take several seconds when the command handlers and their
+# numerical and plotting dependencies were loaded eagerly.
+_STARTUP_BUDGET = 1.0
+_HEAVY_MODULES = ("pandas", "scipy", "matplotlib", "plotly")
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -11,6 +21,7 @@ def _fake_args(command):
     args = MagicMock()
     args.command = command
     args.launcher = "dynawo"
+    args.profile = None
     return args
 
 
@@ -34,7 +45,7 @@ def _patch_common(mocker):
 def test_dycov_calls_generate_handler(mocker):
     _patch_common(mocker)
 
-    mock_handle = mocker.patch("dycov.launchers.handle_generate_command")
+    mock_handle = mocker.patch("dycov.cli.command_handlers.handle_generate_command")
     mock_setup = mocker.patch("dycov.launchers.setup_cli_parsers")
 
     mock_setup.return_value.parse_args.return_value = _fake_args("generate")
@@ -49,7 +60,7 @@ def test_dycov_calls_generate_handler(mocker):
 def test_dycov_calls_validate_handler(mocker):
     _patch_common(mocker)
 
-    mock_handle = mocker.patch("dycov.launchers.handle_validate_command")
+    mock_handle = mocker.patch("dycov.cli.command_handlers.handle_validate_command")
     mock_setup = mocker.patch("dycov.launchers.setup_cli_parsers")
 
     mock_setup.return_value.parse_args.return_value = _fake_args("validate")
@@ -64,7 +75,7 @@ def test_dycov_calls_validate_handler(mocker):
 def test_dycov_calls_compile_handler(mocker):
     _patch_common(mocker)
 
-    mock_handle = mocker.patch("dycov.launchers.handle_compile_command")
+    mock_handle = mocker.patch("dycov.cli.command_handlers.handle_compile_command")
     mock_setup = mocker.patch("dycov.launchers.setup_cli_parsers")
 
     mock_setup.return_value.parse_args.return_value = _fake_args("compile")
@@ -76,6 +87,29 @@ def test_dycov_calls_compile_handler(mocker):
     mock_handle.assert_called_once()
 
 
+def test_dycov_profile_writes_trace(mocker, tmp_path):
+    _patch_common(mocker)
+
+    from dycov.logging import profiling
+
+    def handle(*args):
+        with profiling.span("stage"):
+            return 0
+
+    mocker.patch("dycov.cli.command_handlers.handle_compile_command", side_effect=handle)
+    args = _fake_args("compile")
+    args.profile = str(tmp_path / "trace.json")
+    mocker.patch("dycov.launchers.setup_cli_parsers").return_value.parse_args.return_value = args
+
+    from dycov.launchers import dycov
+
+    assert dycov() == 0
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == ["stage"]
+    assert not profiling.is_enabled()
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -125,3 +159,47 @@ def test_dycov_empty_command_logs_error(mocker, caplog):
 
     assert result == 1
     assert "Please provide a command" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# Startup time
+# ---------------------------------------------------------------------------
+
+
+def test_help_cold_start_does_not_import_heavy_dependencies():
+    # Runs the console script entry point as `dycov --help` does, building the parsers
+    # and dispatching through DycovCLI. The version is read from the package metadata,
+    # which is missing when the package is not installed.
+    code = (
+        "import importlib.metadata, sys, time\n"
+        "try:\n"
+        "    importlib.metadata.version('dycov')\n"
+        "except importlib.metadata.PackageNotFoundError:\n"
+        "    importlib.metadata.version = lambda name: '0.0'\n"
+        "start = time.perf_counter()\n"
+        "sys.argv = ['dycov', '--help']\n"
+        "from dycov.launchers import dycov\n"
+        "try:\n"
+        "    dycov()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(time.perf_counter() - start, file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+
+    assert "usage: dycov" in result.stdout
+    *import_lines, elapsed = result.stderr.strip().splitlines()
+    imported = {
+        line.split("|")[-1].strip().split(".")[0]
+        for line in import_lines
+        if line.startswith("import time:")
+    }
+    assert "dycov" in imported
+    assert imported.isdisjoint(_HEAVY_MODULES)
+    assert float(elapsed) < _STARTUP_BUDGET
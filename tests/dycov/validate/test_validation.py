@@ -220,3 +220,36 @@ def test_validation_exits_on_existing_output_dir(monkeypatch, temp_dirs):
     )
     with pytest.raises(SystemExit):
         Validation(parameters)
+
+
+def test_shared_pcs_worker_returns_only_the_report_keys(monkeypatch):
+    import dycov.validate.validation as validation_module
+    from dycov.core import worker_pool
+
+    pcs_results = {
+        "producer": "Prod",
+        "report_name": "Report.tex",
+        "sim_type": ELECTRIC_PERFORMANCE_PPM,
+        "success": True,
+        "pcs": object(),
+        "BM.OC": {"curves": object()},
+    }
+    monkeypatch.setattr(
+        validation_module,
+        "_validate_pcs",
+        lambda args: ("Prod", "PCS", ["summary"], dict(pcs_results)),
+    )
+    with worker_pool.shared_state(("parameters", "latex")) as state_file:
+        result = validation_module._validate_shared_pcs((state_file, "PCS", "Prod"))
+
+    assert result == (
+        "Prod",
+        "PCS",
+        ["summary"],
+        {
+            "producer": "Prod",
+            "report_name": "Report.tex",
+            "sim_type": ELECTRIC_PERFORMANCE_PPM,
+            "success": True,
+        },
+    )
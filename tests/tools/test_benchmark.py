@@ -0,0 +1,193 @@
+# Copyright (c) 2024-2026, RTE (https://www.rte-france.com)
+# SPDX-License-Identifier: MPL-2.0
+"""Tests for the offline benchmark suite (``tools/benchmark``).
+
+The stub launcher is exercised on a minimal jobs/CRV pair in its three modes
+(synthetic, record and replay); the runner only for its result aggregation, since
+the end-to-end scenarios take minutes. The micro-benchmark kernels run once on
+short synthetic curves.
+"""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# The tool lives under tools/ (outside the dycov package); import it by path.
+_TOOL_DIR = Path(__file__).resolve().parents[2] / "tools" / "benchmark"
+sys.path.insert(0, str(_TOOL_DIR))
+
+import micro_benchmarks  # noqa: E402
+import run_benchmarks  # noqa: E402
+import stub_dynawo  # noqa: E402
+
+_JOBS = """<?xml version='1.0' encoding='UTF-8'?>
+<dyn:jobs xmlns:dyn="http://www.rte-france.com/dynawo">
+  <dyn:job name="test">
+    <dyn:simulation startTime="0" stopTime="1" precision="1e-6"/>
+    <dyn:outputs directory="outputs">
+      <dyn:curves inputFile="TSOModel.crv" exportMode="CSV"/>
+    </dyn:outputs>
+  </dyn:job>
+</dyn:jobs>
+"""
+
+_CRV = """<?xml version='1.0' encoding='UTF-8'?>
+<curvesInput xmlns="http://www.rte-france.com/dynawo">
+  <curve model="BusPDR" variable="U"/>
+  <curve model="Measurements" variable="PPu"/>
+</curvesInput>
+"""
+
+
+@pytest.fixture
+def inputs(tmp_path, monkeypatch):
+    inputs_path = tmp_path / "Producer" / "PCS" / "Benchmark" / "OC"
+    inputs_path.mkdir(parents=True)
+    (inputs_path / "TSOModel.jobs").write_text(_JOBS)
+    (inputs_path / "TSOModel.crv").write_text(_CRV)
+    monkeypatch.chdir(inputs_path)
+    for variable in (
+        stub_dynawo.RECORDINGS_ENV,
+        stub_dynawo.REAL_LAUNCHER_ENV,
+        stub_dynawo.TIME_STEP_ENV,
+        stub_dynawo.DELAY_ENV,
+    ):
+        monkeypatch.delenv(variable, raising=False)
+    return inputs_path
+
+
+def _curves(inputs_path: Path) -> list[str]:
+    return (inputs_path / "outputs" / "curves" / "curves.csv").read_text().splitlines()
+
+
+def test_synthetic_outputs(inputs, monkeypatch, capsys):
+    monkeypatch.setenv(stub_dynawo.TIME_STEP_ENV, "0.25")
+
+    assert stub_dynawo.main(["jobs", "TSOModel.jobs"]) == 0
+
+    lines = _curves(inputs)
+    assert lines[0] == "time;BusPDR_U;Measurements_PPu;"
+    assert len(lines) == 6
+    assert lines[-1] == "1.000000;1.0;1.0;"
+    assert (inputs / "outputs" / "timeLine" / "timeline.xml").is_file()
+    assert "ERROR" not in (inputs / "outputs" / "logs" / "dynawo.log").read_text()
+    assert "succeeded" in capsys.readouterr().err
+
+
+def test_record_and_replay(inputs, tmp_path, monkeypatch):
+    recordings = tmp_path / "recordings"
+    real_launcher = tmp_path / "dynawo.sh"
+    real_launcher.write_text(
+        "#!/bin/sh\nmkdir -p outputs/curves outputs/logs\n"
+        'printf "time;BusPDR_U;\\n0;0.5;\\n" > outputs/curves/curves.csv\n'
+        'echo "INFO | real" > outputs/logs/dynawo.log\n'
+    )
+    real_launcher.chmod(real_launcher.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv(stub_dynawo.RECORDINGS_ENV, str(recordings))
+    monkeypatch.setenv(stub_dynawo.REAL_LAUNCHER_ENV, str(real_launcher))
+
+    assert stub_dynawo.main(["jobs", "TSOModel.jobs"]) == 0
+    recording_dir = recordings / stub_dynawo.inputs_fingerprint(inputs)
+    assert (recording_dir / "curves.csv").is_file()
+    assert (recording_dir / "label.txt").read_text().strip() == "Producer/PCS/Benchmark/OC"
+
+    monkeypatch.delenv(stub_dynawo.REAL_LAUNCHER_ENV)
+    (inputs / "outputs" / "curves" / "curves.csv").unlink()
+    assert stub_dynawo.main(["jobs", "TSOModel.jobs"]) == 0
+    assert _curves(inputs) == ["time;BusPDR_U;", "0;0.5;"]
+
+
+def test_replay_falls_back_to_synthetic_outputs(inputs, tmp_path, monkeypatch):
+    recordings = tmp_path / "recordings"
+    recordings.mkdir()
+    monkeypatch.setenv(stub_dynawo.RECORDINGS_ENV, str(recordings))
+
+    assert stub_dynawo.main(["jobs", "TSOModel.jobs"]) == 0
+
+    assert _curves(inputs)[0] == "time;BusPDR_U;Measurements_PPu;"
+    missing = (recordings / "missing.txt").read_text()
+    assert stub_dynawo.inputs_fingerprint(inputs) in missing
+
+
+def test_precompile_creates_placeholders(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    args = ["jobs", "--generate-preassembled", "--output-dir", str(tmp_path / "ddb")]
+    assert stub_dynawo.main(args) == 0
+    assert (tmp_path / "ddb").is_dir()
+
+    args = ["jobs", "--dump-model", "--output-file", "Model.desc.xml"]
+    assert stub_dynawo.main(args) == 0
+    assert (tmp_path / "Model.desc.xml").is_file()
+
+
+def test_summarize():
+    runs = [
+        {"wall_time": 2.0, "stages": {"dynawo_run": 1.0}, "peak_rss_mb": 100.0},
+        {"wall_time": 4.0, "stages": {"dynawo_run": 3.0, "pdflatex": 1.0}, "peak_rss_mb": 90.0},
+    ]
+
+    summary = run_benchmarks.summarize(runs)
+
+    assert summary["wall_time_mean"] == 3.0
+    assert summary["wall_time_min"] == 2.0
+    assert summary["stages_mean"] == {"dynawo_run": 2.0, "pdflatex": 0.5}
+    assert summary["peak_rss_mb"] == 100.0
+
+
+def test_compare_reports_regressions():
+    baseline = {"scenarios": {"a": {"wall_time_mean": 10.0}, "b": {"wall_time_mean": 10.0}}}
+    results = {
+        "scenarios": {
+            "a": {"wall_time_mean": 10.5},
+            "b": {"wall_time_mean": 12.0},
+            "c": {"wall_time_mean": 1.0},
+        }
+    }
+
+    regressions = run_benchmarks.compare(results, baseline)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b:")
+
+
+def test_make_curves():
+    curves = micro_benchmarks.make_curves(1000, 8)
+
+    assert list(curves.columns) == ["time"] + micro_benchmarks.MEASUREMENTS + [
+        "Signal_0",
+        "Signal_1",
+    ]
+    assert len(curves) == 1000
+    assert curves["time"].iloc[-1] == pytest.approx(micro_benchmarks.DURATION)
+    assert (curves["time"].diff().iloc[1:] >= 0.0).all()
+    assert curves["time"].duplicated().any()
+
+
+@pytest.mark.parametrize("name", sorted(micro_benchmarks.KERNELS))
+def test_kernels_run(name):
+    result = micro_benchmarks.run_kernel(name, [500, 1000], 6)
+
+    assert result["sizes"] == [500, 1000]
+    assert all(seconds > 0.0 for seconds in result["seconds"])
+    assert result["exponent"] is not None
+
+
+def test_scaling_exponent():
+    assert micro_benchmarks.scaling_exponent([10, 100, 1000], [1.0, 10.0, 100.0]) == (
+        pytest.approx(1.0)
+    )
+    assert micro_benchmarks.scaling_exponent([10], [1.0]) is None
+
+
+def test_micro_compare_reports_regressions():
+    baseline = {"kernels": {"a": {"sizes": [1000, 10000], "seconds": [1e-3, 1e-2]}}}
+    results = {"kernels": {"a": {"sizes": [1000, 10000], "seconds": [1.1e-3, 2e-2]}}}
+
+    regressions = micro_benchmarks.compare(results, baseline)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("a n=10000:")
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Micro-benchmarks of the numeric kernels of signal processing and validation, and of
+the configuration lookups they run in their inner loops.
+
+Each kernel runs on synthetic curves of increasing length: a step response with
+damped oscillations and noise, on a jittered time grid with repeated points like
+simulator outputs (or on a fixed step for the kernels that run after resampling).
+The configuration kernels run as many lookups as samples.
+The best time per call is reported for each length, together with the scaling
+exponent k of a fit time ~ n^k.
+
+Usage::
+
+    python tools/benchmark/micro_benchmarks.py [--kernel NAME ...]
+        [--sizes 1000 10000 100000 1000000] [--columns 6] [--output micro.json]
+        [--baseline previous.json] [--plot scaling.png]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT / "src"))
+
+from dycov.configuration.cfg import config  # noqa: E402
+from dycov.curves import anonymizer  # noqa: E402
+from dycov.sigpro import sigpro  # noqa: E402
+from dycov.validation import checks, common  # noqa: E402
+
+# Signals compared by checks.calculate_errors; extra columns get generic names
+MEASUREMENTS = [
+    "BusPDR_BUS_ActivePower",
+    "BusPDR_BUS_ReactivePower",
+    "BusPDR_BUS_ActiveCurrent",
+    "BusPDR_BUS_ReactiveCurrent",
+    "BusPDR_BUS_Voltage",
+    "NetworkFrequencyPu",
+]
+
+DURATION = 20.0
+EVENT_START = 5.0
+EVENT_DURATION = 0.15
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Configuration lookups of the signal processing and windowing hot paths
+CONFIG_LOOKUPS = [
+    ("get_float", "GridCode", "t_com", 0.002),
+    ("get_float", "GridCode", "t_windowLPF_excl_start", 0.020),
+    ("get_float", "GridCode", "t_windowLPF_excl_end", 0.020),
+    ("get_float", "GridCode", "t_integrator_tol", 0.000001),
+    ("get_float", "GridCode", "thr_ss_tol", 0.002),
+    ("get_boolean", "Debug", "disable_LP_filtering", False),
+    ("get_boolean", "GridCode", "disable_window_filtering", False),
+]
+
+# Minimum measuring time and maximum number of calls of each kernel and size
+_MIN_TIME = 0.2
+_MAX_CALLS = 50
+
+# Relative slowdown of the time per call reported as a regression by --baseline
+_REGRESSION_THRESHOLD = 0.20
+
+
+def make_time(n_samples: int, seed: int = 0) -> np.ndarray:
+    """Returns a variable-step time grid over [0, DURATION], with some repeated points.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples.
+    seed : int
+        Seed of the random generator.
+
+    Returns
+    -------
+    np.ndarray
+        Non-decreasing time grid.
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.uniform(0.5, 1.5, n_samples - 1)
+    steps[rng.choice(n_samples - 1, size=max(1, n_samples // 1000), replace=False)] = 0.0
+    times = np.concatenate(([0.0], np.cumsum(steps)))
+    return times * DURATION / times[-1]
+
+
+def make_signal(times: np.ndarray, index: int = 0, noise: float = 1e-4) -> np.ndarray:
+    """Returns a step response at EVENT_START with damped oscillations and noise.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time grid.
+    index : int
+        Signal number, to vary amplitude and frequency between columns.
+    noise : float
+        Standard deviation of the added noise.
+
+    Returns
+    -------
+    np.ndarray
+        Signal values.
+    """
+    rng = np.random.default_rng(index + 1)
+    elapsed = np.clip(times - EVENT_START, 0.0, None)
+    response = 1.0 - np.exp(-elapsed / 0.3) * np.cos(2 * np.pi * (1.0 + index) * elapsed)
+    values = 1.0 + 0.1 * (1 + index % 3) * np.where(times >= EVENT_START, response, 0.0)
+    return values + rng.normal(0.0, noise, len(times))
+
+
+def make_curves(
+    n_samples: int, n_columns: int, seed: int = 0, fixed_step: bool = False
+) -> pd.DataFrame:
+    """Returns a curves DataFrame with a "time" column and n_columns signals.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples.
+    n_columns : int
+        Number of signal columns.
+    seed : int
+        Seed of the time grid.
+    fixed_step : bool
+        Use a fixed time step instead of the variable grid of make_time.
+
+    Returns
+    -------
+    pd.DataFrame
+        Synthetic curves.
+    """
+    times = np.linspace(0.0, DURATION, n_samples) if fixed_step else make_time(n_samples, seed)
+    names = MEASUREMENTS[:n_columns] + [
+        f"Signal_{i}" for i in range(max(0, n_columns - len(MEASUREMENTS)))
+    ]
+    curves = {"time": times}
+    for i, name in enumerate(names):
+        curves[name] = make_signal(times, i)
+    return pd.DataFrame(curves)
+
+
+def make_abc_curves(n_samples: int, n_columns: int) -> pd.DataFrame:
+    """Returns three-phase 50 Hz curves (``<name>_a/_b/_c``) on a fixed time grid.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples.
+    n_columns : int
+        Number of three-phase signals.
+
+    Returns
+    -------
+    pd.DataFrame
+        Synthetic EMT curves.
+    """
+    times = np.linspace(0.0, DURATION, n_samples)
+    curves = {"time": times}
+    for i in range(n_columns):
+        amplitude = make_signal(times, i, noise=0.0)
+        for phase, shift in (("a", 0.0), ("b", -2 * np.pi / 3), ("c", 2 * np.pi / 3)):
+            curves[f"Signal_{i}_{phase}"] = amplitude * np.cos(2 * np.pi * 50.0 * times + shift)
+    return pd.DataFrame(curves)
+
+
+def _windows() -> dict:
+    event_end = EVENT_START + EVENT_DURATION
+    return {
+        "before": (0.0, EVENT_START),
+        "during": (EVENT_START, event_end),
+        "after": (event_end, DURATION),
+    }
+
+
+def _resample_to_fixed_step(n_samples: int, n_columns: int) -> Callable:
+    curves = make_curves(n_samples, n_columns)
+    return lambda: sigpro.resample_to_fixed_step(curves)
+
+
+def _resample_to_common_tgrid(n_samples: int, n_columns: int) -> Callable:
+    simulated = make_curves(n_samples, n_columns, seed=0)
+    reference = make_curves(n_samples, n_columns, seed=1)
+    return lambda: sigpro.resample_to_common_tgrid(simulated, reference)
+
+
+def _filter_curves(n_samples: int, n_columns: int) -> Callable:
+    # filter_curves works in place on the column views, so each call gets a copy
+    curves = make_curves(n_samples, n_columns, fixed_step=True)
+    windows = _windows()
+    return lambda: sigpro.filter_curves(curves.copy(), windows)
+
+
+def _ensure_rms_signals(n_samples: int, n_columns: int) -> Callable:
+    curves = make_abc_curves(n_samples, n_columns)
+    return lambda: sigpro.ensure_rms_signals(curves)
+
+
+def _is_stable(n_samples: int, n_columns: int) -> Callable:
+    times = make_time(n_samples)
+    times, curve = list(times), list(make_signal(times, noise=0.0))
+    return lambda: common.is_stable(times, curve)
+
+
+def _get_settling_time(n_samples: int, n_columns: int) -> Callable:
+    times = make_time(n_samples)
+    times, curve = list(times), list(make_signal(times, noise=0.0))
+    return lambda: common.get_settling_time(0.05, times, curve, EVENT_START)
+
+
+def _calculate_errors(n_samples: int, n_columns: int) -> Callable:
+    simulated = make_curves(n_samples, n_columns, seed=0)
+    reference = simulated.copy()
+    for column in reference.columns[1:]:
+        reference[column] = reference[column] * 1.01
+    return lambda: checks.calculate_errors((simulated, reference), 0.1)
+
+
+def _rdp_mask_numpy(n_samples: int, n_columns: int) -> Callable:
+    times = make_time(n_samples)
+    points = np.column_stack((times, make_signal(times, noise=0.0)))
+    return lambda: anonymizer._rdp_mask_numpy(points, 1e-4)
+
+
+def _config_calls(n_samples: int) -> list:
+    lookups = [
+        (getattr(config, method), (section, key, default))
+        for method, section, key, default in CONFIG_LOOKUPS
+    ]
+    return [lookups[i % len(lookups)] for i in range(n_samples)]
+
+
+def _config_lookups(n_samples: int, n_columns: int) -> Callable:
+    calls = _config_calls(n_samples)
+
+    def run():
+        for getter, args in calls:
+            getter(*args)
+
+    return run
+
+
+def _config_lookups_uncached(n_samples: int, n_columns: int) -> Callable:
+    # Discarding the memoized lookups before each call times the parser resolution
+    calls = _config_calls(n_samples)
+
+    def run():
+        for getter, args in calls:
+            config._invalidate()
+            getter(*args)
+
+    return run
+
+
+# name: builder(n_samples, n_columns) -> zero-argument callable running the kernel
+KERNELS = {
+    "resample_to_fixed_step": _resample_to_fixed_step,
+    "resample_to_common_tgrid": _resample_to_common_tgrid,
+    "filter_curves": _filter_curves,
+    "ensure_rms_signals": _ensure_rms_signals,
+    "is_stable": _is_stable,
+    "get_settling_time": _get_settling_time,
+    "calculate_errors": _calculate_errors,
+    "rdp_mask_numpy": _rdp_mask_numpy,
+    "config_lookups": _config_lookups,
+    "config_lookups_uncached": _config_lookups_uncached,
+}
+
+
+def time_call(function: Callable, min_time: float = _MIN_TIME, max_calls: int = _MAX_CALLS):
+    """Returns the best time of a call, repeating it until min_time is spent.
+
+    Parameters
+    ----------
+    function : Callable
+        Zero-argument callable.
+    min_time : float
+        Minimum total measuring time, in seconds.
+    max_calls : int
+        Maximum number of calls.
+
+    Returns
+    -------
+    tuple
+        Best time per call, in seconds, and number of calls.
+    """
+    best = math.inf
+    total = 0.0
+    calls = 0
+    while calls < max_calls and (calls == 0 or total < min_time):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        calls += 1
+    return best, calls
+
+
+def scaling_exponent(sizes: list[int], seconds: list[float]) -> float | None:
+    """Returns the slope of log(seconds) against log(sizes).
+
+    Parameters
+    ----------
+    sizes : list
+        Numbers of samples.
+    seconds : list
+        Time per call for each size.
+
+    Returns
+    -------
+    float | None
+        Scaling exponent, or None with fewer than two sizes.
+    """
+    if len(sizes) < 2:
+        return None
+    return float(np.polyfit(np.log(sizes), np.log(seconds), 1)[0])
+
+
+def run_kernel(name: str, sizes: list[int], n_columns: int) -> dict:
+    """Times a kernel for each size.
+
+    Parameters
+    ----------
+    name : str
+        Kernel name.
+    sizes : list
+        Numbers of samples.
+    n_columns : int
+        Number of signal columns.
+
+    Returns
+    -------
+    dict
+        Sizes, best time and number of calls per size, and scaling exponent.
+    """
+    seconds = []
+    calls = []
+    for n_samples in sizes:
+        best, count = time_call(KERNELS[name](n_samples, n_columns))
+        seconds.append(best)
+        calls.append(count)
+    return {
+        "sizes": sizes,
+        "seconds": seconds,
+        "calls": calls,
+        "exponent": scaling_exponent(sizes, seconds),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = _REGRESSION_THRESHOLD) -> list[str]:
+    """Returns a line for each kernel and size whose time per call grew more than threshold.
+
+    Parameters
+    ----------
+    results : dict
+        Current results file contents.
+    baseline : dict
+        Previous results file contents.
+    threshold : float
+        Allowed relative slowdown.
+
+    Returns
+    -------
+    list
+        Description of each regression.
+    """
+    regressions = []
+    for name, current in results["kernels"].items():
+        previous = baseline.get("kernels", {}).get(name)
+        if not previous:
+            continue
+        previous_seconds = dict(zip(previous["sizes"], previous["seconds"]))
+        for n_samples, seconds in zip(current["sizes"], current["seconds"]):
+            if n_samples not in previous_seconds:
+                continue
+            ratio = seconds / previous_seconds[n_samples]
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    f"{name} n={n_samples}: {previous_seconds[n_samples] * 1e3:.3f} ms -> "
+                    f"{seconds * 1e3:.3f} ms ({(ratio - 1.0) * 100:+.0f}%)"
+                )
+    return regressions
+
+
+def plot(results: dict, output_file: Path) -> None:
+    """Saves the scaling curves of all kernels in a log-log chart.
+
+    Parameters
+    ----------
+    results : dict
+        Results file contents.
+    output_file : Path
+        Image file.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for name, result in results["kernels"].items():
+        ax.loglog(result["sizes"], result["seconds"], marker="o", label=name)
+    ax.set_xlabel("Samples")
+    ax.set_ylabel("Time per call (s)")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend(fontsize="small")
+    fig.tight_layout()
+    fig.savefig(output_file)
+    plt.close(fig)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--kernel", action="append", choices=sorted(KERNELS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--columns", type=int, default=len(MEASUREMENTS))
+    parser.add_argument("--output", type=Path, default=Path("micro_benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare with.")
+    parser.add_argument("--plot", type=Path, help="Save the scaling curves to this image.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    results = {
+        "metadata": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "columns": args.columns,
+        },
+        "kernels": {},
+    }
+
+    print(f"{'Kernel':<26}" + "".join(f"{n:>12}" for n in args.sizes) + f"{'k':>7}")
+    for name in args.kernel or list(KERNELS):
+        result = run_kernel(name, args.sizes, args.columns)
+        results["kernels"][name] = result
+        exponent = f"{result['exponent']:7.2f}" if result["exponent"] is not None else " " * 7
+        print(
+            f"{name:<26}"
+            + "".join(f"{seconds * 1e3:>10.3f}ms" for seconds in result["seconds"])
+            + exponent
+        )
+
+    args.output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {args.output}")
+    if args.plot:
+        plot(results, args.plot)
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()))
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
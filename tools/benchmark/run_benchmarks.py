@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Offline end-to-end benchmarks of ``dycov validate`` and ``dycov performance``.
+
+Each scenario runs the bundled examples through the same API the CLI uses, with
+the Dynawo launcher replaced by ``stub_dynawo.py``, so the timings measure the
+DyCoV overhead (model setup, curve loading, signal processing, validation checks
+and reporting) without a simulator. Every run happens in a fresh process, which
+reports its wall time, the time spent in each profiled stage and its peak RSS.
+
+Usage::
+
+    python tools/benchmark/run_benchmarks.py [--scenario NAME ...] [--repeat N]
+        [--recordings DIR [--real-launcher dynawo.sh]] [--output results.json]
+        [--baseline previous.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+_EXAMPLES = _ROOT / "examples"
+_STUB = Path(__file__).resolve().parent / "stub_dynawo.py"
+
+# name: (kind, producer model, producer curves, reference curves), relative to examples/
+SCENARIOS = {
+    "validate-ppm-curves": (
+        "validate",
+        None,
+        "Model/ProducerCurves/PPM",
+        "Model/Wind/IECB2015/ReferenceCurves",
+    ),
+    "validate-wecc4a": (
+        "validate",
+        "Model/Wind/WECC4A/Dynawo",
+        None,
+        "Model/Wind/WECC4A/ReferenceCurves",
+    ),
+    "performance-ppm-curves": ("performance", None, "Performance/ProducerCurves/PPM", None),
+    "performance-wecc4b": ("performance", "Performance/Single/WECC4B/Dynawo", None, None),
+    "performance-sm": (
+        "performance",
+        "Performance/Single/GeneratorSynchronousFourWindingsTGov1SexsPss2a/Dynawo",
+        None,
+        None,
+    ),
+}
+
+# Scenarios whose checks need realistic curves (fault and clearing time searches,
+# comparisons with the reference), so they only run when replaying recorded outputs
+RECORDED_ONLY = {"validate-wecc4a", "performance-sm"}
+
+# Relative slowdown of the mean wall time reported as a regression by --baseline
+_REGRESSION_THRESHOLD = 0.10
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1024.0 if sys.platform == "darwin" else 1.0
+    usage = max(
+        resource.getrusage(who).ru_maxrss
+        for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)
+    )
+    return usage / scale / 1024.0
+
+
+def run_scenario(name: str, parallel: int, pdf: bool) -> dict:
+    """Runs a scenario in the current process and returns its measurements.
+
+    Parameters
+    ----------
+    name : str
+        Scenario name.
+    parallel : int
+        Number of worker processes (1 runs the PCS sequentially).
+    pdf : bool
+        Whether to compile the report with pdflatex.
+
+    Returns
+    -------
+    dict
+        Wall time, time per stage, peak RSS and compliance results.
+    """
+    from dycov.core.global_variables import ELECTRIC_PERFORMANCE, MODEL_VALIDATION
+    from dycov.logging import profiling
+    from dycov.validate.parameters import ValidationParameters
+    from dycov.validate.validation import Validation
+
+    kind, model, curves, reference = SCENARIOS[name]
+    inputs = [_EXAMPLES / path if path else None for path in (model, curves, reference)]
+    sim_type = MODEL_VALIDATION if kind == "validate" else ELECTRIC_PERFORMANCE
+
+    profiling.enable()
+    with tempfile.TemporaryDirectory(prefix="dycov_bench_") as tmp_dir:
+        start = time.perf_counter()
+        parameters = ValidationParameters(
+            _STUB, *inputs, None, Path(tmp_dir) / "Results", True, sim_type
+        )
+        validation = Validation(parameters, dry_run=not pdf)
+        validation.set_testing(True)
+        compliance = validation.validate(use_parallel=parallel > 1, num_processes=parallel)
+        wall_time = time.perf_counter() - start
+        events = profiling.write_trace(Path(tmp_dir) / "trace.json")
+
+    stages = {}
+    for event in events:
+        stages[event["name"]] = stages.get(event["name"], 0.0) + event["dur"] / 1e6
+    return {
+        "wall_time": wall_time,
+        "stages": stages,
+        "peak_rss_mb": _peak_rss_mb(),
+        "compliance": [str(result) for result in compliance],
+    }
+
+
+def _run_isolated(name: str, args: argparse.Namespace) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_ROOT / "src"), env.get("PYTHONPATH")]))
+    for variable, value in (
+        ("DYCOV_STUB_RECORDINGS", args.recordings),
+        ("DYCOV_STUB_REAL_LAUNCHER", args.real_launcher),
+        ("DYCOV_STUB_DELAY", args.delay),
+        ("DYCOV_STUB_TIME_STEP", args.time_step),
+    ):
+        if value is not None:
+            env[variable] = str(value)
+    command = [sys.executable, __file__, "--child", name, "--parallel", str(args.parallel)]
+    if args.pdf:
+        command.append("--pdf")
+    result = subprocess.run(command, env=env, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario {name} failed:\n{result.stderr[-4000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs: list[dict]) -> dict:
+    """Aggregates the repeated runs of a scenario.
+
+    Parameters
+    ----------
+    runs : list
+        Measurements returned by run_scenario.
+
+    Returns
+    -------
+    dict
+        Mean, minimum and standard deviation of the wall time, mean time per stage
+        and maximum peak RSS.
+    """
+    wall_times = [run["wall_time"] for run in runs]
+    stage_names = sorted({stage for run in runs for stage in run["stages"]})
+    return {
+        "wall_time_mean": statistics.mean(wall_times),
+        "wall_time_min": min(wall_times),
+        "wall_time_stdev": statistics.stdev(wall_times) if len(wall_times) > 1 else 0.0,
+        "stages_mean": {
+            stage: statistics.mean(run["stages"].get(stage, 0.0) for run in runs)
+            for stage in stage_names
+        },
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+        "runs": runs,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = _REGRESSION_THRESHOLD) -> list[str]:
+    """Returns a line for each scenario whose mean wall time grew more than threshold.
+
+    Parameters
+    ----------
+    results : dict
+        Current results file contents.
+    baseline : dict
+        Previous results file contents.
+    threshold : float
+        Allowed relative slowdown.
+
+    Returns
+    -------
+    list
+        Description of each regression.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        ratio = current["wall_time_mean"] / previous["wall_time_mean"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{name}: {previous['wall_time_mean']:.2f} s -> "
+                f"{current['wall_time_mean']:.2f} s ({(ratio - 1.0) * 100:+.0f}%)"
+            )
+    return regressions
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each scenario.")
+    parser.add_argument("--parallel", type=int, default=1, help="Worker processes.")
+    parser.add_argument("--recordings", type=Path, help="Recorded Dynawo outputs to replay.")
+    parser.add_argument(
+        "--real-launcher", type=Path, help="Dynawo launcher used to fill --recordings."
+    )
+    parser.add_argument("--delay", type=float, help="Seconds added to each stub simulation.")
+    parser.add_argument("--time-step", type=float, help="Time step of the synthetic curves.")
+    parser.add_argument("--pdf", action="store_true", help="Compile the reports with pdflatex.")
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare with.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.parallel, args.pdf)))
+        return 0
+
+    results = {
+        "metadata": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "parallel": args.parallel,
+            "recordings": str(args.recordings) if args.recordings else None,
+        },
+        "scenarios": {},
+    }
+    if args.real_launcher and not args.recordings:
+        print("--real-launcher requires --recordings")
+        return 2
+    scenarios = args.scenario or [
+        name for name in SCENARIOS if args.recordings or name not in RECORDED_ONLY
+    ]
+    for name in scenarios:
+        runs = [_run_isolated(name, args) for _ in range(args.repeat)]
+        results["scenarios"][name] = summarize(runs)
+        summary = results["scenarios"][name]
+        print(
+            f"{name:<24} {summary['wall_time_mean']:8.2f} s "
+            f"(min {summary['wall_time_min']:.2f} s)  peak RSS {summary['peak_rss_mb']:.0f} MB"
+        )
+
+    args.output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()))
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# (c) 2026 RTE
+# Developed by Grupo AIA
+#     marinjl@aia.es
+#     omsg@aia.es
+#     demiguelm@aia.es
+#
+"""
+Stand-in for the Dynawo launcher, used by the offline benchmark suite.
+
+It accepts the same command lines DyCoV uses to run a simulation
+(``stub_dynawo.py jobs TSOModel.jobs``, run from the directory holding the
+inputs) and writes the files DyCoV reads back: ``curves/curves.csv``,
+``timeLine/timeline.xml`` and ``logs/dynawo.log`` under the jobs output directory.
+
+The outputs are looked up by the fingerprint of the simulation inputs (the files
+directly under the working directory):
+
+* **replay** (``DYCOV_STUB_RECORDINGS`` set): the recorded outputs of the same
+  inputs are copied into place. Inputs without a recording fall back to synthetic
+  outputs, and are listed in ``missing.txt`` in the recordings directory.
+* **record** (``DYCOV_STUB_RECORDINGS`` and ``DYCOV_STUB_REAL_LAUNCHER`` set): the
+  real launcher runs the simulation and its outputs are stored for later replays.
+* **synthetic** (no recordings): every curve of the CRV file is written as a flat
+  signal on a fixed time grid (``DYCOV_STUB_TIME_STEP``, 0.002 s by default).
+
+``DYCOV_STUB_DELAY`` adds a fixed sleep (in seconds) to every simulation, to emulate
+the cost of the simulator. Precompilation commands only create placeholder files.
+
+Only the standard library is used, so it runs with any Python interpreter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+RECORDINGS_ENV = "DYCOV_STUB_RECORDINGS"
+REAL_LAUNCHER_ENV = "DYCOV_STUB_REAL_LAUNCHER"
+TIME_STEP_ENV = "DYCOV_STUB_TIME_STEP"
+DELAY_ENV = "DYCOV_STUB_DELAY"
+
+# Output files, relative to the jobs output directory
+OUTPUT_FILES = ("curves/curves.csv", "timeLine/timeline.xml", "logs/dynawo.log")
+
+_TIMELINE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<timeline xmlns="http://www.rte-france.com/dynawo"/>\n'
+)
+
+
+def _local_name(element: ET.Element) -> str:
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def _find(root: ET.Element, name: str) -> ET.Element | None:
+    return next((element for element in root.iter() if _local_name(element) == name), None)
+
+
+def inputs_fingerprint(inputs_path: Path) -> str:
+    """Returns a hash of the simulation inputs: the files directly under inputs_path.
+
+    Parameters
+    ----------
+    inputs_path : Path
+        Directory holding the jobs file and the rest of the simulation inputs.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for file in sorted(inputs_path.iterdir()):
+        if file.is_file():
+            digest.update(file.name.encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def read_jobs(jobs_file: Path) -> tuple[Path, Path | None, float, float]:
+    """Returns the output directory, CRV file, start time and stop time of a jobs file.
+
+    Parameters
+    ----------
+    jobs_file : Path
+        Dynawo jobs file.
+
+    Returns
+    -------
+    tuple
+        Output directory, CRV file (None if no curves are requested), start and stop
+        time of the simulation.
+    """
+    root = ET.parse(jobs_file).getroot()
+    outputs = _find(root, "outputs")
+    curves = _find(root, "curves")
+    simulation = _find(root, "simulation")
+    output_dir = jobs_file.parent / (
+        outputs.get("directory") if outputs is not None else "outputs"
+    )
+    crv_file = jobs_file.parent / curves.get("inputFile") if curves is not None else None
+    start = float(simulation.get("startTime", 0.0)) if simulation is not None else 0.0
+    stop = float(simulation.get("stopTime", 1.0)) if simulation is not None else 1.0
+    return output_dir, crv_file, start, stop
+
+
+def read_curve_names(crv_file: Path) -> list[str]:
+    """Returns the CSV column name of each curve requested in a CRV file.
+
+    Parameters
+    ----------
+    crv_file : Path
+        Dynawo curves input file.
+
+    Returns
+    -------
+    list
+        Column names, as Dynawo writes them (``<model>_<variable>``).
+    """
+    root = ET.parse(crv_file).getroot()
+    return [
+        f"{curve.get('model')}_{curve.get('variable')}"
+        for curve in root.iter()
+        if _local_name(curve) == "curve"
+    ]
+
+
+def write_synthetic_outputs(
+    output_dir: Path, curve_names: list[str], start: float, stop: float, time_step: float
+) -> None:
+    """Writes flat curves for every requested variable, an empty timeline and a log.
+
+    Parameters
+    ----------
+    output_dir : Path
+        Jobs output directory.
+    curve_names : list
+        CSV column names.
+    start : float
+        Simulation start time.
+    stop : float
+        Simulation stop time.
+    time_step : float
+        Time step of the curves.
+    """
+    (output_dir / "curves").mkdir(parents=True, exist_ok=True)
+    (output_dir / "timeLine").mkdir(parents=True, exist_ok=True)
+    (output_dir / "logs").mkdir(parents=True, exist_ok=True)
+
+    values = "".join("1.0;" for _ in curve_names)
+    steps = max(int(round((stop - start) / time_step)), 1)
+    with open(output_dir / "curves" / "curves.csv", "w") as file:
+        file.write("time;" + "".join(f"{name};" for name in curve_names) + "\n")
+        for i in range(steps + 1):
+            file.write(f"{start + i * (stop - start) / steps:.6f};{values}\n")
+
+    (output_dir / "timeLine" / "timeline.xml").write_text(_TIMELINE)
+    (output_dir / "logs" / "dynawo.log").write_text(
+        "INFO | stub Dynawo launcher: synthetic outputs\n"
+    )
+
+
+def store_recording(recording_dir: Path, output_dir: Path, label: str) -> None:
+    """Copies the outputs of a real simulation into recording_dir.
+
+    Parameters
+    ----------
+    recording_dir : Path
+        Directory of the recording.
+    output_dir : Path
+        Jobs output directory of the simulation.
+    label : str
+        Human-readable description of the recorded inputs.
+    """
+    recording_dir.mkdir(parents=True, exist_ok=True)
+    for output in OUTPUT_FILES:
+        if (output_dir / output).is_file():
+            shutil.copyfile(output_dir / output, recording_dir / Path(output).name)
+    (recording_dir / "label.txt").write_text(label + "\n")
+
+
+def replay_recording(recording_dir: Path, output_dir: Path) -> bool:
+    """Copies the recorded outputs into output_dir.
+
+    Parameters
+    ----------
+    recording_dir : Path
+        Directory of the recording.
+    output_dir : Path
+        Jobs output directory.
+
+    Returns
+    -------
+    bool
+        False if there is no recording.
+    """
+    if not (recording_dir / "curves.csv").is_file():
+        return False
+    for output in OUTPUT_FILES:
+        source = recording_dir / Path(output).name
+        if source.is_file():
+            (output_dir / output).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, output_dir / output)
+    return True
+
+
+def _label(inputs_path: Path) -> str:
+    # Producer/PCS/Benchmark/OC part of the working directory
+    return "/".join(inputs_path.resolve().parts[-4:])
+
+
+def simulate(jobs_file: Path) -> int:
+    """Produces the outputs of a simulation, as described in the module docstring.
+
+    Parameters
+    ----------
+    jobs_file : Path
+        Dynawo jobs file.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    inputs_path = jobs_file.parent
+    output_dir, crv_file, start, stop = read_jobs(jobs_file)
+    recordings = os.environ.get(RECORDINGS_ENV)
+    real_launcher = os.environ.get(REAL_LAUNCHER_ENV)
+
+    if recordings and real_launcher:
+        recording_dir = Path(recordings) / inputs_fingerprint(inputs_path)
+        status = subprocess.call([real_launcher, "jobs", jobs_file.name], cwd=inputs_path)
+        if status == 0:
+            store_recording(recording_dir, output_dir, _label(inputs_path))
+        return status
+
+    time.sleep(float(os.environ.get(DELAY_ENV, 0.0)))
+    if recordings:
+        fingerprint = inputs_fingerprint(inputs_path)
+        if replay_recording(Path(recordings) / fingerprint, output_dir):
+            return 0
+        with open(Path(recordings) / "missing.txt", "a") as file:
+            file.write(f"{fingerprint} {_label(inputs_path)}\n")
+
+    curve_names = read_curve_names(crv_file) if crv_file and crv_file.is_file() else []
+    time_step = float(os.environ.get(TIME_STEP_ENV, 0.002))
+    write_synthetic_outputs(output_dir, curve_names, start, stop, time_step)
+    return 0
+
+
+def precompile(args: list[str]) -> int:
+    """Creates the placeholder files of a precompilation command.
+
+    Parameters
+    ----------
+    args : list
+        Arguments following ``jobs``.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    if "--output-dir" in args:
+        output_dir = Path(args[args.index("--output-dir") + 1])
+        output_dir.mkdir(parents=True, exist_ok=True)
+    if "--output-file" in args:
+        Path(args[args.index("--output-file") + 1]).write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n<model/>\n'
+        )
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) >= 2 and argv[0] == "jobs" and argv[1].endswith(".jobs"):
+        status = simulate(Path.cwd() / argv[1])
+        if status == 0:
+            # DyCoV checks the launcher's stderr for this word
+            print("Dynawo execution succeeded (stub)", file=sys.stderr)
+        return status
+    if argv and argv[0] == "jobs":
+        return precompile(argv[1:])
+    print("DynaWo stub launcher (dycov offline benchmarks)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))